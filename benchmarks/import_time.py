@@ -0,0 +1,95 @@
+"""Import-time regression check, based on `python -X importtime` output.
+
+Checks that the startup imports (main.py, the widget manifests) and each
+backend module do not pull in heavy third-party modules before they are
+needed, and prints the slowest imports of each. Exits non-zero on a
+violation or when the startup imports exceed --budget-ms.
+
+    uv run python benchmarks/import_time.py [--budget-ms 400] [--top 8]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+HEAVY = ("psutil", "PIL", "winrt", "dotenv", "winotify", "win32gui", "webbrowser")
+
+# Code to import -> heavy modules it must not import
+CHECKS = {
+    "import main; from widgets.registry import load_manifests; load_manifests()": (
+        HEAVY
+    ),
+    # Needed only when an icon is extracted or a toast is shown
+    "import widgets.launcher.launcher": ("PIL", "win32gui", "win32ui"),
+    "import widgets.pomodoro.pomodoro": ("winotify",),
+    "import widgets.news.news": ("webbrowser",),
+}
+
+# "import time: self [us] | cumulative | imported package"
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def import_times(code: str) -> list[tuple[str, int, int, int]]:
+    """(module, depth, self us, cumulative us) for each module code imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    modules = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            depth = (len(indent) - 1) // 2
+            modules.append((name, depth, int(self_us), int(cumulative_us)))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=400.0)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    # Interpreter startup (site, encodings...) is not ours to count
+    baseline = {name for name, *_ in import_times("pass")}
+    failures = []
+    for i, (code, forbidden) in enumerate(CHECKS.items()):
+        try:
+            modules = import_times(code)
+        except RuntimeError as e:
+            failures.append(f"{code}: {e}")
+            continue
+        modules = [m for m in modules if m[0] not in baseline]
+        total_ms = sum(cum for _, depth, _, cum in modules if depth == 0) / 1000
+        print(f"{code}\n  {len(modules)} modules, {total_ms:.1f}ms")
+        for name, _, _, cum in sorted(modules, key=lambda m: -m[3])[: args.top]:
+            print(f"  {cum / 1000:8.1f}ms  {name}")
+
+        names = {name for name, *_ in modules}
+        pulled = [m for m in forbidden if m in names]
+        if pulled:
+            failures.append(f"{code}: imports {', '.join(pulled)}")
+        if i == 0 and total_ms > args.budget_ms:
+            failures.append(
+                f"{code}: {total_ms:.1f}ms over the {args.budget_ms:.0f}ms budget"
+            )
+
+    if failures:
+        print("\nFAILED")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
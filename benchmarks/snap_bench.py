@@ -0,0 +1,117 @@
+"""Microbenchmark: per-call latency of snap queries with many widgets.
+
+Compares SnapIndex against the previous linear scan over the registry and
+checks that both pick a snap target at the same distance.
+
+    uv run python benchmarks/snap_bench.py [--widgets 60] [--calls 20000]
+"""
+
+import argparse
+import importlib.util
+import random
+import time
+from pathlib import Path
+
+# Load the module by path so the benchmark does not pull in PySide6 backends
+_spec = importlib.util.spec_from_file_location(
+    "snap_index", Path(__file__).parent.parent / "widgets" / "snap_index.py"
+)
+snap_index = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(snap_index)
+
+AREA = (0, 0, 2560, 1440)
+
+
+def linear_snap_position(registry, name, x, y, w, h, margin, threshold):
+    """The pre-index algorithm from SettingsBackend.getSnapPosition."""
+    al, at = AREA[0] + margin, AREA[1] + margin
+    ar, ab = AREA[2] - margin, AREA[3] - margin
+    snap_x, snap_y = x, y
+    best_dx, best_dy = threshold + 1, threshold + 1
+    for other_name, (ox, oy, ow, oh) in registry.items():
+        if other_name == name:
+            continue
+        for delta, candidate in [
+            ((x + w) - (ox - margin), ox - margin - w),
+            (x - (ox + ow + margin), ox + ow + margin),
+            (x - ox, ox),
+            ((x + w) - (ox + ow), ox + ow - w),
+        ]:
+            if abs(delta) < best_dx:
+                best_dx, snap_x = abs(delta), candidate
+        for delta, candidate in [
+            ((y + h) - (oy - margin), oy - margin - h),
+            (y - (oy + oh + margin), oy + oh + margin),
+            (y - oy, oy),
+            ((y + h) - (oy + oh), oy + oh - h),
+        ]:
+            if abs(delta) < best_dy:
+                best_dy, snap_y = abs(delta), candidate
+    for delta, candidate in [(x - al, al), ((x + w) - ar, ar - w)]:
+        if abs(delta) < best_dx:
+            best_dx, snap_x = abs(delta), candidate
+    for delta, candidate in [(y - at, at), ((y + h) - ab, ab - h)]:
+        if abs(delta) < best_dy:
+            best_dy, snap_y = abs(delta), candidate
+    return snap_x, snap_y
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--widgets", type=int, default=60)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--margin", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    index = snap_index.SnapIndex(margin=args.margin)
+    registry = {}
+    for i in range(args.widgets):
+        rect = (
+            rng.randrange(0, 2300),
+            rng.randrange(0, 1200),
+            rng.randrange(150, 500),
+            rng.randrange(100, 400),
+        )
+        registry[f"w{i}"] = rect
+        index.update(f"w{i}", *rect)
+
+    queries = [
+        ("w0", rng.randrange(0, 2400), rng.randrange(0, 1300), 300, 200)
+        for _ in range(args.calls)
+    ]
+    threshold = index.threshold
+
+    mismatches = 0
+    for name, x, y, w, h in queries[:2000]:
+        a = linear_snap_position(registry, name, x, y, w, h, args.margin, threshold)
+        b = index.snap_position(name, x, y, w, h, AREA)
+        # Ties may resolve to different targets; compare snap distances
+        if abs(a[0] - x) != abs(b[0] - x) or abs(a[1] - y) != abs(b[1] - y):
+            mismatches += 1
+
+    start = time.perf_counter()
+    for name, x, y, w, h in queries:
+        linear_snap_position(registry, name, x, y, w, h, args.margin, threshold)
+    linear_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    start = time.perf_counter()
+    for name, x, y, w, h in queries:
+        index.snap_position(name, x, y, w, h, AREA)
+    index_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    start = time.perf_counter()
+    for name, x, y, w, h in queries:
+        index.update("w0", x, y, w, h)
+    update_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    print(f"widgets: {args.widgets}, calls: {args.calls}")
+    print(f"linear scan     : {linear_us:8.2f} us/call")
+    print(f"SnapIndex query : {index_us:8.2f} us/call ({linear_us / index_us:.1f}x)")
+    print(f"SnapIndex update: {update_us:8.2f} us/call")
+    print(f"distance mismatches: {mismatches}/2000")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Microbenchmark: ThemeProvider getter cost during full theme switches.
+
+Cycles through default_themes/ and, after each switch, reads every theme
+property once per widget window (as each window's bindings re-evaluate).
+Compares the cached getters against a provider that builds a QColor from
+the hex string on every read, which is what the getters did before.
+
+    uv run python benchmarks/theme_bench.py [--windows 12] [--rounds 20]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from PySide6.QtGui import QColor  # noqa: E402
+
+from widgets.theme_constants import DEFAULT_THEME  # noqa: E402
+from widgets.theme_provider import ThemeProvider  # noqa: E402
+
+COLOR_NAMES = [k for k, v in DEFAULT_THEME.items() if isinstance(v, str)]
+INT_NAMES = [k for k, v in DEFAULT_THEME.items() if isinstance(v, int)]
+
+
+class UncachedThemeProvider(ThemeProvider):
+    """The previous getters: parse on every read."""
+
+    def _color(self, name):
+        return QColor(self._theme.get(name, DEFAULT_THEME[name]))
+
+    def _int(self, name):
+        return self._theme.get(name, DEFAULT_THEME[name])
+
+
+def read_all(provider, windows):
+    for _ in range(windows):
+        for name in COLOR_NAMES:
+            getattr(provider, name)
+        for name in INT_NAMES:
+            getattr(provider, name)
+
+
+def switch_and_read(provider, path, windows) -> float:
+    """Apply a theme file, then time the property reads it triggers."""
+    provider.loadThemeFromPath(str(path))
+    start = time.perf_counter()
+    read_all(provider, windows)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--windows", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    theme_files = sorted((ROOT / "default_themes").glob("*.json"))
+    with tempfile.TemporaryDirectory() as tmp:
+        cached_provider = ThemeProvider(Path(tmp) / "cached.json")
+        uncached_provider = UncachedThemeProvider(Path(tmp) / "uncached.json")
+        cached = uncached = 0.0
+        switches = 0
+        for _ in range(args.rounds):
+            for path in theme_files:
+                switches += 1
+                uncached += switch_and_read(uncached_provider, path, args.windows)
+                cached += switch_and_read(cached_provider, path, args.windows)
+
+    reads = args.windows * (len(COLOR_NAMES) + len(INT_NAMES))
+    print(f"themes: {len(theme_files)}, switches: {switches}, windows: {args.windows}")
+    print(f"property reads per switch: {reads}")
+    print(f"QColor per read : {uncached / switches * 1e6:8.1f} us/switch")
+    print(
+        f"cached getters  : {cached / switches * 1e6:8.1f} us/switch "
+        f"({uncached / cached:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
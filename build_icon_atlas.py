@@ -0,0 +1,41 @@
+"""Rebuild data/icon_atlas/ from the icons referenced in qml/ and widgets/.
+
+main.py builds the atlas after the first frame when it is missing or out of
+date; this script is for rebuilding it by hand, e.g. for high-DPI screens:
+
+    uv run python build_icon_atlas.py [--dpr 1 1.5 2]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from PySide6.QtGui import QGuiApplication
+
+from widgets.icon_atlas import (
+    DEFAULT_SIZES,
+    build_atlas,
+    pixel_sizes,
+    referenced_icons,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dpr", type=float, nargs="+", default=[1.0])
+    args = parser.parse_args()
+
+    app = QGuiApplication(sys.argv)  # noqa: F841 - needed for QPainter
+    project_root = Path(__file__).parent
+    icons_dir = project_root / "icons"
+    names = referenced_icons(project_root, icons_dir)
+    pixels = pixel_sizes(DEFAULT_SIZES, args.dpr)
+    index = build_atlas(icons_dir, names, pixels, project_root / "data" / "icon_atlas")
+    print(
+        f"Built icon atlas: {len(index['icons'])} icons at "
+        f"{', '.join(index['sizes'])} px"
+    )
+
+
+if __name__ == "__main__":
+    main()
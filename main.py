@@ -1,45 +1,61 @@
 import os
 import sys
+import threading
 import time
 import tomllib
 from pathlib import Path
 
+from widgets.startup_trace import tracer
+
+# Record every import from here on (PySide6, backends) in the startup trace
+tracer.trace_imports()
+
 # Set Qt Quick Controls style before creating QApplication
 os.environ["QT_QUICK_CONTROLS_STYLE"] = "Basic"
 
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QFileSystemWatcher, QTimer, QUrl
 from PySide6.QtWidgets import QApplication
 from PySide6.QtQml import QQmlApplicationEngine
 
-_start_time = time.time()
-
 
 def debug_timing(label):
-    elapsed = (time.time() - _start_time) * 1000
-    print(f"[{elapsed:7.1f}ms] {label}")
+    tracer.mark(label)
 
 
 from widgets import (
-    BatteryBackend,
     HotkeyBackend,
     HubBackend,
-    LauncherBackend,
-    MediaBackend,
-    NetworkMonitorBackend,
-    NewsBackend,
-    NotesBackend,
-    PomodoroBackend,
+    IconAtlas,
     SettingsBackend,
-    SystemMonitorBackend,
+    ThemeCatalog,
     ThemeProvider,
-    TodoBackend,
-    WeatherBackend,
+    ThemeWatcher,
+    TintedIconProvider,
+    WidgetHost,
 )
+from widgets.icon_atlas import (
+    DEFAULT_SIZES,
+    build_atlas,
+    pixel_sizes,
+    referenced_icons,
+)
+from widgets.qml_cache import check_cache, precompile_later, use_cache_dir
+from widgets.registry import load_manifests, settings_key
+
+CONFIG_PATH = Path(__file__).parent / "enabled_widgets.toml"
+CONFIG_RELOAD_DEBOUNCE_MS = 300
+# Seconds a widget stays hidden before it is unloaded (0 = never)
+DEFAULT_UNLOAD_HIDDEN_AFTER = 600
+# Written this long after the first frame, so later windows' frames are in it
+TRACE_PATH = Path(__file__).parent / "data" / "startup_trace.json"
+TRACE_SAVE_DELAY_MS = 3000
+# Compiled QML; filled by precompile_qml.py and topped up after startup
+QML_CACHE_DIR = Path(__file__).parent / "data" / "qml_cache"
 
 
 def load_widget_config() -> dict:
     """Load enabled_widgets.toml config, creating it with defaults if not found."""
-    config_path = Path(__file__).parent / "enabled_widgets.toml"
+    config_path = CONFIG_PATH
     defaults = {
         "widgets": {
             "weather": True,
@@ -53,7 +69,12 @@ def load_widget_config() -> dict:
             "network_monitor": True,
             "battery": True,
             "news": True,
-        }
+        },
+        "settings": {
+            "storage": "json",
+            "watch_themes": False,
+            "unload_hidden_after": DEFAULT_UNLOAD_HIDDEN_AFTER,
+        },
     }
 
     if config_path.exists():
@@ -67,6 +88,7 @@ def load_widget_config() -> dict:
     # File doesn't exist - create it with all widgets enabled
     default_content = """# Widget Configuration
 # Set to false to completely disable a widget (won't be loaded, saves memory)
+# Changes are picked up while the app is running
 # The Hub widget is always enabled and cannot be disabled.
 
 [widgets]
@@ -81,6 +103,18 @@ system_monitor = true
 network_monitor = true
 battery = true
 news = true
+
+[settings]
+# Storage engine for widget settings:
+#   "json"    - rewrite data/widgets/<name>.json on every change
+#   "journal" - append changes to data/widgets/<name>.journal, compacted periodically
+#   "sqlite"  - one row per key in data/settings.db (imports the JSON files once)
+storage = "json"
+# Reload data/theme.json and default_themes/*.json when they change on disk
+watch_themes = false
+# Unload a widget's window and backend after it has been hidden this many
+# seconds (0 = keep hidden widgets loaded); it is rebuilt when shown again
+unload_hidden_after = 600
 """
     try:
         config_path.write_text(default_content)
@@ -94,15 +128,19 @@ news = true
 def main():
     debug_timing("main() started")
 
-    config = load_widget_config()
+    with tracer.span("load_widget_config"):
+        config = load_widget_config()
     enabled = config.get("widgets", {})
     debug_timing("Config loaded")
 
-    app = QApplication(sys.argv)
+    qml_cache_dir = use_cache_dir(QML_CACHE_DIR)
+    with tracer.span("QApplication"):
+        app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     debug_timing("QApplication created")
 
-    engine = QQmlApplicationEngine()
+    with tracer.span("QQmlApplicationEngine"):
+        engine = QQmlApplicationEngine()
     engine.quit.connect(app.quit)
     debug_timing("QQmlApplicationEngine created")
 
@@ -111,86 +149,77 @@ def main():
     data_dir = Path(__file__).parent / "data"
 
     engine.addImportPath(qml_dir)
+    with tracer.span("QML cache check", "qml"):
+        qml_cache = check_cache(qml_dir, qml_cache_dir)
+    tracer.instant("QML cache", "qml", **qml_cache)
+    debug_timing(
+        f"QML cache: {len(qml_cache['hits'])} hits, "
+        f"{len(qml_cache['misses'])} misses"
+    )
     engine.rootContext().setContextProperty(
         "iconsPath", QUrl.fromLocalFile(str(icons_dir) + "/")
     )
     engine.rootContext().setContextProperty("enabledWidgets", enabled)
 
-    settings = SettingsBackend()
+    storage = config.get("settings", {}).get("storage", "json")
+    with tracer.span("SettingsBackend", "backend"):
+        settings = SettingsBackend(storage=storage)
     engine.rootContext().setContextProperty("settingsBackend", settings)
     debug_timing("SettingsBackend initialized")
 
-    theme_provider = ThemeProvider(data_dir / "theme.json")
+    with tracer.span("ThemeProvider", "backend"):
+        theme_provider = ThemeProvider(data_dir / "theme.json", store=settings.store)
     engine.rootContext().setContextProperty("themeProvider", theme_provider)
     debug_timing("ThemeProvider initialized")
 
-    hub = HubBackend(settings_backend=settings)
+    theme_catalog = ThemeCatalog(
+        theme_provider, Path(__file__).parent / "default_themes"
+    )
+    engine.rootContext().setContextProperty("themeCatalog", theme_catalog)
+
+    icon_provider = TintedIconProvider(icons_dir)
+    atlas_dir = data_dir / "icon_atlas"
+    icon_provider.set_atlas(IconAtlas.load(atlas_dir))
+    engine.addImageProvider("tinted", icon_provider)
+    theme_provider.themeChanged.connect(icon_provider.clear)
+
+    theme_watcher = None
+    if config.get("settings", {}).get("watch_themes", False):
+        theme_watcher = ThemeWatcher(
+            theme_provider,
+            settings.store.theme_file(),
+            catalog=theme_catalog,
+            presets_dir=Path(__file__).parent / "default_themes",
+        )
+        theme_watcher.start()
+
+    with tracer.span("HubBackend", "backend"):
+        hub = HubBackend(settings_backend=settings)
     engine.rootContext().setContextProperty("hubBackend", hub)
     debug_timing("HubBackend initialized")
 
-    weather = None
-    if enabled.get("weather", True):
-        weather = WeatherBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("weatherBackend", weather)
-        debug_timing("WeatherBackend initialized")
-
-    media = None
-    if enabled.get("media", True):
-        media = MediaBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("mediaBackend", media)
-        debug_timing("MediaBackend initialized")
-
-    todo = None
-    if enabled.get("todo", True):
-        todo = TodoBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("todoBackend", todo)
-        debug_timing("TodoBackend initialized")
-
-    notes = None
-    if enabled.get("notes", True):
-        notes = NotesBackend(settings_backend=settings, theme_provider=theme_provider)
-        engine.rootContext().setContextProperty("notesBackend", notes)
-        debug_timing("NotesBackend initialized")
-
-    pomodoro = None
-    if enabled.get("pomodoro", True):
-        pomodoro = PomodoroBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("pomodoroBackend", pomodoro)
-        debug_timing("PomodoroBackend initialized")
-
-    launcher = None
-    if enabled.get("launcher", True):
-        launcher = LauncherBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("launcherBackend", launcher)
-        debug_timing("LauncherBackend initialized")
-
-    system_monitor = None
-    if enabled.get("system_monitor", True):
-        system_monitor = SystemMonitorBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("systemMonitorBackend", system_monitor)
-        debug_timing("SystemMonitorBackend initialized")
-
-    network_monitor = None
-    if enabled.get("network_monitor", True):
-        network_monitor = NetworkMonitorBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty(
-            "networkMonitorBackend", network_monitor
+    # Widgets hidden in the layout are only created when first shown
+    with tracer.span("load_manifests"):
+        manifests = load_manifests()
+    host = WidgetHost(
+        engine, hub, qml_dir, settings, services={"theme_provider": theme_provider}
+    )
+    engine.rootContext().setContextProperty("widgetHost", host)
+    # Always loaded, and first so it is the first window on screen
+    host.register({"name": "hub", "qml": "Hub.qml"})
+    for manifest in manifests:
+        if enabled.get(manifest["name"], True):
+            host.register(manifest)
+    host.set_idle_unload(
+        config.get("settings", {}).get(
+            "unload_hidden_after", DEFAULT_UNLOAD_HIDDEN_AFTER
         )
-        debug_timing("NetworkMonitorBackend initialized")
-
-    battery = None
-    if enabled.get("battery", True):
-        battery = BatteryBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("batteryBackend", battery)
-        debug_timing("BatteryBackend initialized")
-
-    news = None
-    if enabled.get("news", True):
-        news = NewsBackend(settings_backend=settings)
-        engine.rootContext().setContextProperty("newsBackend", news)
-        debug_timing("NewsBackend initialized")
+    )
+    host.widgetUnloaded.connect(hub.record_unload)
+    debug_timing(f"{len(manifests)} widget manifests loaded")
 
-    hotkey = HotkeyBackend(settings_backend=settings, hub_backend=hub)
+    with tracer.span("HotkeyBackend", "backend"):
+        hotkey = HotkeyBackend(settings_backend=settings, hub_backend=hub)
     engine.rootContext().setContextProperty("hotkeyBackend", hotkey)
     debug_timing("HotkeyBackend initialized")
 
@@ -199,66 +228,126 @@ def main():
 
     hub.exitRequested.connect(app.quit)
     app.aboutToQuit.connect(hotkey.cleanup)
-    if media:
-        app.aboutToQuit.connect(media.cleanup)
-    if system_monitor:
-        app.aboutToQuit.connect(system_monitor.cleanup)
-    if network_monitor:
-        app.aboutToQuit.connect(network_monitor.cleanup)
-    if battery:
-        app.aboutToQuit.connect(battery.cleanup)
-
-    engine.load(qml_dir / "Hub.qml")
-    debug_timing("Hub.qml loaded")
-
-    if enabled.get("weather", True):
-        engine.load(qml_dir / "Weather.qml")
-        debug_timing("Weather.qml loaded")
-
-    if enabled.get("media", True):
-        engine.load(qml_dir / "Media.qml")
-        debug_timing("Media.qml loaded")
-
-    if enabled.get("general_settings", True):
-        engine.load(qml_dir / "GeneralSettings.qml")
-        debug_timing("GeneralSettings.qml loaded")
-
-    if enabled.get("todo", True):
-        engine.load(qml_dir / "Todo.qml")
-        debug_timing("Todo.qml loaded")
-
-    if enabled.get("notes", True):
-        engine.load(qml_dir / "Notes.qml")
-        debug_timing("Notes.qml loaded")
-
-    if enabled.get("pomodoro", True):
-        engine.load(qml_dir / "Pomodoro.qml")
-        debug_timing("Pomodoro.qml loaded")
-
-    if enabled.get("launcher", True):
-        engine.load(qml_dir / "Launcher.qml")
-        debug_timing("Launcher.qml loaded")
-
-    if enabled.get("system_monitor", True):
-        engine.load(qml_dir / "SystemMonitor.qml")
-        debug_timing("SystemMonitor.qml loaded")
-
-    if enabled.get("network_monitor", True):
-        engine.load(qml_dir / "NetworkMonitor.qml")
-        debug_timing("NetworkMonitor.qml loaded")
-
-    if enabled.get("battery", True):
-        engine.load(qml_dir / "Battery.qml")
-        debug_timing("Battery.qml loaded")
-
-    if enabled.get("news", True):
-        engine.load(qml_dir / "News.qml")
-        debug_timing("News.qml loaded")
-
+    app.aboutToQuit.connect(host.cleanup)
+    if theme_watcher:
+        app.aboutToQuit.connect(theme_watcher.stop)
+    # Flush last so writes made by the cleanups above also reach disk
+    app.aboutToQuit.connect(settings.flush)
+
+    # Backends first, so their context properties exist when Main.qml's
+    # Loaders start compiling the windows in the background
+    deferred_widgets = host.start()
+    debug_timing(f"{deferred_widgets} hidden widgets deferred until shown")
+
+    with tracer.span("Main.qml load", "qml"):
+        engine.load(qml_dir / "Main.qml")
     if not engine.rootObjects():
         sys.exit(-1)
 
-    debug_timing("All QML loaded, starting event loop")
+    debug_timing("Main.qml loaded, starting event loop")
+    stats = settings.getConfigLoadStats()
+    debug_timing(
+        f"Widget configs: {stats['loaded']} parsed on demand "
+        f"({stats['load_ms']:.1f}ms), {stats['deferred']} deferred"
+    )
+
+    # Parse the remaining enabled widgets' configs and the theme presets once
+    # the first frame is up
+    settings.prefetchFinished.connect(
+        lambda s: debug_timing(
+            f"Prefetched {s['prefetched']} widget configs off the UI thread "
+            f"({s['prefetch_ms']:.1f}ms), {s['deferred']} never loaded"
+        )
+    )
+    prefetch_names = ["hub"] + [
+        settings_key(m) for m in manifests if enabled.get(m["name"], True)
+    ]
+    prefetch_started = False
+    dprs = {screen.devicePixelRatio() for screen in app.screens()} or {1.0}
+
+    def refresh_icon_atlas():
+        # First run, new icons or a new screen scale: rebuild for next start
+        names = referenced_icons(Path(__file__).parent, icons_dir)
+        pixels = pixel_sizes(DEFAULT_SIZES, dprs)
+        atlas = IconAtlas.load(atlas_dir)
+        if atlas is None or not atlas.covers(names, pixels):
+            start = time.perf_counter()
+            build_atlas(icons_dir, names, pixels, atlas_dir)
+            icon_provider.set_atlas(IconAtlas.load(atlas_dir))
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"Built icon atlas: {len(names)} icons ({elapsed:.1f}ms)")
+
+    def save_trace():
+        tracer.stop_imports()
+        tracer.save(TRACE_PATH)
+        debug_timing(f"Startup trace written to {TRACE_PATH}")
+
+    def report_precompiled(result):
+        for name, error in result["errors"].items():
+            print(f"Error compiling {name}: {error}")
+        debug_timing(f"Precompiled {len(result['compiled'])} QML cache misses")
+
+    def start_prefetch():
+        nonlocal prefetch_started
+        if not prefetch_started:
+            prefetch_started = True
+            QTimer.singleShot(TRACE_SAVE_DELAY_MS, save_trace)
+            settings.prefetchWidgetConfigs(prefetch_names)
+            theme_catalog.load()
+            threading.Thread(
+                target=refresh_icon_atlas, name="icon-atlas", daemon=True
+            ).start()
+            if qml_cache["misses"]:
+                precompile_later(
+                    engine,
+                    qml_dir,
+                    qml_cache_dir,
+                    qml_cache["misses"],
+                    done=report_precompiled,
+                )
+
+    def on_window_loaded(name, window):
+        # Normally the Hub, which is loaded first
+        host.windowLoaded.disconnect(on_window_loaded)
+        if not window.isVisible():
+            QTimer.singleShot(0, start_prefetch)
+            return
+
+        def on_first_frame():
+            window.frameSwapped.disconnect(on_first_frame)
+            start_prefetch()
+
+        window.frameSwapped.connect(on_first_frame)
+
+    host.windowLoaded.connect(on_window_loaded)
+
+    # Load or unload widgets when enabled_widgets.toml is edited
+    config_watcher = QFileSystemWatcher([str(CONFIG_PATH)])
+    reload_timer = QTimer()
+    reload_timer.setSingleShot(True)
+    reload_timer.setInterval(CONFIG_RELOAD_DEBOUNCE_MS)
+
+    def reload_widget_config():
+        # Editors that save by replacing the file drop it from the watch list
+        if str(CONFIG_PATH) not in config_watcher.files() and CONFIG_PATH.exists():
+            config_watcher.addPath(str(CONFIG_PATH))
+        try:
+            with open(CONFIG_PATH, "rb") as f:
+                flags = tomllib.load(f).get("widgets", {})
+        except (tomllib.TOMLDecodeError, IOError) as e:
+            print(f"Error reloading enabled_widgets.toml: {e}")
+            return
+        if flags == enabled:
+            return
+        enabled.clear()
+        enabled.update(flags)
+        engine.rootContext().setContextProperty("enabledWidgets", dict(enabled))
+        host.set_enabled(manifests, enabled)
+        debug_timing("enabled_widgets.toml reloaded")
+
+    config_watcher.fileChanged.connect(lambda path: reload_timer.start())
+    reload_timer.timeout.connect(reload_widget_config)
+
     c = app.exec()
     print(f"Quitting with exit code {c}")
     sys.exit(c)
@@ -0,0 +1,43 @@
+"""Compile every QML file into data/qml_cache/ ahead of the first launch.
+
+Run once after installing or updating (Qt keys the cache to each source
+file's timestamp, so a cache built on another checkout does not carry
+over); main.py then loads compiled units instead of parsing QML:
+
+    uv run python precompile_qml.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from widgets.qml_cache import check_cache, precompile, use_cache_dir
+
+os.environ["QT_QUICK_CONTROLS_STYLE"] = "Basic"
+
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtQml import QQmlEngine
+
+
+def main():
+    project_root = Path(__file__).parent
+    qml_dir = project_root / "qml"
+    cache_dir = use_cache_dir(project_root / "data" / "qml_cache")
+
+    app = QGuiApplication(sys.argv)  # noqa: F841 - needed by the QML engine
+    engine = QQmlEngine()
+    engine.addImportPath(qml_dir)
+    result = precompile(engine, qml_dir, cache_dir)
+    for name, error in result["errors"].items():
+        print(f"Error compiling {name}: {error}")
+
+    status = check_cache(qml_dir, cache_dir)
+    print(
+        f"Precompiled {len(result['compiled'])} QML files into {cache_dir} "
+        f"({len(status['misses'])} not cached)"
+    )
+    sys.exit(1 if result["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
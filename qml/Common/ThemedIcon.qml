@@ -1,5 +1,5 @@
 import QtQuick 2.15
-import Qt5Compat.GraphicalEffects
+import QtQuick.Window 2.15
 import Common 1.0
 
 Item {
@@ -12,15 +12,15 @@ Item {
     implicitWidth: size
     implicitHeight: size
 
+    // Rendered and tinted once per (icon, size, color, dpr) by TintedIconProvider
     Image {
-        id: sourceImage
         anchors.fill: parent
-        source: iconName ? iconsPath + iconName : ""
-        sourceSize: Qt.size(size, size)
+        source: iconName
+            ? "image://tinted/" + iconName
+              + "?size=" + size
+              + "&color=" + root.customColor.toString().substring(1)
+              + "&dpr=" + Screen.devicePixelRatio
+            : ""
         fillMode: Image.PreserveAspectFit
-        layer.enabled: true
-        layer.effect: ColorOverlay {
-            color: root.customColor
-        }
     }
 }
@@ -121,17 +121,128 @@ Window {
         }
     }
 
+    // Snap-target table from settingsBackend.beginDrag(), valid for one
+    // drag or resize. Snaps are resolved here so mouse moves stay in QML.
+    property var _snapTable: null
+
+    function beginSnapSession() {
+        if (!_snapTable) {
+            _snapTable = settingsBackend.beginDrag(geometryKey)
+        }
+    }
+
+    function endSnapSession() {
+        settingsBackend.endDrag(geometryKey, widgetWindow.x, widgetWindow.y, widgetWindow.width, widgetWindow.height)
+        _snapTable = null
+    }
+
+    // Closest target to value in a sorted list, or null if beyond threshold
+    function nearestTarget(targets, value, threshold) {
+        var lo = 0
+        var hi = targets.length
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1
+            if (targets[mid] < value) lo = mid + 1
+            else hi = mid
+        }
+        var best = null
+        var bestDist = threshold + 1
+        if (lo > 0 && value - targets[lo - 1] < bestDist) {
+            best = targets[lo - 1]
+            bestDist = value - best
+        }
+        if (lo < targets.length && targets[lo] - value < bestDist) {
+            best = targets[lo]
+        }
+        return best
+    }
+
+    function snapAxis(start, size, nearTargets, farTargets, areaStart, areaEnd, threshold) {
+        var snapped = start
+        var best = threshold + 1
+        var t = nearestTarget(nearTargets, start, threshold)
+        if (t !== null && Math.abs(start - t) < best) {
+            best = Math.abs(start - t)
+            snapped = t
+        }
+        t = nearestTarget(farTargets, start + size, threshold)
+        if (t !== null && Math.abs(start + size - t) < best) {
+            best = Math.abs(start + size - t)
+            snapped = t - size
+        }
+        if (Math.abs(start - areaStart) < best) {
+            best = Math.abs(start - areaStart)
+            snapped = areaStart
+        }
+        if (Math.abs(start + size - areaEnd) < best) {
+            snapped = areaEnd - size
+        }
+        return snapped
+    }
+
+    function snapExtent(start, size, farTargets, areaEnd, threshold) {
+        var snapped = size
+        var best = threshold + 1
+        var t = nearestTarget(farTargets, start + size, threshold)
+        if (t !== null && Math.abs(start + size - t) < best) {
+            best = Math.abs(start + size - t)
+            snapped = t - start
+        }
+        if (Math.abs(start + size - areaEnd) < best) {
+            snapped = areaEnd - start
+        }
+        return snapped
+    }
+
+    // Work area of the screen containing the window centre (multi-monitor)
+    function areaFor(table, x, y, w, h) {
+        var cx = x + w / 2
+        var cy = y + h / 2
+        var areas = table.areas
+        var best = areas[0]
+        var bestDist = Infinity
+        for (var i = 0; i < areas.length; i++) {
+            var a = areas[i]
+            var dx = Math.max(a[0] - cx, 0, cx - a[2])
+            var dy = Math.max(a[1] - cy, 0, cy - a[3])
+            var dist = dx * dx + dy * dy
+            if (dist === 0) return a
+            if (dist < bestDist) {
+                bestDist = dist
+                best = a
+            }
+        }
+        return best
+    }
+
     function handleDragMoved(dx, dy) {
+        beginSnapSession()
         var newX = widgetWindow.x + dx
         var newY = widgetWindow.y + dy
-        var snapped = settingsBackend.getSnapPosition(geometryKey, newX, newY, widgetWindow.width, widgetWindow.height)
-        widgetWindow.x = snapped[0]
-        widgetWindow.y = snapped[1]
-        settingsBackend.updatePosition(geometryKey, widgetWindow.x, widgetWindow.y, widgetWindow.width, widgetWindow.height)
+        var table = _snapTable
+        if (table && table.enabled) {
+            var area = areaFor(table, newX, newY, widgetWindow.width, widgetWindow.height)
+            newX = snapAxis(newX, widgetWindow.width, table.left, table.right, area[0], area[2], table.threshold)
+            newY = snapAxis(newY, widgetWindow.height, table.top, table.bottom, area[1], area[3], table.threshold)
+        }
+        widgetWindow.x = newX
+        widgetWindow.y = newY
     }
 
     function handleDragEnded() {
-        settingsBackend.setWidgetGeometry(geometryKey, widgetWindow.x, widgetWindow.y, widgetWindow.width, widgetWindow.height)
+        endSnapSession()
+    }
+
+    function handleResizeMoved(newW, newH) {
+        beginSnapSession()
+        var table = _snapTable
+        if (table && table.enabled) {
+            var area = areaFor(table, widgetWindow.x, widgetWindow.y, newW, newH)
+            newW = snapExtent(widgetWindow.x, newW, table.right, area[2], table.threshold)
+            newH = snapExtent(widgetWindow.y, newH, table.bottom, area[3], table.threshold)
+        }
+        widgetWindow.width = newW
+        widgetWindow.height = newH
     }
 
     minimumWidth: minResizeWidth
@@ -389,13 +500,10 @@ Window {
                 var g = mapToGlobal(mouse.x, mouse.y)
                 var newW = Math.max(widgetWindow.minResizeWidth, startW + (g.x - startGlobalX))
                 var newH = Math.max(widgetWindow.minResizeHeight, startH + (g.y - startGlobalY))
-                var snapped = settingsBackend.getSnapSize(geometryKey, widgetWindow.x, widgetWindow.y, newW, newH)
-                widgetWindow.width = snapped[0]
-                widgetWindow.height = snapped[1]
-                settingsBackend.updatePosition(geometryKey, widgetWindow.x, widgetWindow.y, widgetWindow.width, widgetWindow.height)
+                widgetWindow.handleResizeMoved(newW, newH)
             }
             onReleased: {
-                settingsBackend.setWidgetGeometry(geometryKey, widgetWindow.x, widgetWindow.y, widgetWindow.width, widgetWindow.height)
+                widgetWindow.endSnapSession()
             }
         }
     }
@@ -72,6 +72,76 @@ WidgetWindow {
                     width: parent.parent.width - Theme.padding * 2
                     spacing: Theme.spacing
 
+                    // Presets section
+                    Text {
+                        text: "Presets"
+                        color: Theme.textPrimary
+                        font.pixelSize: Theme.fontSizeLarge
+                        font.weight: Font.Medium
+                        visible: themeCatalog && themeCatalog.ready
+                    }
+
+                    // Hover to preview, click to apply
+                    Flow {
+                        Layout.fillWidth: true
+                        spacing: Theme.spacing / 2
+                        visible: themeCatalog && themeCatalog.ready
+
+                        Repeater {
+                            model: themeCatalog
+
+                            Rectangle {
+                                width: (parent.width - Theme.spacing / 2) / 2
+                                height: 40
+                                radius: Theme.borderRadius / 2
+                                color: Theme.surfaceColor
+                                border.width: presetMouse.containsMouse ? 1 : 0
+                                border.color: Theme.accentColor
+
+                                Column {
+                                    anchors.fill: parent
+                                    anchors.margins: 6
+                                    spacing: 4
+
+                                    Row {
+                                        spacing: 2
+                                        Repeater {
+                                            model: swatch
+                                            Rectangle {
+                                                width: 12
+                                                height: 8
+                                                radius: 2
+                                                color: modelData
+                                            }
+                                        }
+                                    }
+
+                                    Text {
+                                        width: parent.width
+                                        text: name
+                                        color: Theme.textSecondary
+                                        font.pixelSize: Theme.fontSizeSmall
+                                        elide: Text.ElideRight
+                                    }
+                                }
+
+                                MouseArea {
+                                    id: presetMouse
+                                    anchors.fill: parent
+                                    hoverEnabled: true
+                                    enabled: !hubBackend.editMode
+                                    cursorShape: Qt.PointingHandCursor
+                                    onEntered: themeCatalog.preview(name)
+                                    onExited: themeCatalog.endPreview()
+                                    onClicked: themeCatalog.apply(name)
+                                }
+                            }
+                        }
+                    }
+
+                    // Spacing
+                    Item { height: Theme.spacing }
+
                     // Colors section
                     Text {
                         text: "Colors"
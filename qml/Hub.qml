@@ -836,6 +836,41 @@ WidgetWindow {
                             }
                         }
                     }
+
+                    // Memory freed by unloading widgets that stayed hidden
+                    Rectangle {
+                        Layout.fillWidth: true
+                        Layout.preferredHeight: unloadColumn.implicitHeight + Theme.padding * 2
+                        radius: Theme.borderRadius
+                        color: Theme.surfaceColor
+                        visible: hubBackend.unloadReport.length > 0
+
+                        Column {
+                            id: unloadColumn
+                            anchors.fill: parent
+                            anchors.margins: Theme.padding
+                            spacing: 4
+
+                            Text {
+                                text: "Unloaded while hidden"
+                                color: Theme.textSecondary
+                                font.pixelSize: Theme.fontSizeSmall
+                            }
+
+                            Repeater {
+                                model: hubBackend.unloadReport
+
+                                Text {
+                                    width: unloadColumn.width
+                                    text: modelData.time + "  " + modelData.name + ": "
+                                          + modelData.reclaimedMb.toFixed(1) + " MB freed"
+                                    color: Theme.textPrimary
+                                    font.pixelSize: Theme.fontSizeSmall
+                                    elide: Text.ElideRight
+                                }
+                            }
+                        }
+                    }
                 }
             }
         }
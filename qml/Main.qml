@@ -0,0 +1,64 @@
+import QtQuick 2.15
+import QtQml 2.15
+
+// Single root component: one asynchronous Loader per registered widget
+// window, driven by widgetHost.model (see widgets/widget_host.py). A
+// widget's window is created when its row becomes active and destroyed
+// when it is deactivated, so windows appear one by one without blocking.
+QtObject {
+    id: root
+
+    property Instantiator windows: Instantiator {
+        model: widgetHost.model
+
+        delegate: Loader {
+            id: loader
+
+            property string widgetName: model.name
+            property url widgetSource: model.source
+            property bool wanted: model.active
+            // Compiled once, then kept for the next activation
+            property Component compiled: null
+            property Component compiling: null
+
+            asynchronous: true
+            active: wanted && compiled !== null
+            sourceComponent: compiled
+
+            // Compile and create as separate steps so the trace shows both
+            function compile() {
+                if (compiled !== null) {
+                    widgetHost.windowCompiled(widgetName)
+                    return
+                }
+                if (compiling !== null)
+                    return  // still compiling; finish() reports it
+                var component = Qt.createComponent(widgetSource, Component.Asynchronous)
+                function finish() {
+                    loader.compiling = null
+                    if (component.status === Component.Ready) {
+                        widgetHost.windowCompiled(widgetName)
+                        loader.compiled = component
+                    } else if (component.status === Component.Error) {
+                        widgetHost.windowFailed(widgetName, component.errorString())
+                    }
+                }
+                if (component.status === Component.Loading) {
+                    compiling = component
+                    component.statusChanged.connect(finish)
+                } else {
+                    finish()
+                }
+            }
+
+            onWantedChanged: if (wanted) compile()
+            Component.onCompleted: if (wanted) compile()
+
+            onLoaded: widgetHost.windowReady(widgetName, item)
+            onStatusChanged: {
+                if (status === Loader.Error)
+                    widgetHost.windowFailed(widgetName, "see QML warnings above")
+            }
+        }
+    }
+}
@@ -1,31 +1,29 @@
-from .battery import BatteryBackend
-from .hotkey import HotkeyBackend
-from .hub import HubBackend
-from .launcher import LauncherBackend
-from .media import MediaBackend
-from .network_monitor import NetworkMonitorBackend
-from .news import NewsBackend
-from .notes import NotesBackend
-from .pomodoro import PomodoroBackend
-from .settings import SettingsBackend
-from .system_monitor import SystemMonitorBackend
-from .theme_provider import ThemeProvider
-from .todo import TodoBackend
-from .weather import WeatherBackend
+from .lazy import lazy_exports
 
-__all__ = [
-    "BatteryBackend",
-    "HotkeyBackend",
-    "HubBackend",
-    "LauncherBackend",
-    "MediaBackend",
-    "NetworkMonitorBackend",
-    "NewsBackend",
-    "NotesBackend",
-    "PomodoroBackend",
-    "SettingsBackend",
-    "SystemMonitorBackend",
-    "ThemeProvider",
-    "TodoBackend",
-    "WeatherBackend",
-]
+# Resolved on first access, so importing one class doesn't import every
+# backend (and psutil, PIL, winrt...) with it
+_EXPORTS = {
+    "BatteryBackend": ".battery:BatteryBackend",
+    "HotkeyBackend": ".hotkey:HotkeyBackend",
+    "HubBackend": ".hub:HubBackend",
+    "IconAtlas": ".icon_atlas:IconAtlas",
+    "LauncherBackend": ".launcher:LauncherBackend",
+    "MediaBackend": ".media:MediaBackend",
+    "NetworkMonitorBackend": ".network_monitor:NetworkMonitorBackend",
+    "NewsBackend": ".news:NewsBackend",
+    "NotesBackend": ".notes:NotesBackend",
+    "PomodoroBackend": ".pomodoro:PomodoroBackend",
+    "SettingsBackend": ".settings:SettingsBackend",
+    "SystemMonitorBackend": ".system_monitor:SystemMonitorBackend",
+    "ThemeCatalog": ".theme_catalog:ThemeCatalog",
+    "ThemeProvider": ".theme_provider:ThemeProvider",
+    "ThemeWatcher": ".theme_watcher:ThemeWatcher",
+    "TintedIconProvider": ".tinted_icons:TintedIconProvider",
+    "TodoBackend": ".todo:TodoBackend",
+    "WeatherBackend": ".weather:WeatherBackend",
+    "WidgetHost": ".widget_host:WidgetHost",
+}
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -1,3 +1,15 @@
-from .battery import BatteryBackend
+from ..lazy import lazy_exports
 
-__all__ = ["BatteryBackend"]
+MANIFEST = {
+    "name": "battery",
+    "qml": "Battery.qml",
+    "visible_property": "batteryVisible",
+    "backend": "widgets.battery.battery:BatteryBackend",
+    "context_name": "batteryBackend",
+    "cleanup": "cleanup",
+    "snapshot": "snapshot",
+}
+
+__getattr__ = lazy_exports(__name__, {"BatteryBackend": ".battery:BatteryBackend"})
+
+__all__ = ["BatteryBackend", "MANIFEST"]
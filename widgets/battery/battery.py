@@ -7,7 +7,7 @@ class BatteryBackend(QObject):
 
     batteryChanged = Signal()
 
-    def __init__(self, settings_backend=None, parent=None):
+    def __init__(self, settings_backend=None, snapshot=None, parent=None):
         super().__init__(parent)
         self._settings = settings_backend
 
@@ -23,29 +23,60 @@ class BatteryBackend(QObject):
         self._timer.timeout.connect(self._update)
         self._timer.start()
 
-        # Initial update
-        self._update()
+        # Initial update; with a snapshot to show, after construction
+        if snapshot:
+            self._restore_snapshot(snapshot)
+            QTimer.singleShot(0, self._update)
+        else:
+            self._update()
+
+    def snapshot(self):
+        """Displayable state for the next start (manifest snapshot hook)."""
+        return {
+            "has_battery": self._has_battery,
+            "percent": self._percent,
+            "is_plugged": self._is_plugged,
+            "time_remaining": self._time_remaining,
+        }
+
+    def _restore_snapshot(self, snapshot: dict):
+        self._has_battery = snapshot.get("has_battery", False)
+        self._percent = snapshot.get("percent", 0)
+        self._is_plugged = snapshot.get("is_plugged", False)
+        self._time_remaining = snapshot.get("time_remaining", -1)
 
     def _update(self):
         """Update battery stats."""
         battery = psutil.sensors_battery()
 
         if battery is None:
-            self._has_battery = False
-            self._percent = 0
-            self._is_plugged = True
-            self._time_remaining = -1
+            state = (False, 0, True, -1)
         else:
-            self._has_battery = True
-            self._percent = int(battery.percent)
-            self._is_plugged = battery.power_plugged
-            self._time_remaining = (
-                battery.secsleft
-                if battery.secsleft != psutil.POWER_TIME_UNLIMITED
-                else -1
+            state = (
+                True,
+                int(battery.percent),
+                battery.power_plugged,
+                (
+                    battery.secsleft
+                    if battery.secsleft != psutil.POWER_TIME_UNLIMITED
+                    else -1
+                ),
             )
 
-        self.batteryChanged.emit()
+        current = (
+            self._has_battery,
+            self._percent,
+            self._is_plugged,
+            self._time_remaining,
+        )
+        if state != current:
+            (
+                self._has_battery,
+                self._percent,
+                self._is_plugged,
+                self._time_remaining,
+            ) = state
+            self.batteryChanged.emit()
 
     # Properties
     @Property(bool, notify=batteryChanged)
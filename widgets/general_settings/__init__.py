@@ -0,0 +1,9 @@
+# General Settings has no backend of its own; it edits the theme and hotkeys
+MANIFEST = {
+    "name": "general_settings",
+    "qml": "GeneralSettings.qml",
+    "visible_property": "themeVisible",
+    "settings_key": "theme",
+}
+
+__all__ = ["MANIFEST"]
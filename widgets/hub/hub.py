@@ -1,9 +1,13 @@
+import time
 from pathlib import Path
 
 from PySide6.QtCore import QObject, Property, Signal, Slot
 from PySide6.QtGui import QIcon, QAction
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu
 
+# Entries kept in unloadReport
+MAX_UNLOAD_REPORT = 20
+
 
 class HubBackend(QObject):
     weatherVisibleChanged = Signal(bool)
@@ -20,6 +24,7 @@ class HubBackend(QObject):
     editModeChanged = Signal(bool)
     alwaysOnTopChanged = Signal(bool)
     hubVisibleChanged = Signal(bool)
+    unloadReportChanged = Signal()
     showHubRequested = Signal()
     exitRequested = Signal()
 
@@ -30,6 +35,7 @@ class HubBackend(QObject):
         self._tray_icon = None
         self._tray_menu = None
         self._hub_visible = True  # Hub starts visible by default
+        self._unload_report = []
 
         if self._settings:
             self._weather_visible = self._settings.getWidgetVisible("weather")
@@ -334,6 +340,22 @@ class HubBackend(QObject):
         """Set hub window visibility state."""
         self.hubVisible = visible
 
+    # Idle unload report
+    @Property("QVariantList", notify=unloadReportChanged)
+    def unloadReport(self):
+        """Most recent idle unloads first: {name, reclaimedMb, time}."""
+        return self._unload_report
+
+    def record_unload(self, name: str, reclaimed: int):
+        """Connected to WidgetHost.widgetUnloaded."""
+        entry = {
+            "name": name.replace("_", " ").title(),
+            "reclaimedMb": round(reclaimed / (1024 * 1024), 1),
+            "time": time.strftime("%H:%M"),
+        }
+        self._unload_report = [entry] + self._unload_report[: MAX_UNLOAD_REPORT - 1]
+        self.unloadReportChanged.emit()
+
     @Slot()
     def minimizeToTray(self):
         """Minimize the hub to the system tray."""
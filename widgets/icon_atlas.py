@@ -0,0 +1,124 @@
+"""Prerendered texture atlases for the icons referenced by the app.
+
+build_atlas() rasterises each icon once per pixel size into a grid image
+(data/icon_atlas/atlas_<px>.png) and writes index.json with the cell order.
+TintedIconProvider then copies and tints a cell instead of parsing the SVG.
+Icons not in the atlas (e.g. picked in the launcher) still render from SVG.
+"""
+
+import json
+import math
+import re
+import threading
+from pathlib import Path
+
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtSvg import QSvgRenderer
+
+ATLAS_VERSION = 1
+DEFAULT_SIZES = (16, 18, 20, 24, 32)
+MAX_ATLAS_WIDTH = 2048
+
+# Quoted icon file names, e.g. "save.svg" in QML or Python sources
+ICON_REF = re.compile(r"[\"']([a-z0-9][a-z0-9-]*\.svg)[\"']")
+
+
+def referenced_icons(project_root: Path, icons_dir: Path) -> list[str]:
+    """Icon names quoted in qml/ and widgets/ that exist in icons_dir."""
+    names = set()
+    sources = list((project_root / "qml").rglob("*.qml"))
+    sources += list((project_root / "widgets").rglob("*.py"))
+    for path in sources:
+        try:
+            names.update(ICON_REF.findall(path.read_text(encoding="utf-8")))
+        except (IOError, UnicodeDecodeError):
+            continue
+    return sorted(name for name in names if (icons_dir / name).exists())
+
+
+def pixel_sizes(sizes=DEFAULT_SIZES, dprs=(1.0,)) -> list[int]:
+    return sorted({round(size * dpr) for size in sizes for dpr in dprs})
+
+
+def build_atlas(icons_dir: Path, names: list[str], pixels: list[int], out_dir: Path):
+    """Rasterise names at each pixel size and write the atlases plus index."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    renderers = {}
+    for name in names:
+        renderer = QSvgRenderer(str(icons_dir / name))
+        if renderer.isValid():
+            renderer.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+            renderers[name] = renderer
+    names = [name for name in names if name in renderers]
+
+    index = {"version": ATLAS_VERSION, "icons": names, "sizes": {}}
+    for px in pixels:
+        columns = max(1, min(len(names), MAX_ATLAS_WIDTH // px))
+        rows = math.ceil(len(names) / columns) if names else 0
+        image = QImage(
+            columns * px, max(rows, 1) * px, QImage.Format.Format_ARGB32_Premultiplied
+        )
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        for i, name in enumerate(names):
+            row, column = divmod(i, columns)
+            renderers[name].render(painter, QRectF(column * px, row * px, px, px))
+        painter.end()
+
+        file_name = f"atlas_{px}.png"
+        if not image.save(str(out_dir / file_name)):
+            print(f"Error saving icon atlas {file_name}")
+            continue
+        index["sizes"][str(px)] = {"file": file_name, "columns": columns}
+
+    with open(out_dir / "index.json", "w") as f:
+        json.dump(index, f, indent=2)
+    return index
+
+
+class IconAtlas:
+    """Read side of the atlases; atlas images are loaded on first use."""
+
+    def __init__(self, out_dir: Path, index: dict):
+        self._out_dir = out_dir
+        self._cells = {name: i for i, name in enumerate(index.get("icons", []))}
+        self._sizes = {int(px): info for px, info in index.get("sizes", {}).items()}
+        self._images: dict[int, QImage] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, out_dir: Path):
+        """Open the atlas in out_dir, or return None if missing or outdated."""
+        try:
+            with open(out_dir / "index.json") as f:
+                index = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+        if index.get("version") != ATLAS_VERSION:
+            return None
+        return cls(out_dir, index)
+
+    def covers(self, names, pixels) -> bool:
+        """Whether every name is in the atlas at every pixel size."""
+        return all(name in self._cells for name in names) and all(
+            px in self._sizes for px in pixels
+        )
+
+    def icon(self, name: str, px: int):
+        """Copy of the icon's cell at px pixels, or None if not in the atlas."""
+        cell = self._cells.get(name)
+        info = self._sizes.get(px)
+        if cell is None or info is None:
+            return None
+        with self._lock:
+            image = self._images.get(px)
+            if image is None:
+                image = QImage(str(self._out_dir / info["file"])).convertToFormat(
+                    QImage.Format.Format_ARGB32_Premultiplied
+                )
+                self._images[px] = image
+        if image.isNull():
+            return None
+        row, column = divmod(cell, info["columns"])
+        return image.copy(QRect(column * px, row * px, px, px))
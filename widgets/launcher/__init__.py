@@ -1,3 +1,13 @@
-from .launcher import LauncherBackend
+from ..lazy import lazy_exports
 
-__all__ = ["LauncherBackend"]
+MANIFEST = {
+    "name": "launcher",
+    "qml": "Launcher.qml",
+    "visible_property": "launcherVisible",
+    "backend": "widgets.launcher.launcher:LauncherBackend",
+    "context_name": "launcherBackend",
+}
+
+__getattr__ = lazy_exports(__name__, {"LauncherBackend": ".launcher:LauncherBackend"})
+
+__all__ = ["LauncherBackend", "MANIFEST"]
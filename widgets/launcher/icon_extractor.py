@@ -4,16 +4,20 @@ import os
 from ctypes import wintypes
 from pathlib import Path
 
-try:
-    import win32api
-    import win32con
-    import win32gui
-    import win32ui
-    from PIL import Image
+from ..lazy import LazyModule
 
-    HAS_WIN32 = True
-except ImportError:
-    HAS_WIN32 = False
+# Imported when an icon is first extracted, not when the launcher loads
+win32api = LazyModule("win32api")
+win32con = LazyModule("win32con")
+win32gui = LazyModule("win32gui")
+win32ui = LazyModule("win32ui")
+Image = LazyModule("PIL.Image")
+
+
+def has_win32() -> bool:
+    return all(
+        module.available() for module in (win32api, win32con, win32gui, win32ui, Image)
+    )
 
 
 class SHFILEINFO(ctypes.Structure):
@@ -44,7 +48,7 @@ def get_cache_path(file_path: str) -> Path:
 
 
 def resolve_lnk_target(lnk_path: str) -> tuple[str, str, str]:
-    if not HAS_WIN32:
+    if not has_win32():
         return lnk_path, "", ""
     try:
         import win32com.client
@@ -90,7 +94,7 @@ def extract_ico_best_size(ico_path: str, output_path: Path) -> bool:
 
 
 def get_jumbo_icon(file_path: str) -> int:
-    if not HAS_WIN32:
+    if not has_win32():
         return 0
     try:
         shell32 = ctypes.windll.shell32
@@ -137,7 +141,7 @@ def get_jumbo_icon(file_path: str) -> int:
 
 
 def extract_icon_from_handle(hicon: int, output_path: Path, size: int = 256) -> bool:
-    if not HAS_WIN32 or not hicon:
+    if not has_win32() or not hicon:
         return False
 
     try:
@@ -195,7 +199,7 @@ def extract_icon_from_handle(hicon: int, output_path: Path, size: int = 256) ->
 
 
 def extract_icon_from_exe(exe_path: str, output_path: Path, size: int = 256) -> bool:
-    if not HAS_WIN32:
+    if not has_win32():
         return False
 
     try:
@@ -270,7 +274,7 @@ def extract_icon_from_exe(exe_path: str, output_path: Path, size: int = 256) ->
 
 
 def extract_icon(file_path: str) -> str:
-    if not file_path or not HAS_WIN32:
+    if not file_path or not has_win32():
         return ""
 
     path_obj = Path(file_path)
@@ -69,18 +69,23 @@ class LauncherBackend(QObject):
     def _load_shortcuts(self):
         """Load shortcuts from settings."""
         if self._settings:
-            data = self._settings.getWidgetSetting("launcher", "shortcuts")
-            if data and isinstance(data, list):
-                self._shortcuts = data
-            else:
-                self._shortcuts = []
+            self._shortcuts = self._settings.getCollection("launcher", "shortcuts")
         else:
             self._shortcuts = []
 
-    def _save_shortcuts(self):
-        """Save shortcuts to settings."""
+    def _save_shortcuts(self, changed=(), removed=(), reordered=False):
+        """Save changed shortcuts, removed ids and (if reordered) the order."""
         if self._settings:
-            self._settings.setWidgetSetting("launcher", "shortcuts", self._shortcuts)
+            for shortcut in changed:
+                self._settings.setCollectionItem("launcher", "shortcuts", shortcut)
+            for shortcut_id in removed:
+                self._settings.removeCollectionItem(
+                    "launcher", "shortcuts", shortcut_id
+                )
+            if reordered:
+                self._settings.setCollectionOrder(
+                    "launcher", "shortcuts", [s.get("id") for s in self._shortcuts]
+                )
         self.shortcutsChanged.emit()
 
     @Property("QVariantList", notify=shortcutsChanged)
@@ -131,13 +136,13 @@ class LauncherBackend(QObject):
             "workingDir": working_dir,
         }
         self._shortcuts.append(shortcut)
-        self._save_shortcuts()
+        self._save_shortcuts(changed=[shortcut], reordered=True)
 
     @Slot(str)
     def removeShortcut(self, shortcut_id):
         """Remove a shortcut by ID."""
         self._shortcuts = [s for s in self._shortcuts if s.get("id") != shortcut_id]
-        self._save_shortcuts()
+        self._save_shortcuts(removed=[shortcut_id])
 
     @Slot(str, str)
     def updateShortcutName(self, shortcut_id, name):
@@ -145,8 +150,8 @@ class LauncherBackend(QObject):
         for s in self._shortcuts:
             if s.get("id") == shortcut_id:
                 s["name"] = name
+                self._save_shortcuts(changed=[s])
                 break
-        self._save_shortcuts()
 
     @Slot(str, str, str, bool, str, str)
     def updateShortcut(
@@ -159,8 +164,8 @@ class LauncherBackend(QObject):
                 s["useCustomIcon"] = use_custom_icon
                 s["customImagePath"] = custom_image
                 s["workingDir"] = working_dir
+                self._save_shortcuts(changed=[s])
                 break
-        self._save_shortcuts()
 
     @Slot(str, int)
     def moveShortcut(self, shortcut_id, new_index):
@@ -173,7 +178,7 @@ class LauncherBackend(QObject):
             return
         shortcut = self._shortcuts.pop(current_index)
         self._shortcuts.insert(new_index, shortcut)
-        self._save_shortcuts()
+        self._save_shortcuts(reordered=True)
 
     @Slot(str)
     def launchShortcut(self, shortcut_id):
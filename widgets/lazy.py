@@ -0,0 +1,62 @@
+import importlib
+import sys
+
+
+def import_attr(path: str, package: str = None):
+    """Import "module:attr" (module may be relative to package)."""
+    module, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module, package), attr)
+
+
+def lazy_exports(package: str, exports: dict):
+    """Module __getattr__ importing exports[name] on first access.
+
+    Lets a package re-export its classes without importing their modules
+    (and the third-party libraries behind them) until one is used.
+    """
+
+    def __getattr__(name):
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = import_attr(target, package)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    For heavy optional dependencies used on rare paths (PIL, pywin32,
+    winotify): importing the widget module no longer imports them.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        # The ImportError of a failed import, re-raised instead of retrying
+        self._error = None
+
+    def _load(self):
+        if self._module is None:
+            if self._error is not None:
+                raise self._error.with_traceback(None)
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError as e:
+                self._error = e
+                raise
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def available(self) -> bool:
+        """Import the module now; False if it is not installed (cached)."""
+        try:
+            self._load()
+        except ImportError:
+            return False
+        return True
@@ -1,3 +1,15 @@
-from .media import MediaBackend
+from ..lazy import lazy_exports
 
-__all__ = ["MediaBackend"]
+MANIFEST = {
+    "name": "media",
+    "qml": "Media.qml",
+    "visible_property": "mediaVisible",
+    "backend": "widgets.media.media:MediaBackend",
+    "context_name": "mediaBackend",
+    "cleanup": "cleanup",
+    "snapshot": "snapshot",
+}
+
+__getattr__ = lazy_exports(__name__, {"MediaBackend": ".media:MediaBackend"})
+
+__all__ = ["MediaBackend", "MANIFEST"]
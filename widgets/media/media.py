@@ -2,6 +2,7 @@ from pathlib import Path
 
 from PySide6.QtCore import QObject, Property, Signal, Slot, QTimer
 
+from ..thread_results import ThreadResults
 from .async_worker import MediaAsyncWorker
 
 
@@ -30,7 +31,7 @@ class MediaBackend(QObject):
     isLoadingChanged = Signal()
     maxSessionsChanged = Signal()
 
-    def __init__(self, settings_backend=None, parent=None):
+    def __init__(self, settings_backend=None, snapshot=None, parent=None):
         super().__init__(parent)
 
         self._settings = settings_backend
@@ -70,6 +71,14 @@ class MediaBackend(QObject):
         self._assets_dir = Path(__file__).parent / "assets"
         self._default_cover = str((self._assets_dir / "default-cover.png").absolute())
 
+        # Last shown sessions, display only, until the worker's first update
+        self._sessions_restored = False
+        if snapshot:
+            self._restore_snapshot(snapshot)
+
+        # Closed by cleanup(); worker updates still queued are then ignored
+        self._worker_results = ThreadResults(self)
+
         # Initialize async worker
         self._async_thread = MediaAsyncWorker(self._assets_dir)
         self._async_thread.mediaStateChanged.connect(self._on_media_state_changed)
@@ -78,15 +87,61 @@ class MediaBackend(QObject):
         self._async_thread.start()
 
         # Position update timer (500ms when playing)
-        self._position_timer = QTimer()
+        self._position_timer = QTimer(self)
         self._position_timer.timeout.connect(self._update_local_position)
         self._position_timer.setInterval(500)
 
         # Note: Periodic session refresh is handled by async worker
         # to avoid redundant updates
 
+        # Error message is cleared 5 seconds after the last error
+        self._error_timer = QTimer(self)
+        self._error_timer.setSingleShot(True)
+        self._error_timer.setInterval(5000)
+        self._error_timer.timeout.connect(self._clear_error)
+
         # Initial loading state
-        QTimer.singleShot(2000, lambda: self._set_loading(False))
+        self._loading_timer = QTimer(self)
+        self._loading_timer.setSingleShot(True)
+        self._loading_timer.timeout.connect(self._end_initial_loading)
+        self._loading_timer.start(2000)
+
+    def snapshot(self):
+        """Displayable state for the next start (manifest snapshot hook)."""
+        return {"sessions": self._session_list}
+
+    def _restore_snapshot(self, snapshot: dict):
+        """Show last run's covers and titles; the players may be gone."""
+        sessions = []
+        for session in snapshot.get("sessions", []):
+            album_art = session.get("albumArtPath", "")
+            # Album art in assets/temp may have been evicted since
+            if not Path(album_art).is_file():
+                album_art = self._default_cover
+            sessions.append(
+                {
+                    "id": session.get("id", len(sessions)),
+                    "name": session.get("name", ""),
+                    "title": session.get("title", ""),
+                    "artist": session.get("artist", ""),
+                    "albumArtPath": album_art,
+                    "iconPath": session.get("iconPath", ""),
+                    # Not controllable until the worker reports the session
+                    "canGoNext": False,
+                    "canGoPrevious": False,
+                    "canPlayPause": False,
+                    "isPlaying": False,
+                }
+            )
+        self._session_list = sessions
+        self._sessions_restored = bool(sessions)
+
+    def _drop_restored_sessions(self):
+        """Clear restored sessions the worker never confirmed."""
+        if self._sessions_restored:
+            self._sessions_restored = False
+            self._session_list = []
+            self.sessionListChanged.emit()
 
     # Properties
     @Property(str, notify=titleChanged)
@@ -250,6 +305,8 @@ class MediaBackend(QObject):
     @Slot(dict)
     def _on_media_state_changed(self, state):
         """Handle media state updates from async thread."""
+        if self._worker_results.closed:
+            return
         # Update has_session
         has_session = state.get("has_session", False)
         if self._has_session != has_session:
@@ -349,23 +406,33 @@ class MediaBackend(QObject):
     @Slot(list)
     def _on_session_list_changed(self, session_list):
         """Handle session list updates from async thread."""
-        self._session_list = session_list
-        self.sessionListChanged.emit()
+        if self._worker_results.closed:
+            return
+        self._sessions_restored = False
+        if self._session_list != session_list:
+            self._session_list = session_list
+            self.sessionListChanged.emit()
 
     @Slot(str)
     def _on_error_occurred(self, error_msg):
         """Handle errors from async thread."""
+        if self._worker_results.closed:
+            return
+        self._drop_restored_sessions()
         self._error_message = error_msg
         self.errorMessageChanged.emit()
 
-        # Clear error after 5 seconds
-        QTimer.singleShot(5000, lambda: self._clear_error())
+        self._error_timer.start()
 
     def _clear_error(self):
         """Clear error message."""
         self._error_message = ""
         self.errorMessageChanged.emit()
 
+    def _end_initial_loading(self):
+        self._set_loading(False)
+        self._drop_restored_sessions()
+
     def _set_loading(self, loading):
         """Set loading state."""
         if self._is_loading != loading:
@@ -392,13 +459,20 @@ class MediaBackend(QObject):
         return f"{minutes}:{secs:02d}"
 
     def cleanup(self):
-        """Explicit cleanup - call from main.py on aboutToQuit."""
-        if hasattr(self, "_position_timer"):
-            self._position_timer.stop()
-        if hasattr(self, "_async_thread") and self._async_thread:
-            self._async_thread.stop()
-            self._async_thread.wait(2000)
+        """Stop the timers and the worker; called before the backend is unloaded."""
+        self._worker_results.close()
+        self._position_timer.stop()
+        self._error_timer.stop()
+        self._loading_timer.stop()
+        self._stop_worker()
+
+    def _stop_worker(self):
+        thread = getattr(self, "_async_thread", None)
+        if thread is not None:
+            self._async_thread = None
+            thread.stop()
+            thread.wait(2000)
 
     def __del__(self):
-        """Cleanup on deletion (fallback, but not reliable under Qt)."""
-        self.cleanup()
+        """Fallback if cleanup() never ran; the timers may already be deleted."""
+        self._stop_worker()
@@ -1,3 +1,17 @@
-from .network_monitor import NetworkMonitorBackend
+from ..lazy import lazy_exports
 
-__all__ = ["NetworkMonitorBackend"]
+MANIFEST = {
+    "name": "network_monitor",
+    "qml": "NetworkMonitor.qml",
+    "visible_property": "networkMonitorVisible",
+    "backend": "widgets.network_monitor.network_monitor:NetworkMonitorBackend",
+    "context_name": "networkMonitorBackend",
+    "cleanup": "cleanup",
+    "snapshot": "snapshot",
+}
+
+__getattr__ = lazy_exports(
+    __name__, {"NetworkMonitorBackend": ".network_monitor:NetworkMonitorBackend"}
+)
+
+__all__ = ["NetworkMonitorBackend", "MANIFEST"]
@@ -10,7 +10,7 @@ class NetworkMonitorBackend(QObject):
     colorSettingsChanged = Signal()
     historyDurationChanged = Signal()
 
-    def __init__(self, settings_backend=None, parent=None):
+    def __init__(self, settings_backend=None, snapshot=None, parent=None):
         super().__init__(parent)
         self._settings = settings_backend
 
@@ -25,6 +25,8 @@ class NetworkMonitorBackend(QObject):
         self._upload_history = []
         self._download_history = []
         self._max_history = self._load_history_duration()
+        if snapshot:
+            self._restore_snapshot(snapshot)
 
         self._timer = QTimer(self)
         self._timer.setInterval(1000)
@@ -36,6 +38,22 @@ class NetworkMonitorBackend(QObject):
 
         self._timer.start()
 
+    def snapshot(self):
+        """Displayable state for the next start (manifest snapshot hook)."""
+        return {
+            "upload_history": self._upload_history,
+            "download_history": self._download_history,
+        }
+
+    def _restore_snapshot(self, snapshot: dict):
+        """Seed the graphs with the last session's samples."""
+        upload = snapshot.get("upload_history", [])[-self._max_history :]
+        download = snapshot.get("download_history", [])[-self._max_history :]
+        self._upload_history = upload
+        self._download_history = download
+        self._upload_speed = upload[-1] if upload else 0.0
+        self._download_speed = download[-1] if download else 0.0
+
     def _load_history_duration(self):
         """Load history duration from settings."""
         if self._settings:
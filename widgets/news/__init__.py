@@ -1,3 +1,16 @@
-from .news import NewsBackend
+from ..lazy import lazy_exports
 
-__all__ = ["NewsBackend"]
+MANIFEST = {
+    "name": "news",
+    "qml": "News.qml",
+    "visible_property": "newsVisible",
+    "backend": "widgets.news.news:NewsBackend",
+    "context_name": "newsBackend",
+    "preload": "widgets.news.news:preload",
+    "cleanup": "cleanup",
+    "snapshot": "snapshot",
+}
+
+__getattr__ = lazy_exports(__name__, {"NewsBackend": ".news:NewsBackend"})
+
+__all__ = ["NewsBackend", "MANIFEST"]
@@ -6,6 +6,50 @@ from datetime import datetime, timezone
 from pathlib import Path
 from PySide6.QtCore import QObject, Property, Signal, Slot, QTimer
 
+from ..thread_results import ThreadResults
+
+CACHE_DIR = Path(__file__).parent / "cache"
+
+
+def todays_cache_date():
+    """Get the cache date string for today (changes at 12:00 UTC)."""
+    now = datetime.now(timezone.utc)
+    return f"{now.date().isoformat()}-{'pm' if now.hour >= 12 else 'am'}"
+
+
+def read_cached_categories(cache_dir: Path):
+    """Contents of categories.json, or None."""
+    try:
+        data = json.loads((cache_dir / "categories.json").read_text())
+    except (IOError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def read_cached_articles(cache_dir: Path, category: str):
+    """Cached articles of category if they are from today's edition, or None."""
+    try:
+        stored_date = (cache_dir / f"{category}.meta").read_text().strip()
+        if stored_date != todays_cache_date():
+            return None
+        return json.loads((cache_dir / f"{category}.json").read_text())
+    except (IOError, ValueError):
+        return None
+
+
+def preload(config):
+    """Read the category and article caches off the UI thread.
+
+    Manifest preload hook; config is the stored news config (or None).
+    """
+    CACHE_DIR.mkdir(exist_ok=True)
+    selected = (config or {}).get("selected_categories") or ["tech"]
+    return {
+        "categories": read_cached_categories(CACHE_DIR),
+        "active_category": selected[0],
+        "articles": read_cached_articles(CACHE_DIR, selected[0]),
+    }
+
 
 class NewsBackend(QObject):
     """Backend for Kagi News widget."""
@@ -26,7 +70,9 @@ class NewsBackend(QObject):
 
     BASE_URL = "https://kite.kagi.com"
 
-    def __init__(self, settings_backend=None, parent=None):
+    def __init__(
+        self, settings_backend=None, preloaded=None, snapshot=None, parent=None
+    ):
         super().__init__(parent)
         self._settings = settings_backend
 
@@ -40,10 +86,14 @@ class NewsBackend(QObject):
         self._selected_categories = ["tech"]
         self._active_category = "tech"
         self._date_slug = ""
-        self._cache_dir = Path(__file__).parent / "cache"
-        self._cache_dir.mkdir(exist_ok=True)
+        self._cache_dir = CACHE_DIR
+        if preloaded is None:
+            self._cache_dir.mkdir(exist_ok=True)
+            preloaded = {}
         self._is_refreshing = False
         self._refresh_wants_articles = False
+        # Closed by cleanup(); fetch threads still running drop their result
+        self._fetches = ThreadResults(self)
 
         self._categoriesFetched.connect(self._on_categories_fetched)
         self._articlesFetched.connect(self._on_articles_fetched)
@@ -51,10 +101,16 @@ class NewsBackend(QObject):
         self._categoriesRefreshDone.connect(self._on_categories_refresh_done)
 
         self._load_settings()
-        self._load_cached_categories()
+        self._load_cached_categories(preloaded.get("categories"))
 
         if self._selected_categories and self._active_category:
-            self._load_cached_articles(self._active_category)
+            articles = None
+            if preloaded.get("active_category") == self._active_category:
+                articles = preloaded.get("articles")
+            if not self._load_cached_articles(self._active_category, articles):
+                # Yesterday's edition until today's arrives
+                if snapshot and snapshot.get("category") == self._active_category:
+                    self._articles = snapshot.get("articles", [])
 
         self._refresh_timer = QTimer(self)
         self._refresh_timer.timeout.connect(self._check_and_refresh)
@@ -62,14 +118,16 @@ class NewsBackend(QObject):
 
         self._start_background_fetch_categories()
 
-    def _get_todays_cache_date(self):
-        """Get the cache date string for today (changes at 12:00 UTC)."""
-        now = datetime.now(timezone.utc)
-        if now.hour < 12:
-            cache_date = now.date().isoformat()
-        else:
-            cache_date = now.date().isoformat()
-        return f"{cache_date}-{'pm' if now.hour >= 12 else 'am'}"
+    def cleanup(self):
+        """Stop refreshing; called before the backend is unloaded."""
+        self._fetches.close()
+        self._refresh_timer.stop()
+
+    def snapshot(self):
+        """Displayable state for the next start (manifest snapshot hook)."""
+        if not self._articles:
+            return None
+        return {"category": self._active_category, "articles": self._articles}
 
     def _is_cache_valid(self, category):
         """Check if cache for category is still valid."""
@@ -81,33 +139,30 @@ class NewsBackend(QObject):
 
         try:
             stored_date = meta_file.read_text().strip()
-            return stored_date == self._get_todays_cache_date()
+            return stored_date == todays_cache_date()
         except:
             return False
 
-    def _load_cached_categories(self):
-        """Load categories from cache."""
-        cache_file = self._cache_dir / "categories.json"
-        if cache_file.exists():
-            try:
-                data = json.loads(cache_file.read_text())
-                self._categories = data.get("categories", [])
-                self._category_id_map = data.get("id_map", {})
-                self._category_timestamp_map = data.get("timestamp_map", {})
-                self._date_slug = data.get("date_slug", "")
-                self.categoriesChanged.emit()
-            except:
-                pass
-
-    def _load_cached_articles(self, category):
-        """Load articles from cache if valid."""
-        if not self._is_cache_valid(category):
+    def _load_cached_categories(self, data=None):
+        """Load categories from cache (or from data already read)."""
+        if data is None:
+            data = read_cached_categories(self._cache_dir)
+        if data:
+            self._categories = data.get("categories", [])
+            self._category_id_map = data.get("id_map", {})
+            self._category_timestamp_map = data.get("timestamp_map", {})
+            self._date_slug = data.get("date_slug", "")
+            self.categoriesChanged.emit()
+
+    def _load_cached_articles(self, category, data=None):
+        """Load articles from cache (or from data already read) if valid."""
+        if data is None:
+            data = read_cached_articles(self._cache_dir, category)
+        if data is None:
             self._fetch_articles_background(category)
             return False
 
-        cache_file = self._cache_dir / f"{category}.json"
         try:
-            data = json.loads(cache_file.read_text())
             articles = self._parse_articles(data, category)
             self._articles = articles
             self.articlesChanged.emit()
@@ -122,7 +177,7 @@ class NewsBackend(QObject):
         meta_file = self._cache_dir / f"{category}.meta"
         try:
             cache_file.write_text(json.dumps(data))
-            meta_file.write_text(self._get_todays_cache_date())
+            meta_file.write_text(todays_cache_date())
         except:
             pass
 
@@ -173,9 +228,11 @@ class NewsBackend(QObject):
                 )
             )
 
-            self._categoriesFetched.emit(categories, id_map, timestamp_map, date_slug)
+            self._fetches.emit(
+                "_categoriesFetched", categories, id_map, timestamp_map, date_slug
+            )
         except Exception as e:
-            self._fetchError.emit(f"Failed to load categories: {e}")
+            self._fetches.emit("_fetchError", f"Failed to load categories: {e}")
 
     def _on_categories_fetched(self, categories, id_map, timestamp_map, date_slug):
         """Handle categories fetched from background thread."""
@@ -222,10 +279,6 @@ class NewsBackend(QObject):
             cats = self._settings.getWidgetSetting("news", "selected_categories")
             if cats and isinstance(cats, list):
                 self._selected_categories = cats
-            elif not cats:
-                old_cat = self._settings.getWidgetSetting("news", "selected_category")
-                if old_cat:
-                    self._selected_categories = [old_cat]
 
             if self._selected_categories:
                 self._active_category = self._selected_categories[0]
@@ -311,7 +364,7 @@ class NewsBackend(QObject):
         try:
             category_uuid = self._category_id_map.get(category)
             if not category_uuid:
-                self._fetchError.emit(f"Unknown category: {category}")
+                self._fetches.emit("_fetchError", f"Unknown category: {category}")
                 return
 
             url = f"{self.BASE_URL}/api/batches/latest/categories/{category_uuid}/stories?limit=12"
@@ -325,15 +378,15 @@ class NewsBackend(QObject):
 
             self._save_cache(category, cache_data)
             articles = self._parse_articles(cache_data, category)
-            self._articlesFetched.emit(category, articles)
+            self._fetches.emit("_articlesFetched", category, articles)
 
         except urllib.error.HTTPError as e:
             if e.code == 404 and not is_retry:
                 self._retry_with_fresh_categories(category)
             else:
-                self._fetchError.emit(f"Failed to load news: {e}")
+                self._fetches.emit("_fetchError", f"Failed to load news: {e}")
         except Exception as e:
-            self._fetchError.emit(f"Failed to load news: {e}")
+            self._fetches.emit("_fetchError", f"Failed to load news: {e}")
 
     def _retry_with_fresh_categories(self, category):
         """Re-fetch categories synchronously in background thread, then retry article fetch once."""
@@ -359,7 +412,9 @@ class NewsBackend(QObject):
                 id_map[slug] = uuid
                 timestamp_map[slug] = timestamp
 
-            self._categoriesFetched.emit(categories, id_map, timestamp_map, date_slug)
+            self._fetches.emit(
+                "_categoriesFetched", categories, id_map, timestamp_map, date_slug
+            )
 
             if id_map.get(category):
                 self._category_id_map = id_map
@@ -367,13 +422,15 @@ class NewsBackend(QObject):
                 self._date_slug = date_slug
                 self._fetch_articles_thread(category, is_retry=True)
             else:
-                self._fetchError.emit(f"Category '{category}' not found after refresh")
+                self._fetches.emit(
+                    "_fetchError", f"Category '{category}' not found after refresh"
+                )
         except Exception as e:
-            self._fetchError.emit(f"Failed to refresh categories: {e}")
+            self._fetches.emit("_fetchError", f"Failed to refresh categories: {e}")
 
     def _on_articles_fetched(self, category, articles):
         """Handle articles fetched from background thread."""
-        if category == self._active_category:
+        if category == self._active_category and articles != self._articles:
             self._articles = articles
             self.articlesChanged.emit()
         self._is_loading = False
@@ -1,3 +1,14 @@
-from .notes import NotesBackend
+from ..lazy import lazy_exports
 
-__all__ = ["NotesBackend"]
+MANIFEST = {
+    "name": "notes",
+    "qml": "Notes.qml",
+    "visible_property": "notesVisible",
+    "backend": "widgets.notes.notes:NotesBackend",
+    "context_name": "notesBackend",
+    "requires": ("theme_provider",),
+}
+
+__getattr__ = lazy_exports(__name__, {"NotesBackend": ".notes:NotesBackend"})
+
+__all__ = ["NotesBackend", "MANIFEST"]
@@ -28,22 +28,20 @@ class NotesBackend(QObject):
     def _load_notes(self):
         """Load notes from settings."""
         if self._settings:
-            data = self._settings.getWidgetSetting("notes", "notes")
-            if data and isinstance(data, list):
-                self._notes = data
-            else:
-                self._notes = []
+            self._notes = self._settings.getCollection("notes", "notes")
             last_id = self._settings.getWidgetSetting("notes", "current_note_id")
             if last_id and any(n.get("id") == last_id for n in self._notes):
                 self._current_note_id = last_id
-            self._ensure_order_values()
         else:
             self._notes = []
 
-    def _save_notes(self):
-        """Save notes to settings."""
+    def _save_notes(self, changed=(), removed=()):
+        """Save changed notes and removed note ids to settings."""
         if self._settings:
-            self._settings.setWidgetSetting("notes", "notes", self._notes)
+            for note in changed:
+                self._settings.setCollectionItem("notes", "notes", note)
+            for note_id in removed:
+                self._settings.removeCollectionItem("notes", "notes", note_id)
             self._settings.setWidgetSetting(
                 "notes", "current_note_id", self._current_note_id
             )
@@ -116,16 +114,6 @@ class NotesBackend(QObject):
             return 0
         return max(n.get("order", 0) for n in self._notes) + 1
 
-    def _ensure_order_values(self):
-        """Ensure all notes have an order value."""
-        needs_save = False
-        for i, note in enumerate(self._notes):
-            if "order" not in note:
-                note["order"] = i
-                needs_save = True
-        if needs_save:
-            self._save_notes()
-
     @Slot(result=str)
     def createNote(self):
         """Create a new note and return its ID."""
@@ -145,7 +133,7 @@ class NotesBackend(QObject):
         self._notes.append(note)
         self._current_note_id = note_id
         self._newly_created_note_id = note_id
-        self._save_notes()
+        self._save_notes(changed=[note])
         self.currentNoteChanged.emit()
         return note_id
 
@@ -170,10 +158,13 @@ class NotesBackend(QObject):
         sorted_notes.pop(current_index)
         sorted_notes.insert(new_index, note)
 
+        changed = []
         for i, n in enumerate(sorted_notes):
-            n["order"] = i
+            if n.get("order") != i:
+                n["order"] = i
+                changed.append(n)
 
-        self._save_notes()
+        self._save_notes(changed=changed)
 
     @Slot(str)
     def selectNote(self, note_id):
@@ -198,6 +189,10 @@ class NotesBackend(QObject):
             self._notes = [
                 n for n in self._notes if n.get("id") != self._newly_created_note_id
             ]
+            if self._settings:
+                self._settings.removeCollectionItem(
+                    "notes", "notes", self._newly_created_note_id
+                )
             self.notesChanged.emit()
         self._newly_created_note_id = None
 
@@ -212,7 +207,7 @@ class NotesBackend(QObject):
             note["updated"] = int(time.time())
             if note_id == self._newly_created_note_id and title:
                 self._newly_created_note_id = None
-            self._save_notes()
+            self._save_notes(changed=[note])
             if note_id == self._current_note_id:
                 self.currentNoteChanged.emit()
 
@@ -227,7 +222,7 @@ class NotesBackend(QObject):
             note["updated"] = int(time.time())
             if note_id == self._newly_created_note_id and content:
                 self._newly_created_note_id = None
-            self._save_notes()
+            self._save_notes(changed=[note])
             if note_id == self._current_note_id:
                 self.currentNoteChanged.emit()
 
@@ -239,7 +234,7 @@ class NotesBackend(QObject):
         if note:
             note["colorIndex"] = color_index
             note["updated"] = int(time.time())
-            self._save_notes()
+            self._save_notes(changed=[note])
             if note_id == self._current_note_id:
                 self.currentNoteChanged.emit()
 
@@ -262,4 +257,4 @@ class NotesBackend(QObject):
         if self._current_note_id == note_id:
             self._current_note_id = None
             self.currentNoteChanged.emit()
-        self._save_notes()
+        self._save_notes(removed=[note_id])
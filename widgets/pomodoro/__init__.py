@@ -1,3 +1,13 @@
-from .pomodoro import PomodoroBackend
+from ..lazy import lazy_exports
 
-__all__ = ["PomodoroBackend"]
+MANIFEST = {
+    "name": "pomodoro",
+    "qml": "Pomodoro.qml",
+    "visible_property": "pomodoroVisible",
+    "backend": "widgets.pomodoro.pomodoro:PomodoroBackend",
+    "context_name": "pomodoroBackend",
+}
+
+__getattr__ = lazy_exports(__name__, {"PomodoroBackend": ".pomodoro:PomodoroBackend"})
+
+__all__ = ["PomodoroBackend", "MANIFEST"]
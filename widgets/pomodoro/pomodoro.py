@@ -1,13 +1,10 @@
 import time
 from PySide6.QtCore import QObject, Property, Signal, Slot, QTimer
 
-# Try to import Windows toast notifications
-try:
-    from winotify import Notification, audio
+from ..lazy import LazyModule
 
-    HAS_TOAST = True
-except ImportError:
-    HAS_TOAST = False
+# Windows toast notifications, imported on the first notification
+winotify = LazyModule("winotify")
 
 
 class PomodoroBackend(QObject):
@@ -109,18 +106,18 @@ class PomodoroBackend(QObject):
 
     def _show_notification(self, title, message):
         """Show Windows toast notification."""
-        if not HAS_TOAST:
+        if not winotify.available():
             print(f"[Pomodoro] Toast not available: {title}")
             return
 
         try:
-            toast = Notification(
+            toast = winotify.Notification(
                 app_id="QML Shell",
                 title=title,
                 msg=message,
                 duration="short",
             )
-            toast.set_audio(audio.Default, loop=False)
+            toast.set_audio(winotify.audio.Default, loop=False)
             toast.show()
             print(f"[Pomodoro] Toast sent: {title}")
         except Exception as e:
@@ -0,0 +1,158 @@
+"""Ahead-of-time QML compilation into an app-owned disk cache.
+
+Qt stores compiled QML (.qmlc) under the user's cache directory by default,
+where it is shared with every other Qt app and thrown away on Qt upgrades.
+use_cache_dir() points it at data/qml_cache instead; precompile() compiles
+every file under qml/ into it and records what it compiled in manifest.json.
+At startup check_cache() compares the manifest with the QML sources and
+looks for each file's compiled unit: a file whose size or modification time
+changed, whose .qmlc is missing, or a cache built by another Qt version, is
+a miss that Qt will compile from source.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from PySide6.QtCore import QTimer, QUrl, qVersion
+from PySide6.QtQml import QQmlComponent
+
+CACHE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+def use_cache_dir(cache_dir: Path) -> Path:
+    """Make Qt read and write compiled QML in cache_dir; returns the one used.
+
+    Must run before the first QML engine is created. QML_DISK_CACHE_PATH
+    set in the environment takes precedence, and is then the directory
+    returned for check_cache() and precompile().
+    """
+    if not os.environ.get("QML_DISK_CACHE_PATH"):
+        # Qt appends the file name without a separator
+        os.environ["QML_DISK_CACHE_PATH"] = str(cache_dir) + os.sep
+    cache_dir = Path(os.environ["QML_DISK_CACHE_PATH"])
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def unit_path(cache_dir: Path, source: Path) -> Path:
+    """Where Qt stores the compiled unit of source: sha1 of its path."""
+    local = QUrl.fromLocalFile(str(source)).toLocalFile()
+    digest = hashlib.sha1(local.encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.qmlc"
+
+
+def qml_files(qml_dir: Path) -> list[str]:
+    """Every .qml file under qml_dir, as sorted POSIX paths relative to it."""
+    return sorted(p.relative_to(qml_dir).as_posix() for p in qml_dir.rglob("*.qml"))
+
+
+def _stamp(path: Path) -> dict:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def check_cache(qml_dir: Path, cache_dir: Path) -> dict:
+    """Split the QML files into cache hits and misses.
+
+    A hit is recorded in the manifest with the source's current size and
+    mtime and has its .qmlc in cache_dir.
+    """
+    files = qml_files(qml_dir)
+    try:
+        with open(cache_dir / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        manifest = {}
+    compiled = {}
+    if (
+        manifest.get("version") == CACHE_VERSION
+        and manifest.get("qt_version") == qVersion()
+    ):
+        compiled = manifest.get("files", {})
+
+    hits, misses = [], []
+    for name in files:
+        try:
+            current = _stamp(qml_dir / name)
+        except OSError:
+            continue
+        cached = compiled.get(name) == current
+        if cached and not unit_path(cache_dir, qml_dir / name).is_file():
+            cached = False
+        (hits if cached else misses).append(name)
+    return {"hits": hits, "misses": misses}
+
+
+def _compile(engine, qml_dir: Path, name: str):
+    """Compile one file (Qt writes its .qmlc); returns an error string or None."""
+    url = QUrl.fromLocalFile(str(qml_dir / name))
+    component = QQmlComponent(
+        engine, url, QQmlComponent.CompilationMode.PreferSynchronous
+    )
+    error = component.errorString().strip() if component.isError() else None
+    component.deleteLater()
+    return error
+
+
+def _write_manifest(qml_dir: Path, cache_dir: Path, names):
+    """Record names as compiled, keeping the entries of still-current files."""
+    current = check_cache(qml_dir, cache_dir)["hits"]
+    files = {}
+    for name in sorted(set(current) | set(names)):
+        try:
+            files[name] = _stamp(qml_dir / name)
+        except OSError:
+            continue
+    manifest = {"version": CACHE_VERSION, "qt_version": qVersion(), "files": files}
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_dir / MANIFEST_NAME, "w") as f:
+            json.dump(manifest, f, indent=2)
+    except IOError as e:
+        print(f"Error writing QML cache manifest: {e}")
+
+
+def precompile(engine, qml_dir: Path, cache_dir: Path, names=None) -> dict:
+    """Compile names (default: all QML files) and update the manifest.
+
+    Returns {"compiled": [...], "errors": {name: message}}.
+    """
+    names = qml_files(qml_dir) if names is None else names
+    compiled, errors = [], {}
+    for name in names:
+        error = _compile(engine, qml_dir, name)
+        if error:
+            errors[name] = error
+        else:
+            compiled.append(name)
+    _write_manifest(qml_dir, cache_dir, compiled)
+    return {"compiled": compiled, "errors": errors}
+
+
+def precompile_later(engine, qml_dir: Path, cache_dir: Path, names, done=None):
+    """Compile names one per event loop pass, then update the manifest.
+
+    Used after the first frame to warm the files a startup check missed,
+    without holding up input. done receives precompile()'s result dict.
+    """
+    pending = list(names)
+    result = {"compiled": [], "errors": {}}
+
+    def step():
+        if not pending:
+            _write_manifest(qml_dir, cache_dir, result["compiled"])
+            if done is not None:
+                done(result)
+            return
+        name = pending.pop(0)
+        error = _compile(engine, qml_dir, name)
+        if error:
+            result["errors"][name] = error
+        else:
+            result["compiled"].append(name)
+        QTimer.singleShot(0, step)
+
+    QTimer.singleShot(0, step)
@@ -0,0 +1,107 @@
+"""Widget manifests, read from each widget package without importing it.
+
+A widget package's __init__ declares MANIFEST:
+
+    name              enabled_widgets.toml key
+    qml               window file in qml/
+    visible_property  HubBackend property that shows the window
+    backend           "module:Class", imported when the widget is created
+    context_name      QML context property for the backend
+    cleanup           backend method to call on unload/quit (optional)
+    settings_key      settings name if it differs from name (optional)
+    requires          extra constructor arguments by service name (optional)
+    preload           "module:function" doing the backend's file reads
+                      (optional); see prepare_backend()
+    snapshot          backend method returning its displayable state
+                      (optional); see snapshots.py
+"""
+
+import importlib
+
+from .lazy import import_attr
+from .snapshots import read_snapshot
+
+# Load order of the widget windows
+WIDGET_PACKAGES = (
+    "weather",
+    "media",
+    "general_settings",
+    "todo",
+    "notes",
+    "pomodoro",
+    "launcher",
+    "system_monitor",
+    "network_monitor",
+    "battery",
+    "news",
+)
+
+
+def load_manifests() -> list[dict]:
+    manifests = []
+    for package in WIDGET_PACKAGES:
+        try:
+            module = importlib.import_module(f"{__package__}.{package}")
+        except ImportError as e:
+            print(f"Error loading widget package {package}: {e}")
+            continue
+        manifests.append(module.MANIFEST)
+    return manifests
+
+
+def settings_key(manifest: dict) -> str:
+    return manifest.get("settings_key", manifest["name"])
+
+
+def loaded_config(manifest: dict, settings_backend):
+    """Copy of the widget's config if already loaded, else None (UI thread)."""
+    if settings_backend is None:
+        return None
+    return settings_backend.copy_widget_config(settings_key(manifest))
+
+
+def prepare_backend(manifest: dict, settings_backend, config=None) -> dict:
+    """The parts of creating a backend that need no QObject (any thread).
+
+    Imports the backend module (and the libraries it pulls in), reads the
+    widget's stored config and runs the manifest's preload hook with it.
+    The config read only touches files; the settings store takes it over in
+    create_backend() on the UI thread, so several of these can run at once.
+    A config the settings backend already loaded is not read again: pass
+    loaded_config()'s copy as config instead.
+    The hook returns data for the backend's preloaded argument, or None.
+    The widget's last snapshot, if any, is read for its snapshot argument.
+    """
+    prepared = {"backend_cls": import_attr(manifest["backend"])}
+    key = settings_key(manifest)
+    if settings_backend is not None and not settings_backend.widget_config_loaded(key):
+        config = settings_backend.read_widget_config(key)
+        prepared["config"] = config
+    if manifest.get("preload"):
+        prepared["preloaded"] = import_attr(manifest["preload"])(config)
+    if manifest.get("snapshot"):
+        prepared["snapshot"] = read_snapshot(manifest["name"])
+    return prepared
+
+
+def create_backend(manifest: dict, settings_backend, services: dict, prepared=None):
+    """Construct the manifest's backend (UI thread), or None if it has none.
+
+    prepared is prepare_backend()'s result when it already ran elsewhere.
+    """
+    if manifest.get("backend") is None:
+        return None
+    if prepared is None:
+        prepared = prepare_backend(
+            manifest, settings_backend, loaded_config(manifest, settings_backend)
+        )
+    if "config" in prepared:
+        settings_backend.adopt_widget_config(
+            settings_key(manifest), prepared["config"]
+        )
+    kwargs = {name: services[name] for name in manifest.get("requires", ())}
+    if prepared.get("preloaded") is not None:
+        kwargs["preloaded"] = prepared["preloaded"]
+    if prepared.get("snapshot") is not None:
+        kwargs["snapshot"] = prepared["snapshot"]
+    return prepared["backend_cls"](settings_backend=settings_backend, **kwargs)
@@ -0,0 +1,89 @@
+from bisect import bisect_right
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QGuiApplication
+
+FALLBACK_AREA = (0, 0, 1920, 1080)
+
+
+class ScreenGeometryCache(QObject):
+    """Cached available geometry of every screen, as (left, top, right, bottom).
+
+    Follows QScreen add/remove and availableGeometryChanged. Lookups check
+    the last matched screen first, then binary-search screens by left edge.
+    Pass rects to use a fixed (fake) screen set, e.g. when running headless.
+    """
+
+    screensChanged = Signal()
+
+    def __init__(self, rects=None, parent=None):
+        super().__init__(parent)
+        self._areas: list[tuple[int, int, int, int]] = []
+        self._lefts: list[int] = []
+        self._last = None
+        self._app = None
+
+        if rects is not None:
+            self.set_rects(rects)
+            return
+
+        self._app = QGuiApplication.instance()
+        if self._app:
+            self._app.screenAdded.connect(self._on_screen_added)
+            self._app.screenRemoved.connect(self._refresh)
+            for screen in self._app.screens():
+                screen.availableGeometryChanged.connect(self._refresh)
+        self._refresh()
+
+    def _on_screen_added(self, screen):
+        screen.availableGeometryChanged.connect(self._refresh)
+        self._refresh()
+
+    def _refresh(self, *args):
+        """Re-read available geometry of all screens."""
+        rects = []
+        if self._app:
+            for screen in self._app.screens():
+                ag = screen.availableGeometry()
+                rects.append(
+                    (ag.x(), ag.y(), ag.x() + ag.width(), ag.y() + ag.height())
+                )
+        self.set_rects(rects)
+
+    def set_rects(self, rects):
+        """Replace the screen set with (left, top, right, bottom) rects."""
+        self._areas = sorted(tuple(r) for r in rects) or [FALLBACK_AREA]
+        self._lefts = [area[0] for area in self._areas]
+        self._last = None
+        self.screensChanged.emit()
+
+    @property
+    def areas(self) -> list[tuple[int, int, int, int]]:
+        return self._areas
+
+    @staticmethod
+    def _contains(area, px, py) -> bool:
+        return area[0] <= px < area[2] and area[1] <= py < area[3]
+
+    def area_for(self, x: int, y: int, w: int, h: int):
+        """Work area of the screen containing the widget's centre."""
+        px, py = x + w // 2, y + h // 2
+        last = self._last
+        if last is not None and self._contains(last, px, py):
+            return last
+
+        i = bisect_right(self._lefts, px) - 1
+        while i >= 0:
+            area = self._areas[i]
+            if self._contains(area, px, py):
+                self._last = area
+                return area
+            i -= 1
+
+        # Centre is off-screen: use the closest screen
+        def distance(area):
+            dx = max(area[0] - px, 0, px - area[2])
+            dy = max(area[1] - py, 0, py - area[3])
+            return dx * dx + dy * dy
+
+        return min(self._areas, key=distance)
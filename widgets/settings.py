@@ -1,9 +1,20 @@
 import copy
-import json
+import threading
+import time
 from pathlib import Path
 
 from PySide6.QtCore import QObject, Signal, Slot
-from PySide6.QtGui import QGuiApplication
+
+from .screen_geometry import ScreenGeometryCache
+from .snap_index import SnapIndex
+from .storage import SettingsWriter, create_store
+from .storage.migrations import (
+    SCHEMA_VERSION,
+    VERSION_KEY,
+    migrate,
+    migrate_items,
+    migrate_legacy_settings,
+)
 
 DEFAULT_LAYOUT = {
     "widgets": {
@@ -23,46 +34,56 @@ DEFAULT_WIDGET_CONFIGS: dict[str, dict] = {
 
 GEOMETRY_KEYS = {"x", "y", "width", "height", "visible"}
 
+# Marks a config that has not been read from the store yet
+_NOT_READ = object()
+
 
 class SettingsBackend(QObject):
+    # Global settings (hotkeys, snap); widgets have their own signals below
     settingsChanged = Signal()
+    widgetSettingChanged = Signal(str, str)
+    widgetGeometryChanged = Signal(str)
+    widgetVisibleChanged = Signal(str, bool)
+    prefetchFinished = Signal("QVariant")
+    _configPrefetched = Signal(str, "QVariant", float)
 
-    def __init__(self, parent=None):
+    def __init__(self, storage: str = "json", screens=None, parent=None):
         super().__init__(parent)
-        self._data_dir = Path(__file__).parent.parent / "data"
-        self._widgets_dir = self._data_dir / "widgets"
+        project_root = Path(__file__).parent.parent
+        self._data_dir = project_root / "data"
+        migrate_legacy_settings(project_root, self._data_dir)
+        self._writer = SettingsWriter(parent=self)
+        self._store = create_store(storage, self._data_dir, self._writer)
         self._layout = self._load_layout()
+        # Widget configs are loaded on first access (see _widget_config)
         self._widget_configs: dict[str, dict] = {}
-        self._load_all_widget_configs()
-        self._snap_registry: dict[str, tuple[int, int, int, int]] = {}
-        screen = QGuiApplication.primaryScreen()
-        if screen:
-            ag = screen.availableGeometry()
-            self._avail_x = ag.x()
-            self._avail_y = ag.y()
-            self._avail_r = ag.x() + ag.width()
-            self._avail_b = ag.y() + ag.height()
-        else:
-            self._avail_x = 0
-            self._avail_y = 0
-            self._avail_r = 1920
-            self._avail_b = 1080
+        self._load_stats = {"loaded": 0, "load_ms": 0.0, "prefetched": 0}
+        self._prefetch_ms = 0.0
+        self._configPrefetched.connect(self._on_config_prefetched)
+        self._snap_index = SnapIndex(margin=self.getSnapMargin())
+        self._screens = (
+            screens if screens is not None else ScreenGeometryCache(parent=self)
+        )
+
+    @property
+    def store(self):
+        """The storage engine, shared with ThemeProvider."""
+        return self._store
 
     # ── Layout I/O ──────────────────────────────────────────────────
 
     def _load_layout(self) -> dict:
-        """Load layout.json, merging with defaults."""
-        self._data_dir.mkdir(parents=True, exist_ok=True)
-        path = self._data_dir / "layout.json"
-        if path.exists():
-            try:
-                with open(path) as f:
-                    loaded = json.load(f)
-                return self._merge_layout_defaults(loaded)
-            except (json.JSONDecodeError, IOError):
-                pass
+        """Load the layout, migrating it and merging with defaults."""
+        loaded = self._store.load_layout()
+        if isinstance(loaded, dict):
+            migrated = migrate("layout", loaded)
+            result = self._merge_layout_defaults(loaded)
+            if migrated:
+                self._store.save_layout(result)
+            return result
         result = copy.deepcopy(DEFAULT_LAYOUT)
-        self._save_json(path, result)
+        result[VERSION_KEY] = SCHEMA_VERSION
+        self._store.save_layout(result)
         return result
 
     def _merge_layout_defaults(self, loaded: dict) -> dict:
@@ -77,52 +98,132 @@ class SettingsBackend(QObject):
             result["hotkeys"].update(loaded["hotkeys"])
         if "snap" in loaded:
             result["snap"].update(loaded["snap"])
+        result[VERSION_KEY] = loaded.get(VERSION_KEY, SCHEMA_VERSION)
         return result
 
     def _save_layout(self):
-        self._save_json(self._data_dir / "layout.json", self._layout)
+        self._store.save_layout(self._layout)
 
     # ── Per-widget config I/O ───────────────────────────────────────
 
-    def _load_all_widget_configs(self):
-        """Load all per-widget config files from data/widgets/."""
-        self._widgets_dir.mkdir(parents=True, exist_ok=True)
-        for path in self._widgets_dir.glob("*.json"):
-            name = path.stem
-            if name in ("layout", "theme"):
-                continue
-            self._widget_configs[name] = self._load_widget_config(name)
-
-    def _load_widget_config(self, widget_name: str) -> dict:
-        """Load a single widget config file, applying defaults."""
+    def _widget_config(self, widget_name: str) -> dict:
+        """Return a widget config, loading it on first access."""
+        config = self._widget_configs.get(widget_name)
+        if config is None:
+            start = time.perf_counter()
+            config = self._load_widget_config(widget_name)
+            self._widget_configs[widget_name] = config
+            self._load_stats["loaded"] += 1
+            self._load_stats["load_ms"] += (time.perf_counter() - start) * 1000
+        return config
+
+    def _load_widget_config(self, widget_name: str, loaded=_NOT_READ) -> dict:
+        """Load a single widget config, applying defaults and migrations."""
         defaults = DEFAULT_WIDGET_CONFIGS.get(widget_name, {})
-        path = self._widgets_dir / f"{widget_name}.json"
-        if path.exists():
-            try:
-                with open(path) as f:
-                    loaded = json.load(f)
-                result = copy.deepcopy(defaults)
-                result.update(loaded)
-                return result
-            except (json.JSONDecodeError, IOError):
-                pass
+        if loaded is _NOT_READ:
+            loaded = self._store.load_widget_config(widget_name)
         result = copy.deepcopy(defaults)
-        self._save_json(path, result)
+        if isinstance(loaded, dict):
+            result.update(loaded)
+        migrated = migrate(f"widget:{widget_name}", result)
+        if migrated or not isinstance(loaded, dict):
+            self._store.save_widget_config(widget_name, result)
         return result
 
-    def _save_widget_config(self, widget_name: str):
-        path = self._widgets_dir / f"{widget_name}.json"
-        self._save_json(path, self._widget_configs.get(widget_name, {}))
-
-    # ── Generic JSON helper ─────────────────────────────────────────
+    def _save_widget_config(self, widget_name: str, key=None):
+        self._store.save_widget_config(
+            widget_name, self._widget_configs.get(widget_name, {}), key
+        )
 
-    @staticmethod
-    def _save_json(path: Path, data: dict):
+    # ── Background prefetch ────────────────────────────────────────
+
+    @Slot("QVariantList")
+    def prefetchWidgetConfigs(self, widget_names):
+        """Parse configs of the given widgets on a background thread.
+
+        Meant to run after the first frame, so widgets shown later find their
+        config already in memory. Configs loaded in the meantime are kept.
+        """
+        names = [n for n in widget_names if n not in self._widget_configs]
+        if not names:
+            self.prefetchFinished.emit(self.getConfigLoadStats())
+            return
+
+        def run():
+            start = time.perf_counter()
+            for i, name in enumerate(names):
+                loaded = self.read_widget_config(name)
+                elapsed = (time.perf_counter() - start) * 1000
+                # Signal back to the UI thread; the last one carries the total
+                self._configPrefetched.emit(
+                    name, loaded, elapsed if i == len(names) - 1 else -1.0
+                )
+
+        threading.Thread(target=run, name="config-prefetch", daemon=True).start()
+
+    def read_widget_config(self, widget_name: str):
+        """Read a widget's stored config without applying it (any thread).
+
+        The store only reads files here; adopt_widget_config() hands the
+        result back to it on the UI thread.
+        """
         try:
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
-        except IOError as e:
-            print(f"Error saving {path}: {e}")
+            return self._store.read_widget_config(widget_name)
+        except Exception as e:
+            print(f"Error reading {widget_name} config: {e}")
+            return None
+
+    def widget_config_loaded(self, widget_name: str) -> bool:
+        return widget_name in self._widget_configs
+
+    def copy_widget_config(self, widget_name: str):
+        """A copy of a loaded widget config for another thread, or None."""
+        config = self._widget_configs.get(widget_name)
+        return copy.deepcopy(config) if config is not None else None
+
+    def adopt_widget_config(self, widget_name: str, loaded) -> bool:
+        """Apply a config from read_widget_config unless already loaded."""
+        if widget_name in self._widget_configs:
+            return False
+        loaded = self._store.adopt_widget_config(widget_name, loaded)
+        self._widget_configs[widget_name] = self._load_widget_config(
+            widget_name, loaded
+        )
+        self._load_stats["prefetched"] += 1
+        return True
+
+    def _on_config_prefetched(self, widget_name: str, loaded, elapsed_ms: float):
+        self.adopt_widget_config(widget_name, loaded)
+        if elapsed_ms >= 0:
+            self._prefetch_ms = elapsed_ms
+            self.prefetchFinished.emit(self.getConfigLoadStats())
+
+    @Slot(result="QVariant")
+    def getConfigLoadStats(self) -> dict:
+        """Get config load counters for startup timing logs.
+
+        loaded/load_ms: configs parsed on demand on the UI thread.
+        prefetched/prefetch_ms: configs parsed on the background thread.
+        deferred: stored configs not loaded yet (e.g. disabled widgets).
+        """
+        stored = set(self._store.widget_config_names())
+        return {
+            **self._load_stats,
+            "prefetch_ms": self._prefetch_ms,
+            "deferred": len(stored - set(self._widget_configs)),
+        }
+
+    # ── Public API: Persistence ────────────────────────────────────
+
+    @Slot()
+    def flush(self):
+        """Write all pending changes to disk now (connected to aboutToQuit)."""
+        self._writer.flush()
+
+    @Slot(result="QVariant")
+    def getPersistenceStats(self) -> dict:
+        """Get write counters: requested, flushes, written, pending."""
+        return self._writer.stats()
 
     # ── Public API: Widget geometry ─────────────────────────────────
 
@@ -146,11 +247,13 @@ class SettingsBackend(QObject):
         """Set widget geometry."""
         if widget_name not in self._layout["widgets"]:
             self._layout["widgets"][widget_name] = {"visible": False}
-        self._layout["widgets"][widget_name].update(
-            {"x": x, "y": y, "width": width, "height": height}
-        )
+        props = self._layout["widgets"][widget_name]
+        geometry = {"x": x, "y": y, "width": width, "height": height}
+        if all(props.get(k) == v for k, v in geometry.items()):
+            return
+        props.update(geometry)
         self._save_layout()
-        self.settingsChanged.emit()
+        self.widgetGeometryChanged.emit(widget_name)
 
     # ── Public API: Widget visibility ──────────────────────────────
 
@@ -171,27 +274,75 @@ class SettingsBackend(QObject):
                 "width": 300,
                 "height": 200,
             }
-        self._layout["widgets"][widget_name]["visible"] = visible
+        props = self._layout["widgets"][widget_name]
+        if props.get("visible") == visible:
+            return
+        props["visible"] = visible
         self._save_layout()
-        self.settingsChanged.emit()
+        self.widgetVisibleChanged.emit(widget_name, visible)
 
     # ── Public API: Per-widget settings ────────────────────────────
 
     @Slot(str, str, result="QVariant")
     def getWidgetSetting(self, widget_name: str, key: str):
         """Get a specific widget setting value."""
-        if widget_name not in self._widget_configs:
-            self._widget_configs[widget_name] = self._load_widget_config(widget_name)
-        return self._widget_configs[widget_name].get(key)
+        return self._widget_config(widget_name).get(key)
 
     @Slot(str, str, "QVariant")
     def setWidgetSetting(self, widget_name: str, key: str, value):
         """Set a specific widget setting value."""
-        if widget_name not in self._widget_configs:
-            self._widget_configs[widget_name] = self._load_widget_config(widget_name)
-        self._widget_configs[widget_name][key] = value
-        self._save_widget_config(widget_name)
-        self.settingsChanged.emit()
+        self._widget_config(widget_name)[key] = value
+        self._save_widget_config(widget_name, key)
+        self.widgetSettingChanged.emit(widget_name, key)
+
+    # ── Public API: Collections ────────────────────────────────────
+
+    def getCollection(self, widget_name: str, name: str) -> list:
+        """Load a collection (list of items with an "id"), stored per item.
+
+        A list still kept as one widget setting under the same name is moved
+        into the collection store on first access. Items stored at an older
+        schema version are upgraded by the widget's item migrations.
+        """
+        items = self._store.load_collection(widget_name, name)
+        if items is not None:
+            version = self._store.collection_version(widget_name, name)
+            if migrate_items(f"widget:{widget_name}", name, items, version):
+                for item in items:
+                    if isinstance(item, dict) and "id" in item:
+                        self._store.save_collection_item(widget_name, name, item)
+                self._store.save_collection_version(
+                    widget_name, name, SCHEMA_VERSION
+                )
+        config = self._widget_config(widget_name)
+        if name in config:
+            legacy = config.pop(name)
+            if items is None and isinstance(legacy, list):
+                items = [i for i in legacy if isinstance(i, dict) and "id" in i]
+                for item in items:
+                    self._store.save_collection_item(widget_name, name, item)
+                self._store.save_collection_order(
+                    widget_name, name, [item["id"] for item in items]
+                )
+                self._store.save_collection_version(
+                    widget_name, name, SCHEMA_VERSION
+                )
+            self._save_widget_config(widget_name)
+        return items if items is not None else []
+
+    def setCollectionItem(self, widget_name: str, name: str, item: dict):
+        """Save one item of a collection (inserted or updated by id)."""
+        self._store.save_collection_item(widget_name, name, item)
+        self.widgetSettingChanged.emit(widget_name, name)
+
+    def removeCollectionItem(self, widget_name: str, name: str, item_id: str):
+        self._store.remove_collection_item(widget_name, name, item_id)
+        self.widgetSettingChanged.emit(widget_name, name)
+
+    def setCollectionOrder(self, widget_name: str, name: str, ids: list):
+        """Save the item order of a collection whose order is positional."""
+        self._store.save_collection_order(widget_name, name, ids)
+        self.widgetSettingChanged.emit(widget_name, name)
 
     # ── Public API: Hotkeys ────────────────────────────────────────
 
@@ -228,6 +379,7 @@ class SettingsBackend(QObject):
         if "snap" not in self._layout:
             self._layout["snap"] = {}
         self._layout["snap"]["margin"] = value
+        self._snap_index.set_margin(value)
         self._save_layout()
         self.settingsChanged.emit()
 
@@ -235,11 +387,34 @@ class SettingsBackend(QObject):
 
     @Slot(str, int, int, int, int)
     def updatePosition(self, widget_name: str, x: int, y: int, w: int, h: int):
-        self._snap_registry[widget_name] = (x, y, w, h)
+        self._snap_index.update(widget_name, x, y, w, h)
 
     @Slot(str)
     def unregister(self, widget_name: str):
-        self._snap_registry.pop(widget_name, None)
+        self._snap_index.remove(widget_name)
+
+    def _work_area(self, x: int, y: int, w: int, h: int):
+        """Available geometry of the screen the widget is on."""
+        return self._screens.area_for(x, y, w, h)
+
+    # ── Drag sessions ──────────────────────────────────────────────
+
+    @Slot(str, result="QVariant")
+    def beginDrag(self, name: str) -> dict:
+        """Get the snap-target table for a drag or resize of one widget.
+
+        QML resolves snaps against this table locally while the mouse moves,
+        then calls endDrag once with the final geometry.
+        """
+        table = self._snap_index.drag_table(name, self._screens.areas)
+        table["enabled"] = self._layout.get("snap", {}).get("enabled", True)
+        return table
+
+    @Slot(str, int, int, int, int)
+    def endDrag(self, name: str, x: int, y: int, w: int, h: int):
+        """Commit the final geometry of a drag session."""
+        self._snap_index.update(name, x, y, w, h)
+        self.setWidgetGeometry(name, x, y, w, h)
 
     # ── Snap: move ─────────────────────────────────────────────────
 
@@ -247,49 +422,8 @@ class SettingsBackend(QObject):
     def getSnapPosition(self, name: str, x: int, y: int, w: int, h: int) -> list:
         if not self._layout.get("snap", {}).get("enabled", True):
             return [x, y]
-        threshold = 12
-        margin = self._layout.get("snap", {}).get("margin", 0)
-        al, at = self._avail_x + margin, self._avail_y + margin
-        ar, ab = self._avail_r - margin, self._avail_b - margin
-
-        snap_x, snap_y = x, y
-        best_dx, best_dy = threshold + 1, threshold + 1
-
-        for other_name, (ox, oy, ow, oh) in self._snap_registry.items():
-            if other_name == name:
-                continue
-            for delta, candidate in [
-                ((x + w) - (ox - margin), ox - margin - w),
-                (x - (ox + ow + margin), ox + ow + margin),
-                (x - ox, ox),
-                ((x + w) - (ox + ow), ox + ow - w),
-            ]:
-                if abs(delta) < best_dx:
-                    best_dx, snap_x = abs(delta), candidate
-            for delta, candidate in [
-                ((y + h) - (oy - margin), oy - margin - h),
-                (y - (oy + oh + margin), oy + oh + margin),
-                (y - oy, oy),
-                ((y + h) - (oy + oh), oy + oh - h),
-            ]:
-                if abs(delta) < best_dy:
-                    best_dy, snap_y = abs(delta), candidate
-
-        for delta, candidate in [
-            (x - al, al),
-            ((x + w) - ar, ar - w),
-        ]:
-            if abs(delta) < best_dx:
-                best_dx, snap_x = abs(delta), candidate
-
-        for delta, candidate in [
-            (y - at, at),
-            ((y + h) - ab, ab - h),
-        ]:
-            if abs(delta) < best_dy:
-                best_dy, snap_y = abs(delta), candidate
-
-        return [snap_x, snap_y]
+        area = self._work_area(x, y, w, h)
+        return list(self._snap_index.snap_position(name, x, y, w, h, area))
 
     # ── Snap: resize ───────────────────────────────────────────────
 
@@ -297,36 +431,5 @@ class SettingsBackend(QObject):
     def getSnapSize(self, name: str, x: int, y: int, w: int, h: int) -> list:
         if not self._layout.get("snap", {}).get("enabled", True):
             return [w, h]
-        threshold = 12
-        margin = self._layout.get("snap", {}).get("margin", 0)
-        ar = self._avail_r - margin
-        ab = self._avail_b - margin
-
-        snap_w, snap_h = w, h
-        best_dw, best_dh = threshold + 1, threshold + 1
-
-        for other_name, (ox, oy, ow, oh) in self._snap_registry.items():
-            if other_name == name:
-                continue
-            for delta, candidate in [
-                ((x + w) - (ox - margin), ox - margin - x),
-                ((x + w) - (ox + ow), ox + ow - x),
-            ]:
-                if abs(delta) < best_dw:
-                    best_dw, snap_w = abs(delta), candidate
-            for delta, candidate in [
-                ((y + h) - (oy - margin), oy - margin - y),
-                ((y + h) - (oy + oh), oy + oh - y),
-            ]:
-                if abs(delta) < best_dh:
-                    best_dh, snap_h = abs(delta), candidate
-
-        delta = (x + w) - ar
-        if abs(delta) < best_dw:
-            best_dw, snap_w = abs(delta), ar - x
-
-        delta = (y + h) - ab
-        if abs(delta) < best_dh:
-            best_dh, snap_h = abs(delta), ab - y
-
-        return [snap_w, snap_h]
+        area = self._work_area(x, y, w, h)
+        return list(self._snap_index.snap_size(name, x, y, w, h, area))
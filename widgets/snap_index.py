@@ -0,0 +1,188 @@
+"""Sorted edge index for window snapping."""
+
+from bisect import bisect_left, insort
+
+SNAP_THRESHOLD = 12
+
+
+class SnapIndex:
+    """Keeps the snap targets of all registered widgets in sorted arrays.
+
+    For every other widget there are two targets per dragged edge:
+
+    - left:   other.right + margin (sit beside it), other.left (align)
+    - right:  other.left - margin (sit beside it), other.right (align)
+    - top:    other.bottom + margin, other.top
+    - bottom: other.top - margin, other.bottom
+
+    Each array holds (value, name) tuples, so a query is a binary search
+    around the dragged edge, scanning outwards only within the threshold.
+    """
+
+    def __init__(self, margin: int = 0, threshold: int = SNAP_THRESHOLD):
+        self._margin = margin
+        self._threshold = threshold
+        self._rects: dict[str, tuple[int, int, int, int]] = {}
+        self._left: list[tuple[int, str]] = []
+        self._right: list[tuple[int, str]] = []
+        self._top: list[tuple[int, str]] = []
+        self._bottom: list[tuple[int, str]] = []
+
+    @property
+    def margin(self) -> int:
+        return self._margin
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    @property
+    def rects(self) -> dict[str, tuple[int, int, int, int]]:
+        return self._rects
+
+    # ── Maintenance ────────────────────────────────────────────────
+
+    def _targets(self, rect):
+        x, y, w, h = rect
+        m = self._margin
+        return (
+            (x + w + m, x),  # left
+            (x - m, x + w),  # right
+            (y + h + m, y),  # top
+            (y - m, y + h),  # bottom
+        )
+
+    def _arrays(self):
+        return (self._left, self._right, self._top, self._bottom)
+
+    def _insert(self, name: str, rect):
+        for array, values in zip(self._arrays(), self._targets(rect)):
+            for value in values:
+                insort(array, (value, name))
+
+    def _delete(self, name: str, rect):
+        for array, values in zip(self._arrays(), self._targets(rect)):
+            for value in values:
+                i = bisect_left(array, (value, name))
+                if i < len(array) and array[i] == (value, name):
+                    del array[i]
+
+    def update(self, name: str, x: int, y: int, w: int, h: int):
+        """Register or move a widget."""
+        rect = (x, y, w, h)
+        old = self._rects.get(name)
+        if old == rect:
+            return
+        if old is not None:
+            self._delete(name, old)
+        self._rects[name] = rect
+        self._insert(name, rect)
+
+    def remove(self, name: str):
+        """Unregister a widget."""
+        old = self._rects.pop(name, None)
+        if old is not None:
+            self._delete(name, old)
+
+    def set_margin(self, margin: int):
+        """Change the gap between snapped widgets, rebuilding all targets."""
+        if margin == self._margin:
+            return
+        self._margin = margin
+        for array in self._arrays():
+            array.clear()
+        for name, rect in self._rects.items():
+            self._insert(name, rect)
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    def _nearest(self, array, value: int, exclude: str):
+        """Return (distance, target) of the closest target within threshold."""
+        threshold = self._threshold
+        i = bisect_left(array, (value,))
+        best = None
+
+        j = i - 1
+        while j >= 0 and value - array[j][0] <= threshold:
+            if array[j][1] != exclude:
+                best = (value - array[j][0], array[j][0])
+                break
+            j -= 1
+
+        j = i
+        n = len(array)
+        while j < n and array[j][0] - value <= threshold:
+            if array[j][1] != exclude:
+                if best is None or array[j][0] - value < best[0]:
+                    best = (array[j][0] - value, array[j][0])
+                break
+            j += 1
+        return best
+
+    def snap_position(self, name, x, y, w, h, area):
+        """Snap a moving widget; area is the (left, top, right, bottom) work area."""
+        al, at, ar, ab = area
+        m = self._margin
+        al, at, ar, ab = al + m, at + m, ar - m, ab - m
+
+        best_dx, snap_x = self._threshold + 1, x
+        hit = self._nearest(self._left, x, name)
+        if hit and hit[0] < best_dx:
+            best_dx, snap_x = hit[0], hit[1]
+        hit = self._nearest(self._right, x + w, name)
+        if hit and hit[0] < best_dx:
+            best_dx, snap_x = hit[0], hit[1] - w
+        for delta, candidate in ((x - al, al), ((x + w) - ar, ar - w)):
+            if abs(delta) < best_dx:
+                best_dx, snap_x = abs(delta), candidate
+
+        best_dy, snap_y = self._threshold + 1, y
+        hit = self._nearest(self._top, y, name)
+        if hit and hit[0] < best_dy:
+            best_dy, snap_y = hit[0], hit[1]
+        hit = self._nearest(self._bottom, y + h, name)
+        if hit and hit[0] < best_dy:
+            best_dy, snap_y = hit[0], hit[1] - h
+        for delta, candidate in ((y - at, at), ((y + h) - ab, ab - h)):
+            if abs(delta) < best_dy:
+                best_dy, snap_y = abs(delta), candidate
+
+        return snap_x, snap_y
+
+    def snap_size(self, name, x, y, w, h, area):
+        """Snap the bottom-right corner of a resizing widget."""
+        _, _, ar, ab = area
+        ar -= self._margin
+        ab -= self._margin
+
+        best_dw, snap_w = self._threshold + 1, w
+        hit = self._nearest(self._right, x + w, name)
+        if hit and hit[0] < best_dw:
+            best_dw, snap_w = hit[0], hit[1] - x
+        if abs((x + w) - ar) < best_dw:
+            snap_w = ar - x
+
+        best_dh, snap_h = self._threshold + 1, h
+        hit = self._nearest(self._bottom, y + h, name)
+        if hit and hit[0] < best_dh:
+            best_dh, snap_h = hit[0], hit[1] - y
+        if abs((y + h) - ab) < best_dh:
+            snap_h = ab - y
+
+        return snap_w, snap_h
+
+    def drag_table(self, name: str, areas) -> dict:
+        """Snap targets for one dragged widget, for resolving snaps in QML.
+
+        The table holds plain sorted value lists with the widget's own edges
+        removed, plus the margin-adjusted work area of every screen.
+        """
+        m = self._margin
+        return {
+            "threshold": self._threshold,
+            "left": [v for v, n in self._left if n != name],
+            "right": [v for v, n in self._right if n != name],
+            "top": [v for v, n in self._top if n != name],
+            "bottom": [v for v, n in self._bottom if n != name],
+            "areas": [[al + m, at + m, ar - m, ab - m] for al, at, ar, ab in areas],
+        }
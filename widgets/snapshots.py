@@ -0,0 +1,43 @@
+"""Last displayable state of widget backends, shown before the first refresh.
+
+A backend whose manifest names a snapshot method returns a small dict of
+what its window shows (the last forecast, articles, graph history...).
+WidgetHost writes it to data/snapshots/<name>.json periodically, when the
+widget is unloaded and on quit. prepare_backend() reads it back, and the
+backend restores it in its constructor so the first frame shows real data.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = Path(__file__).parent.parent / "data" / "snapshots"
+
+
+def read_snapshot(name: str, snapshot_dir: Path = SNAPSHOT_DIR):
+    """The state last written for name, or None."""
+    try:
+        with open(snapshot_dir / f"{name}.json", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return None
+    state = data.get("state")
+    return state if isinstance(state, dict) else None
+
+
+def write_snapshot(name: str, state: dict, snapshot_dir: Path = SNAPSHOT_DIR):
+    """Replace name's snapshot; the old one survives a failed write."""
+    data = {"version": SNAPSHOT_VERSION, "saved_at": time.time(), "state": state}
+    path = snapshot_dir / f"{name}.json"
+    tmp = path.with_suffix(".tmp")
+    try:
+        text = json.dumps(data, separators=(",", ":"))
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except (IOError, TypeError, ValueError) as e:
+        print(f"Error writing {name} snapshot: {e}")
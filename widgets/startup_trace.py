@@ -0,0 +1,158 @@
+"""Startup spans recorded in the Chrome trace event format.
+
+The file written by save() opens in chrome://tracing or ui.perfetto.dev.
+Spans on the same thread nest by time, so a backend's __init__ shows the
+imports it triggered underneath it.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+
+
+class _ImportTracer(MetaPathFinder):
+    """Times each module's execution by wrapping its loader."""
+
+    def __init__(self, tracer):
+        self._tracer = tracer
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TracedLoader(spec.loader, self._tracer)
+                return spec
+        return None
+
+
+class _TracedLoader:
+    def __init__(self, loader, tracer):
+        self._loader = loader
+        self._tracer = tracer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Leave the real loader on the module for importlib.resources etc.
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._tracer.span(module.__name__, "import"):
+            self._loader.exec_module(module)
+
+
+class StartupTracer:
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._events: list[dict] = []
+        self._thread_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._import_tracer = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start) * 1000
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._start) * 1e6
+
+    def _add(self, event: dict):
+        event["pid"] = os.getpid()
+        event["tid"] = threading.get_ident()
+        with self._lock:
+            self._events.append(event)
+            if event["tid"] not in self._thread_names:
+                self._thread_names[event["tid"]] = threading.current_thread().name
+
+    @contextmanager
+    def span(self, name: str, category: str = "startup", **args):
+        """Record the enclosed block as one complete ("X") event."""
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            event = {"name": name, "cat": category, "ph": "X", "ts": start}
+            event["dur"] = self._now_us() - start
+            if args:
+                event["args"] = args
+            self._add(event)
+
+    def instant(self, name: str, category: str = "startup", **args):
+        event = {"name": name, "cat": category, "ph": "i", "s": "p"}
+        event["ts"] = self._now_us()
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def begin(self, name: str, category: str = "startup"):
+        """Start an async span, for work that ends in a later callback."""
+        event = {"name": name, "cat": category, "ph": "b", "id": name}
+        event["ts"] = self._now_us()
+        self._add(event)
+
+    def end(self, name: str, category: str = "startup"):
+        event = {"name": name, "cat": category, "ph": "e", "id": name}
+        event["ts"] = self._now_us()
+        self._add(event)
+
+    def mark(self, label: str):
+        """Print a timestamped startup log line and record it as an instant."""
+        print(f"[{self.elapsed_ms():7.1f}ms] {label}")
+        self.instant(label, "log")
+
+    def trace_imports(self):
+        """Record a span for every module imported from now on."""
+        if self._import_tracer is None:
+            self._import_tracer = _ImportTracer(self)
+            sys.meta_path.insert(0, self._import_tracer)
+
+    def stop_imports(self):
+        if self._import_tracer is not None:
+            sys.meta_path.remove(self._import_tracer)
+            self._import_tracer = None
+
+    def watch_first_frame(self, window, name: str):
+        """Record when window first swaps a frame."""
+
+        def on_frame_swapped():
+            window.frameSwapped.disconnect(on_frame_swapped)
+            self.instant(f"{name} first frame", "frame")
+
+        window.frameSwapped.connect(on_frame_swapped)
+
+    def save(self, path: Path):
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._thread_names)
+        pid = os.getpid()
+        for tid, name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        except IOError as e:
+            print(f"Error writing startup trace: {e}")
+
+
+# Started when this module is first imported (main.py imports it first)
+tracer = StartupTracer()
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from .journal_store import JournalStore
+from .json_store import JsonStore
+from .sqlite_store import SqliteStore
+from .writer import SettingsWriter
+
+STORES = {
+    "json": JsonStore,
+    "journal": JournalStore,
+    "sqlite": SqliteStore,
+}
+
+
+def create_store(kind: str, data_dir: Path, writer: SettingsWriter):
+    """Create the storage engine named in enabled_widgets.toml [settings]."""
+    store_cls = STORES.get(kind)
+    if store_cls is None:
+        print(f"Unknown settings storage '{kind}', falling back to json")
+        store_cls = JsonStore
+    return store_cls(data_dir, writer)
+
+
+__all__ = [
+    "JournalStore",
+    "JsonStore",
+    "SettingsWriter",
+    "SqliteStore",
+    "create_store",
+]
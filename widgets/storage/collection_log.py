@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+from .migrations import VERSION_KEY
+from .writer import append_text, write_text_atomic
+
+DEFAULT_COMPACT_THRESHOLD = 256 * 1024
+
+
+class CollectionLog:
+    """One collection (e.g. notes) as an append-only file of item records.
+
+    Lines are {"id": id, "v": item} (insert/update), {"id": id, "del": 1},
+    {"order": [ids]} and {"schema_version": n}, the version the items were
+    written at; the last record per id wins, so changing one item appends
+    one line. Once the file is past compact_threshold and more than
+    half of it is superseded records, it is rewritten with live records only.
+    """
+
+    def __init__(
+        self, path: Path, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD
+    ):
+        self._path = path
+        self._compact_threshold = compact_threshold
+        # Last record line per live item, kept for compaction
+        self._lines: dict[str, str] = {}
+        self._order_line = ""
+        self._version = 0
+        self._version_line = ""
+        self._size = 0
+        self._live = 0
+        self._loaded = False
+        self._pending: dict[str, object] = {}
+        self._pending_order = None
+        self._pending_version = None
+
+    @property
+    def version(self) -> int:
+        """Schema version of the stored items (0 if never recorded)."""
+        return self._version
+
+    def load(self):
+        """Read the items in stored order, or None if the file is missing."""
+        self._loaded = True
+        if not self._path.exists():
+            return None
+        items: dict[str, dict] = {}
+        order = None
+        try:
+            with open(self._path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn tail from a crash mid-append
+                    if VERSION_KEY in record:
+                        self._version = record[VERSION_KEY]
+                        self._version_line = line
+                    elif "order" in record:
+                        order = record["order"]
+                        self._order_line = line
+                    elif record.get("del"):
+                        items.pop(record["id"], None)
+                        self._lines.pop(record["id"], None)
+                    else:
+                        items[record["id"]] = record["v"]
+                        self._lines[record["id"]] = line
+            self._size = self._path.stat().st_size
+        except (IOError, OSError) as e:
+            print(f"Error reading {self._path}: {e}")
+        self._live = sum(map(len, self._lines.values())) + len(self._order_line)
+        self._live += len(self._version_line)
+
+        if order is None:
+            return list(items.values())
+        result = [items.pop(item_id) for item_id in order if item_id in items]
+        result.extend(items.values())
+        return result
+
+    def put(self, item: dict):
+        self._pending[item["id"]] = item
+
+    def remove(self, item_id: str):
+        self._pending[item_id] = None
+
+    def set_order(self, ids: list[str]):
+        self._pending_order = list(ids)
+
+    def set_version(self, version: int):
+        self._version = version
+        self._pending_version = version
+
+    def take_pending(self):
+        """Serialise pending changes into one writer job, or return None."""
+        if (
+            not self._pending
+            and self._pending_order is None
+            and self._pending_version is None
+        ):
+            return None
+        pending, self._pending = self._pending, {}
+        lines = []
+        for item_id, item in pending.items():
+            old = self._lines.pop(item_id, "")
+            self._live -= len(old)
+            if item is None:
+                if old:
+                    lines.append(json.dumps({"id": item_id, "del": 1}) + "\n")
+                continue
+            line = json.dumps({"id": item_id, "v": item}) + "\n"
+            self._lines[item_id] = line
+            self._live += len(line)
+            lines.append(line)
+        if self._pending_order is not None:
+            self._live -= len(self._order_line)
+            self._order_line = json.dumps({"order": self._pending_order}) + "\n"
+            self._live += len(self._order_line)
+            self._pending_order = None
+            lines.append(self._order_line)
+        if self._pending_version is not None:
+            self._live -= len(self._version_line)
+            self._version_line = json.dumps({VERSION_KEY: self._pending_version})
+            self._version_line += "\n"
+            self._live += len(self._version_line)
+            self._pending_version = None
+            lines.append(self._version_line)
+
+        path = self._path
+        text = "".join(lines)
+        self._size += len(text)
+        # Compaction rewrites from _lines, so only once the file was read
+        compact = self._size > self._compact_threshold and self._size > 2 * self._live
+        if compact and self._loaded:
+            text = "".join(self._lines.values()) + self._order_line
+            text += self._version_line
+            self._size = len(text)
+            return lambda: write_text_atomic(path, text)
+        return lambda: append_text(path, text)
@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+
+from .json_store import JsonStore
+from .writer import SettingsWriter, append_text, write_json_atomic
+
+DEFAULT_COMPACT_THRESHOLD = 256 * 1024
+
+
+def _compact(snapshot_path: Path, journal_path: Path, text: str):
+    write_json_atomic(snapshot_path, text)
+    try:
+        journal_path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Error removing {journal_path}: {e}")
+
+
+class JournalStore(JsonStore):
+    """Append-only storage for per-widget configs.
+
+    Each setWidgetSetting appends one {"k": key, "v": value} line to
+    data/widgets/<name>.journal, so write cost follows the size of the change.
+    Loading reads <name>.json and replays the journal on top. Once a journal
+    grows past compact_threshold bytes, the snapshot is rewritten and the
+    journal dropped. Layout writes stay whole-file (layout.json is small).
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        writer: SettingsWriter,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+    ):
+        super().__init__(data_dir, writer)
+        self._compact_threshold = compact_threshold
+        self._configs: dict[str, dict] = {}
+        self._journal_sizes: dict[str, int] = {}
+        self._pending: dict[str, dict] = {}
+        self._needs_compact: set[str] = set()
+        writer.add_flush_hook(self._flush_pending)
+
+    def adopt_widget_config(self, widget_name: str, loaded):
+        """Record the journal's size and compact it if due (UI thread).
+
+        Compaction is queued on the writer after any appends queued so far.
+        """
+        journal = self._journal_path(widget_name)
+        if journal.exists():
+            loaded = loaded if isinstance(loaded, dict) else {}
+            try:
+                size = journal.stat().st_size
+            except OSError:
+                size = 0
+            if size > self._compact_threshold:
+                text = json.dumps(loaded)
+                snapshot = self._widget_path(widget_name)
+                self._writer.enqueue(lambda: _compact(snapshot, journal, text))
+                size = 0
+            self._journal_sizes[widget_name] = size
+        return loaded
+
+    def save_widget_config(self, widget_name: str, config: dict, key=None):
+        self._configs[widget_name] = config
+        if key is None:
+            # Whole-config save (e.g. defaults for a new widget): compact
+            self._needs_compact.add(widget_name)
+        else:
+            self._pending.setdefault(widget_name, {})[key] = config.get(key)
+        self._writer.touch()
+
+    def _flush_pending(self):
+        """Flush hook: turn pending keys into appends, compacting if due."""
+        pending, self._pending = self._pending, {}
+        for widget_name, changes in pending.items():
+            text = "".join(
+                json.dumps({"k": k, "v": v}) + "\n" for k, v in changes.items()
+            )
+            journal = self._journal_path(widget_name)
+            self._writer.enqueue(lambda p=journal, t=text: append_text(p, t))
+            size = self._journal_sizes.get(widget_name, 0) + len(text)
+            self._journal_sizes[widget_name] = size
+            if size > self._compact_threshold:
+                self._needs_compact.add(widget_name)
+
+        needs_compact, self._needs_compact = self._needs_compact, set()
+        for widget_name in needs_compact:
+            config = self._configs.get(widget_name)
+            if config is None:
+                continue
+            text = json.dumps(config)
+            snapshot = self._widget_path(widget_name)
+            journal = self._journal_path(widget_name)
+            self._writer.enqueue(
+                lambda s=snapshot, j=journal, t=text: _compact(s, j, t)
+            )
+            self._journal_sizes[widget_name] = 0
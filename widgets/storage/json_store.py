@@ -0,0 +1,169 @@
+import json
+from pathlib import Path
+
+from .collection_log import CollectionLog
+from .writer import SettingsWriter, write_json_atomic
+
+
+def read_json(path: Path):
+    """Read a JSON file, returning None if it is missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
+
+
+def replay_journal(path: Path, config: dict) -> int:
+    """Apply key/value records from a journal file onto config.
+
+    Returns the number of records applied. A torn record at the tail (from a
+    crash mid-append) ends the replay.
+    """
+    if not path.exists():
+        return 0
+    applied = 0
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                config[record["k"]] = record["v"]
+                applied += 1
+    except IOError as e:
+        print(f"Error reading journal {path}: {e}")
+    return applied
+
+
+class JsonStore:
+    """Whole-file JSON storage: data/layout.json + data/widgets/<name>.json.
+
+    Collections (notes, todos, shortcuts) are kept apart from the widget
+    configs, one record per item in data/collections/<widget>/<name>.jsonl.
+    """
+
+    def __init__(self, data_dir: Path, writer: SettingsWriter):
+        self._data_dir = data_dir
+        self._widgets_dir = data_dir / "widgets"
+        self._collections_dir = data_dir / "collections"
+        self._writer = writer
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+        self._widgets_dir.mkdir(parents=True, exist_ok=True)
+        self._collections: dict[tuple[str, str], CollectionLog] = {}
+        writer.add_flush_hook(self._flush_collections)
+
+    def _widget_path(self, widget_name: str) -> Path:
+        return self._widgets_dir / f"{widget_name}.json"
+
+    def _journal_path(self, widget_name: str) -> Path:
+        return self._widgets_dir / f"{widget_name}.journal"
+
+    # ── Layout ──────────────────────────────────────────────────────
+
+    def load_layout(self):
+        return read_json(self._data_dir / "layout.json")
+
+    def save_layout(self, layout: dict):
+        self._writer.schedule(self._data_dir / "layout.json", layout)
+
+    # ── Per-widget configs ──────────────────────────────────────────
+
+    def widget_config_names(self) -> list[str]:
+        return [
+            path.stem
+            for path in self._widgets_dir.glob("*.json")
+            if path.stem not in ("layout", "theme")
+        ]
+
+    def load_widget_config(self, widget_name: str):
+        return self.adopt_widget_config(
+            widget_name, self.read_widget_config(widget_name)
+        )
+
+    def read_widget_config(self, widget_name: str):
+        """Read a widget config, replaying any journal (any thread).
+
+        Only reads files; the store's own state is left to
+        adopt_widget_config() on the UI thread.
+        """
+        loaded = read_json(self._widget_path(widget_name))
+        journal = self._journal_path(widget_name)
+        if journal.exists():
+            loaded = loaded if isinstance(loaded, dict) else {}
+            replay_journal(journal, loaded)
+        return loaded
+
+    def adopt_widget_config(self, widget_name: str, loaded):
+        """Take a read_widget_config() result (UI thread), returning it.
+
+        Folds a journal left by journal mode into the snapshot.
+        """
+        path = self._widget_path(widget_name)
+        journal = self._journal_path(widget_name)
+        if journal.exists():
+            text = json.dumps(loaded if isinstance(loaded, dict) else {})
+            self._writer.enqueue(lambda: write_json_atomic(path, text))
+            self._writer.enqueue(lambda: journal.unlink(missing_ok=True))
+        return loaded
+
+    def save_widget_config(self, widget_name: str, config: dict, key=None):
+        """Persist a widget config. key names the changed entry, if known."""
+        self._writer.schedule(self._widget_path(widget_name), config)
+
+    # ── Collections ─────────────────────────────────────────────────
+
+    def _collection(self, widget_name: str, name: str) -> CollectionLog:
+        log = self._collections.get((widget_name, name))
+        if log is None:
+            path = self._collections_dir / widget_name / f"{name}.jsonl"
+            log = CollectionLog(path)
+            self._collections[(widget_name, name)] = log
+        return log
+
+    def load_collection(self, widget_name: str, name: str):
+        """Load a collection as a list of items, or None if never saved."""
+        return self._collection(widget_name, name).load()
+
+    def save_collection_item(self, widget_name: str, name: str, item: dict):
+        """Insert or update one item, keyed by item["id"]."""
+        self._collection(widget_name, name).put(item)
+        self._writer.touch()
+
+    def remove_collection_item(self, widget_name: str, name: str, item_id: str):
+        self._collection(widget_name, name).remove(item_id)
+        self._writer.touch()
+
+    def save_collection_order(self, widget_name: str, name: str, ids: list[str]):
+        self._collection(widget_name, name).set_order(ids)
+        self._writer.touch()
+
+    def collection_version(self, widget_name: str, name: str) -> int:
+        """Schema version a loaded collection was stored at (0 if unknown)."""
+        return self._collection(widget_name, name).version
+
+    def save_collection_version(self, widget_name: str, name: str, version: int):
+        self._collection(widget_name, name).set_version(version)
+        self._writer.touch()
+
+    def _flush_collections(self):
+        """Flush hook: queue one append (or compaction) per changed collection."""
+        for log in self._collections.values():
+            job = log.take_pending()
+            if job is not None:
+                self._writer.enqueue(job)
+
+    # ── Theme ───────────────────────────────────────────────────────
+
+    def theme_file(self):
+        """The file the theme is saved in, for hot reload."""
+        return self._data_dir / "theme.json"
+
+    def load_theme(self):
+        return read_json(self.theme_file())
+
+    def save_theme(self, theme: dict):
+        self._writer.schedule(self.theme_file(), theme)
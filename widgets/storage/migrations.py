@@ -0,0 +1,189 @@
+"""Versioned settings schema and the ordered registry of migration steps.
+
+Every data dict (layout, theme, each widget config) carries a
+"schema_version" field. migrate() upgrades a dict in place by running the
+registered steps newer than its version, in order. Steps that touch big
+lists (notes, todos, shortcuts) are registered per item and run item by
+item on the existing list. A dict at the current version costs one lookup.
+
+Collections stored per item (see collection_log.py) record the version
+they were written at; migrate_items() runs the same per-item steps on a
+collection stored at an older version.
+"""
+
+import json
+import uuid
+from pathlib import Path
+
+from .writer import write_json_atomic
+
+VERSION_KEY = "schema_version"
+SCHEMA_VERSION = 2
+
+GEOMETRY_KEYS = {"x", "y", "width", "height", "visible"}
+
+# kind -> [(version, step)], kept sorted by version. Kinds are "layout",
+# "theme" and "widget:<name>".
+_STEPS: dict[str, list] = {}
+# (kind, field) -> [(version, step)] for per-item steps, sorted by version
+_ITEM_STEPS: dict[tuple[str, str], list] = {}
+
+
+def migration(version: int, kind: str):
+    """Register step(data) that upgrades a whole dict of one kind to version."""
+
+    def register(step):
+        steps = _STEPS.setdefault(kind, [])
+        steps.append((version, step))
+        steps.sort(key=lambda s: s[0])
+        return step
+
+    return register
+
+
+def item_migration(version: int, kind: str, field: str):
+    """Register step(item, index) that upgrades each item of a list field.
+
+    The step also upgrades the collection named field (see migrate_items).
+    """
+
+    def register(step):
+        steps = _ITEM_STEPS.setdefault((kind, field), [])
+        steps.append((version, step))
+        steps.sort(key=lambda s: s[0])
+
+        def run(data):
+            items = data.get(field)
+            if not isinstance(items, list):
+                return
+            for i, item in enumerate(items):
+                if isinstance(item, dict):
+                    step(item, i)
+
+        migration(version, kind)(run)
+        return step
+
+    return register
+
+
+def needs_migration(data: dict) -> bool:
+    return data.get(VERSION_KEY, 0) < SCHEMA_VERSION
+
+
+def migrate(kind: str, data: dict) -> bool:
+    """Upgrade data in place to SCHEMA_VERSION; return True if it changed."""
+    version = data.get(VERSION_KEY, 0)
+    if version >= SCHEMA_VERSION:
+        return False
+    for step_version, step in _STEPS.get(kind, ()):
+        if version < step_version:
+            step(data)
+    data[VERSION_KEY] = SCHEMA_VERSION
+    return True
+
+
+def migrate_items(kind: str, field: str, items: list, version: int) -> bool:
+    """Upgrade a collection stored at version in place; True if it was older."""
+    if version >= SCHEMA_VERSION:
+        return False
+    for step_version, step in _ITEM_STEPS.get((kind, field), ()):
+        if version < step_version:
+            for i, item in enumerate(items):
+                if isinstance(item, dict):
+                    step(item, i)
+    return True
+
+
+# ── Version 1: split settings.json into data/ ──────────────────────
+
+
+def migrate_legacy_settings(project_root: Path, data_dir: Path) -> bool:
+    """Split a pre-data/ settings.json into layout, theme and widget files.
+
+    Each file is written as soon as it is built, existing files are kept,
+    and settings.json is renamed to settings.json.bak afterwards.
+    """
+    old_path = project_root / "settings.json"
+    if not old_path.exists():
+        return False
+    try:
+        with open(old_path) as f:
+            old = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error reading legacy settings.json: {e}")
+        return False
+
+    widgets_dir = data_dir / "widgets"
+    widgets_dir.mkdir(parents=True, exist_ok=True)
+    widgets_data = old.pop("widgets", {})
+
+    def write(path: Path, data: dict):
+        if path.exists():
+            print(f"  SKIP {path} (already exists)")
+            return
+        data[VERSION_KEY] = 1
+        write_json_atomic(path, json.dumps(data))
+        print(f"  WROTE {path}")
+
+    write(data_dir / "theme.json", old.pop("theme", {}))
+
+    layout = {"widgets": {}, "hotkeys": old.pop("hotkeys", {})}
+    for widget_name, props in widgets_data.items():
+        entry = {k: props[k] for k in GEOMETRY_KEYS if k in props}
+        if entry:
+            layout["widgets"][widget_name] = entry
+    write(data_dir / "layout.json", layout)
+
+    while widgets_data:
+        widget_name, props = widgets_data.popitem()
+        config = {k: v for k, v in props.items() if k not in GEOMETRY_KEYS}
+        write(widgets_dir / f"{widget_name}.json", config)
+
+    backup_path = project_root / "settings.json.bak"
+    if backup_path.exists():
+        print(f"  SKIP backup {backup_path} (already exists)")
+    else:
+        old_path.rename(backup_path)
+        print("  RENAMED settings.json -> settings.json.bak")
+    return True
+
+
+# ── Version 2: legacy keys and per-item ids ─────────────────────────
+
+
+@migration(2, "theme")
+def _theme_inverted_text(data):
+    """textPrimaryDark/textSecondaryDark were renamed to *Inverted."""
+    for old, new in (
+        ("textPrimaryDark", "textPrimaryInverted"),
+        ("textSecondaryDark", "textSecondaryInverted"),
+    ):
+        if old in data:
+            value = data.pop(old)
+            data.setdefault(new, value)
+
+
+@migration(2, "widget:news")
+def _news_selected_categories(data):
+    """selected_category (one) became selected_categories (a list)."""
+    old = data.pop("selected_category", None)
+    if old and not data.get("selected_categories"):
+        data["selected_categories"] = [old]
+
+
+@item_migration(2, "widget:notes", "notes")
+def _note_id_and_order(note, index):
+    note.setdefault("id", str(uuid.uuid4()))
+    note.setdefault("order", index)
+
+
+@item_migration(2, "widget:todo", "todos")
+def _todo_id_and_parent(todo, index):
+    todo.setdefault("id", str(uuid.uuid4()))
+    todo.setdefault("parentId", None)
+    todo.setdefault("order", index)
+
+
+@item_migration(2, "widget:launcher", "shortcuts")
+def _shortcut_id(shortcut, index):
+    shortcut.setdefault("id", str(uuid.uuid4()))
@@ -0,0 +1,348 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+from .collection_log import CollectionLog
+from .json_store import read_json, replay_journal
+from .writer import SettingsWriter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (scope, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS collection_items (
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (collection, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+LAYOUT_SCOPE = "layout"
+THEME_SCOPE = "theme"
+WIDGET_SCOPE_PREFIX = "widget/"
+# Item order of each collection, one row per "<widget>/<name>"
+ORDER_SCOPE = "collection_order"
+# Schema version each collection's items were written at
+VERSION_SCOPE = "collection_version"
+
+UPSERT_SETTING = (
+    "INSERT INTO settings (scope, key, value) VALUES (?, ?, ?) "
+    "ON CONFLICT(scope, key) DO UPDATE SET value = excluded.value"
+)
+UPSERT_ITEM = (
+    "INSERT INTO collection_items (collection, id, value) VALUES (?, ?, ?) "
+    "ON CONFLICT(collection, id) DO UPDATE SET value = excluded.value"
+)
+DELETE_ITEM = "DELETE FROM collection_items WHERE collection = ? AND id = ?"
+
+
+def _layout_rows(layout: dict) -> dict[str, object]:
+    """Split a layout dict into rows: one per widget plus hotkeys/snap."""
+    rows = {}
+    for key, value in layout.items():
+        if key == "widgets" and isinstance(value, dict):
+            for widget_name, props in value.items():
+                rows[f"widgets/{widget_name}"] = props
+        else:
+            rows[key] = value
+    return rows
+
+
+class SqliteStore:
+    """All settings in one SQLite database (data/settings.db), one row per key.
+
+    Rows are (scope, key, JSON value). Scopes are "layout", "theme" and
+    "widget/<name>", so changing one note setting updates one row instead of
+    reserialising the whole widget file. Collection items (notes, todos,
+    shortcuts) live in their own table, one row per item id. Pending changes
+    are written by the background writer, one transaction per flush. On first
+    open the existing JSON files under data/ are imported once; they are left
+    in place.
+    """
+
+    def __init__(self, data_dir: Path, writer: SettingsWriter):
+        self._data_dir = data_dir
+        self._writer = writer
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._data_dir / "settings.db", check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # Last written JSON text per layout/theme row, to diff whole-dict saves
+        self._row_cache: dict[tuple[str, str], str] = {}
+        self._pending: dict[tuple[str, str], object] = {}
+        self._pending_items: dict[tuple[str, str], object] = {}
+        self._replace_scopes: set[str] = set()
+        self._pending_layout = None
+        self._pending_theme = None
+        writer.add_flush_hook(self._flush_pending)
+
+        if self._get_meta("imported_json") is None:
+            self._import_json_tree()
+
+    # ── Low-level helpers ───────────────────────────────────────────
+
+    def _get_meta(self, key: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _read_scope(self, scope: str):
+        """Read all rows of a scope as a dict, or None if there are none."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM settings WHERE scope = ?", (scope,)
+            ).fetchall()
+        if not rows:
+            return None
+        cache_rows = scope in (LAYOUT_SCOPE, THEME_SCOPE)
+        result = {}
+        for key, text in rows:
+            if cache_rows:
+                self._row_cache[(scope, key)] = text
+            try:
+                result[key] = json.loads(text)
+            except json.JSONDecodeError:
+                pass
+        return result
+
+    def _write_rows(self, replace, upserts, item_upserts, item_deletes):
+        """Writer thread: apply one flush worth of changes in one transaction."""
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "DELETE FROM settings WHERE scope = ?",
+                        [(scope,) for scope in replace],
+                    )
+                    self._conn.executemany(UPSERT_SETTING, upserts)
+                    self._conn.executemany(UPSERT_ITEM, item_upserts)
+                    self._conn.executemany(DELETE_ITEM, item_deletes)
+            except sqlite3.Error as e:
+                print(f"Error saving settings to database: {e}")
+
+    def _diff_rows(self, scope: str, rows: dict, upserts: list):
+        for key, value in rows.items():
+            text = json.dumps(value)
+            if self._row_cache.get((scope, key)) != text:
+                self._row_cache[(scope, key)] = text
+                upserts.append((scope, key, text))
+
+    def _flush_pending(self):
+        """Flush hook: serialise pending rows and queue one transaction."""
+        upserts = []
+        if self._pending_layout is not None:
+            self._diff_rows(LAYOUT_SCOPE, _layout_rows(self._pending_layout), upserts)
+            self._pending_layout = None
+        if self._pending_theme is not None:
+            self._diff_rows(THEME_SCOPE, self._pending_theme, upserts)
+            self._pending_theme = None
+        pending, self._pending = self._pending, {}
+        for (scope, key), value in pending.items():
+            upserts.append((scope, key, json.dumps(value)))
+        replace, self._replace_scopes = list(self._replace_scopes), set()
+
+        item_upserts, item_deletes = [], []
+        pending_items, self._pending_items = self._pending_items, {}
+        for (collection, item_id), item in pending_items.items():
+            if item is None:
+                item_deletes.append((collection, item_id))
+            else:
+                item_upserts.append((collection, item_id, json.dumps(item)))
+
+        if replace or upserts or item_upserts or item_deletes:
+            self._writer.enqueue(
+                lambda: self._write_rows(replace, upserts, item_upserts, item_deletes)
+            )
+
+    # ── One-shot import ─────────────────────────────────────────────
+
+    def _import_json_tree(self):
+        """Import data/layout.json, data/widgets/*.json and data/theme.json."""
+        upserts = []
+        layout = read_json(self._data_dir / "layout.json")
+        if isinstance(layout, dict):
+            for key, value in _layout_rows(layout).items():
+                upserts.append((LAYOUT_SCOPE, key, json.dumps(value)))
+
+        widgets_dir = self._data_dir / "widgets"
+        for path in sorted(widgets_dir.glob("*.json")):
+            config = read_json(path)
+            if not isinstance(config, dict):
+                continue
+            replay_journal(path.with_suffix(".journal"), config)
+            scope = WIDGET_SCOPE_PREFIX + path.stem
+            for key, value in config.items():
+                upserts.append((scope, key, json.dumps(value)))
+
+        theme = read_json(self._data_dir / "theme.json")
+        if isinstance(theme, dict):
+            for key, value in theme.items():
+                upserts.append((THEME_SCOPE, key, json.dumps(value)))
+
+        item_upserts = []
+        for path in sorted((self._data_dir / "collections").glob("*/*.jsonl")):
+            collection = f"{path.parent.name}/{path.stem}"
+            log = CollectionLog(path)
+            items = log.load() or []
+            for item in items:
+                item_upserts.append((collection, item["id"], json.dumps(item)))
+            ids = json.dumps([item["id"] for item in items])
+            upserts.append((ORDER_SCOPE, collection, ids))
+            upserts.append((VERSION_SCOPE, collection, json.dumps(log.version)))
+
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO settings (scope, key, value) "
+                        "VALUES (?, ?, ?)",
+                        upserts,
+                    )
+                    self._conn.executemany(UPSERT_ITEM, item_upserts)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                        ("imported_json", str(len(upserts))),
+                    )
+            except sqlite3.Error as e:
+                print(f"Error importing JSON settings: {e}")
+                return
+        if upserts:
+            print(f"Imported {len(upserts)} settings rows from JSON files")
+
+    # ── Layout ──────────────────────────────────────────────────────
+
+    def load_layout(self):
+        rows = self._read_scope(LAYOUT_SCOPE)
+        if rows is None:
+            return None
+        layout = {"widgets": {}}
+        for key, value in rows.items():
+            if key.startswith("widgets/"):
+                layout["widgets"][key[len("widgets/") :]] = value
+            else:
+                layout[key] = value
+        return layout
+
+    def save_layout(self, layout: dict):
+        self._pending_layout = layout
+        self._writer.touch()
+
+    # ── Per-widget configs ──────────────────────────────────────────
+
+    def widget_config_names(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT scope FROM settings WHERE scope LIKE ?",
+                (WIDGET_SCOPE_PREFIX + "%",),
+            ).fetchall()
+        return [scope[len(WIDGET_SCOPE_PREFIX) :] for (scope,) in rows]
+
+    def load_widget_config(self, widget_name: str):
+        return self.read_widget_config(widget_name)
+
+    def read_widget_config(self, widget_name: str):
+        """Any thread: widget scopes are not row-cached."""
+        return self._read_scope(WIDGET_SCOPE_PREFIX + widget_name)
+
+    def adopt_widget_config(self, widget_name: str, loaded):
+        return loaded
+
+    def save_widget_config(self, widget_name: str, config: dict, key=None):
+        scope = WIDGET_SCOPE_PREFIX + widget_name
+        if key is None:
+            # Whole-config save: drop rows of keys that were removed
+            self._replace_scopes.add(scope)
+            self._pending = {k: v for k, v in self._pending.items() if k[0] != scope}
+            keys = list(config)
+        else:
+            keys = [key]
+        for k in keys:
+            self._pending[(scope, k)] = config.get(k)
+        self._writer.touch()
+
+    # ── Collections ─────────────────────────────────────────────────
+
+    def load_collection(self, widget_name: str, name: str):
+        """Load a collection as a list of items, or None if never saved."""
+        collection = f"{widget_name}/{name}"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, value FROM collection_items WHERE collection = ?",
+                (collection,),
+            ).fetchall()
+            order_row = self._conn.execute(
+                "SELECT value FROM settings WHERE scope = ? AND key = ?",
+                (ORDER_SCOPE, collection),
+            ).fetchone()
+        if not rows and order_row is None:
+            return None
+        items = {}
+        for item_id, text in rows:
+            try:
+                items[item_id] = json.loads(text)
+            except json.JSONDecodeError:
+                pass
+        order = json.loads(order_row[0]) if order_row else []
+        result = [items.pop(item_id) for item_id in order if item_id in items]
+        result.extend(items.values())
+        return result
+
+    def save_collection_item(self, widget_name: str, name: str, item: dict):
+        """Insert or update one item, keyed by item["id"]."""
+        self._pending_items[(f"{widget_name}/{name}", item["id"])] = item
+        self._writer.touch()
+
+    def remove_collection_item(self, widget_name: str, name: str, item_id: str):
+        self._pending_items[(f"{widget_name}/{name}", item_id)] = None
+        self._writer.touch()
+
+    def save_collection_order(self, widget_name: str, name: str, ids: list[str]):
+        self._pending[(ORDER_SCOPE, f"{widget_name}/{name}")] = list(ids)
+        self._writer.touch()
+
+    def collection_version(self, widget_name: str, name: str) -> int:
+        """Schema version a collection was stored at (0 if unknown)."""
+        key = (VERSION_SCOPE, f"{widget_name}/{name}")
+        if key in self._pending:
+            return self._pending[key]
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM settings WHERE scope = ? AND key = ?", key
+            ).fetchone()
+        try:
+            return json.loads(row[0]) if row else 0
+        except json.JSONDecodeError:
+            return 0
+
+    def save_collection_version(self, widget_name: str, name: str, version: int):
+        self._pending[(VERSION_SCOPE, f"{widget_name}/{name}")] = version
+        self._writer.touch()
+
+    # ── Theme ───────────────────────────────────────────────────────
+
+    def theme_file(self):
+        """None: the theme lives in the database, not in a watchable file."""
+        return None
+
+    def load_theme(self):
+        return self._read_scope(THEME_SCOPE)
+
+    def save_theme(self, theme: dict):
+        self._pending_theme = theme
+        self._writer.touch()
@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+from pathlib import Path
+from queue import Queue
+
+from PySide6.QtCore import QObject, QTimer
+
+DEFAULT_DEBOUNCE_MS = 300
+
+
+def write_json_atomic(path: Path, text: str):
+    """Pretty-print a compact JSON snapshot to path via a temp file + rename."""
+    write_text_atomic(path, json.dumps(json.loads(text), indent=2))
+
+
+def write_text_atomic(path: Path, text: str):
+    """Replace path with text via a temp file + rename."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except (IOError, OSError) as e:
+        print(f"Error saving {path}: {e}")
+
+
+def append_text(path: Path, text: str):
+    """Append text to path, creating it if needed."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            f.write(text)
+    except (IOError, OSError) as e:
+        print(f"Error appending to {path}: {e}")
+
+
+class SettingsWriter(QObject):
+    """Coalesces settings writes and flushes them on a background thread.
+
+    Callers mark a file dirty with the live dict that backs it. After a short
+    debounce the UI thread snapshots every dirty dict with the C JSON encoder
+    and hands the snapshots to a writer thread, which does the slow indented
+    dump and the disk I/O. Marking the same file dirty many times within one
+    debounce window results in a single write.
+    """
+
+    def __init__(self, debounce_ms: int = DEFAULT_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self._dirty: dict[Path, dict] = {}
+        self._flush_hooks = []
+        self._queue = Queue()
+        self._pending_marks = 0
+
+        # Counters
+        self._requested = 0
+        self._flushes = 0
+        self._jobs_written = 0
+        self._counter_lock = threading.Lock()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._thread = threading.Thread(
+            target=self._run, name="settings-writer", daemon=True
+        )
+        self._thread.start()
+
+    # ── Scheduling (UI thread) ──────────────────────────────────────
+
+    def schedule(self, path: Path, data: dict):
+        """Mark path dirty; data is snapshotted when the debounce fires."""
+        self._dirty[path] = data
+        self._mark()
+
+    def touch(self):
+        """Request a flush for state owned by a flush hook."""
+        self._mark()
+
+    def add_flush_hook(self, hook):
+        """Register a callable run on the UI thread before each dispatch.
+
+        Hooks turn their own pending state into jobs via enqueue().
+        """
+        self._flush_hooks.append(hook)
+
+    def enqueue(self, job):
+        """Queue a callable to run on the writer thread, in FIFO order."""
+        self._queue.put(job)
+
+    def _mark(self):
+        self._requested += 1
+        self._pending_marks += 1
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _dispatch(self):
+        """Snapshot dirty state and hand it to the writer thread."""
+        self._timer.stop()
+        if not self._pending_marks:
+            return
+        self._pending_marks = 0
+
+        for hook in self._flush_hooks:
+            hook()
+
+        dirty, self._dirty = self._dirty, {}
+        for path, data in dirty.items():
+            self.enqueue(lambda p=path, t=json.dumps(data): write_json_atomic(p, t))
+        with self._counter_lock:
+            self._flushes += 1
+
+    def flush(self):
+        """Dispatch all pending writes and block until they are on disk."""
+        self._dispatch()
+        self._queue.join()
+
+    # ── Writer thread ───────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                job()
+            except Exception as e:
+                print(f"Settings writer error: {e}")
+            finally:
+                with self._counter_lock:
+                    self._jobs_written += 1
+                self._queue.task_done()
+
+    # ── Stats ───────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Return counters: requested writes, flushes, jobs written, pending."""
+        with self._counter_lock:
+            return {
+                "requested": self._requested,
+                "flushes": self._flushes,
+                "written": self._jobs_written,
+                "pending": self._pending_marks + self._queue.unfinished_tasks,
+            }
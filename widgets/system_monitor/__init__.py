@@ -1,3 +1,18 @@
-from .system_monitor import SystemMonitorBackend
+from ..lazy import lazy_exports
 
-__all__ = ["SystemMonitorBackend"]
+MANIFEST = {
+    "name": "system_monitor",
+    "qml": "SystemMonitor.qml",
+    "visible_property": "systemMonitorVisible",
+    "backend": "widgets.system_monitor.system_monitor:SystemMonitorBackend",
+    "context_name": "systemMonitorBackend",
+    "preload": "widgets.system_monitor.system_monitor:preload",
+    "cleanup": "cleanup",
+    "snapshot": "snapshot",
+}
+
+__getattr__ = lazy_exports(
+    __name__, {"SystemMonitorBackend": ".system_monitor:SystemMonitorBackend"}
+)
+
+__all__ = ["SystemMonitorBackend", "MANIFEST"]
@@ -2,6 +2,17 @@ import psutil
 from PySide6.QtCore import QObject, Property, Signal, Slot, QTimer
 
 
+def preload(config):
+    """Prime psutil's CPU counters off the UI thread (manifest preload hook).
+
+    cpu_percent(interval=None) compares against the previous call, so the
+    backend's first sample then shows real usage instead of 0.
+    """
+    psutil.cpu_percent(interval=None)
+    psutil.cpu_percent(interval=None, percpu=True)
+    return None
+
+
 class SystemMonitorBackend(QObject):
     """Backend for system monitor widget (CPU, RAM, GPU)."""
 
@@ -11,7 +22,7 @@ class SystemMonitorBackend(QObject):
     colorSettingsChanged = Signal()
     historyDurationChanged = Signal()
 
-    def __init__(self, settings_backend=None, parent=None):
+    def __init__(self, settings_backend=None, snapshot=None, parent=None):
         super().__init__(parent)
         self._settings = settings_backend
 
@@ -25,6 +36,8 @@ class SystemMonitorBackend(QObject):
         self._cpu_history = []
         self._memory_history = []
         self._max_history = self._load_history_duration()
+        if snapshot:
+            self._restore_snapshot(snapshot)
 
         # Update timer
         self._timer = QTimer(self)
@@ -35,6 +48,29 @@ class SystemMonitorBackend(QObject):
         # Initial update
         self._update()
 
+    def snapshot(self):
+        """Displayable state for the next start (manifest snapshot hook)."""
+        return {
+            "cpu_history": [round(v, 1) for v in self._cpu_history],
+            "memory_history": [round(v, 1) for v in self._memory_history],
+            "cpu_per_core": self._cpu_per_core,
+            "memory_used": self._memory_used,
+            "memory_total": self._memory_total,
+        }
+
+    def _restore_snapshot(self, snapshot: dict):
+        """Seed the graphs with the last session's samples."""
+        limit = self._max_history
+        self._cpu_history = snapshot.get("cpu_history", [])[-limit:]
+        self._memory_history = snapshot.get("memory_history", [])[-limit:]
+        self._cpu_per_core = snapshot.get("cpu_per_core", [])
+        self._memory_used = snapshot.get("memory_used", 0)
+        self._memory_total = snapshot.get("memory_total", 0)
+        if self._cpu_history:
+            self._cpu_percent = self._cpu_history[-1]
+        if self._memory_history:
+            self._memory_percent = self._memory_history[-1]
+
     def _load_history_duration(self):
         """Load history duration from settings."""
         if self._settings:
@@ -0,0 +1,198 @@
+import json
+import threading
+from pathlib import Path
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    Property,
+    Qt,
+    Signal,
+    Slot,
+)
+
+from .theme_provider import complete_theme
+
+SWATCH_KEYS = (
+    "windowBackground",
+    "surfaceColor",
+    "accentColor",
+    "textPrimary",
+    "colorRed",
+    "colorGreen",
+    "colorBlue",
+)
+
+
+def _display_name(stem: str) -> str:
+    return " ".join(part.capitalize() for part in stem.split("_"))
+
+
+def parse_preset(path: Path):
+    """Read one preset file into a catalog entry, or None if unreadable."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error loading theme preset {path.name}: {e}")
+        return None
+    if not isinstance(data, dict):
+        return None
+    theme = complete_theme(data)
+    return {
+        "name": _display_name(path.stem),
+        "file": path.name,
+        "swatch": [theme[key] for key in SWATCH_KEYS],
+        "theme": theme,
+    }
+
+
+class ThemeCatalog(QAbstractListModel):
+    """Theme presets from default_themes/, parsed once and kept in memory.
+
+    load() reads and parses every preset on a background thread; the model
+    fills in when it is done. Applying or previewing a preset hands the
+    parsed dict to ThemeProvider, which only emits for values that differ.
+    """
+
+    NameRole = Qt.UserRole + 1
+    FileRole = Qt.UserRole + 2
+    SwatchRole = Qt.UserRole + 3
+
+    readyChanged = Signal()
+    _presetsLoaded = Signal(object)
+
+    def __init__(self, theme_provider, themes_dir: Path, parent=None):
+        super().__init__(parent)
+        self._theme_provider = theme_provider
+        self._themes_dir = themes_dir
+        self._presets: list[dict] = []
+        self._by_name: dict[str, dict] = {}
+        self._ready = False
+        self._loading = False
+        # Last applied and currently previewed preset names
+        self._applied = None
+        self._previewed = None
+        self._presetsLoaded.connect(self._on_presets_loaded)
+
+    # ── Model ──────────────────────────────────────────────────────
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._presets)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._presets):
+            return None
+        preset = self._presets[index.row()]
+        if role in (self.NameRole, Qt.DisplayRole):
+            return preset["name"]
+        if role == self.FileRole:
+            return preset["file"]
+        if role == self.SwatchRole:
+            return preset["swatch"]
+        return None
+
+    def roleNames(self):
+        return {
+            self.NameRole: QByteArray(b"name"),
+            self.FileRole: QByteArray(b"file"),
+            self.SwatchRole: QByteArray(b"swatch"),
+        }
+
+    @Property(bool, notify=readyChanged)
+    def ready(self):
+        return self._ready
+
+    # ── Loading ────────────────────────────────────────────────────
+
+    @Slot()
+    def load(self):
+        """Index and parse all presets on a background thread."""
+        if self._ready or self._loading:
+            return
+        self._loading = True
+        themes_dir = self._themes_dir
+
+        def run():
+            presets = []
+            for path in sorted(themes_dir.glob("*.json")):
+                preset = parse_preset(path)
+                if preset:
+                    presets.append(preset)
+            # Hand the result to the UI thread
+            self._presetsLoaded.emit(presets)
+
+        threading.Thread(target=run, name="theme-catalog", daemon=True).start()
+
+    def _on_presets_loaded(self, presets):
+        self.beginResetModel()
+        self._presets = presets
+        self._by_name = {preset["name"]: preset for preset in presets}
+        self.endResetModel()
+        self._loading = False
+        self._ready = True
+        self.readyChanged.emit()
+
+    # ── Applying ───────────────────────────────────────────────────
+
+    @Slot(str)
+    def apply(self, name: str):
+        """Make a preset the current theme and save it."""
+        preset = self._by_name.get(name)
+        if preset:
+            self._applied, self._previewed = name, None
+            self._theme_provider.applyTheme(preset["theme"])
+
+    @Slot(str)
+    def preview(self, name: str):
+        """Show a preset without saving it (e.g. while hovering its tile)."""
+        preset = self._by_name.get(name)
+        if preset:
+            self._previewed = name
+            self._theme_provider.previewTheme(preset["theme"])
+
+    @Slot()
+    def endPreview(self):
+        self._previewed = None
+        self._theme_provider.endPreview()
+
+    # ── Hot reload ─────────────────────────────────────────────────
+
+    def update_preset(self, file_name: str, preset):
+        """Add, refresh or (preset None) drop one preset after a file change.
+
+        A preset that is applied or previewed right now is re-applied, so
+        edits to the file show up immediately.
+        """
+        if not self._ready:
+            return
+        row = next(
+            (i for i, p in enumerate(self._presets) if p["file"] == file_name), None
+        )
+        if preset is None:
+            if row is not None:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                removed = self._presets.pop(row)
+                self._by_name.pop(removed["name"], None)
+                self.endRemoveRows()
+            return
+
+        if row is None:
+            row = sum(1 for p in self._presets if p["file"] < file_name)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._presets.insert(row, preset)
+            self._by_name[preset["name"]] = preset
+            self.endInsertRows()
+        else:
+            self._presets[row] = preset
+            self._by_name[preset["name"]] = preset
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+        if preset["name"] == self._previewed:
+            self._theme_provider.previewTheme(preset["theme"])
+        elif preset["name"] == self._applied and self._previewed is None:
+            self._theme_provider.applyTheme(preset["theme"])
@@ -1,12 +1,22 @@
 import json
+import time
 from pathlib import Path
 
 from PySide6.QtCore import QObject, Property, Signal, Slot, QUrl
 from PySide6.QtGui import QColor
 
+from .storage.migrations import SCHEMA_VERSION, VERSION_KEY, migrate
 from .theme_constants import DEFAULT_THEME
 
 
+def complete_theme(data: dict) -> dict:
+    """Migrate a theme dict from a file and fill in missing keys."""
+    migrate("theme", data)
+    result = DEFAULT_THEME.copy()
+    result.update(data)
+    return result
+
+
 class ThemeProvider(QObject):
     themeChanged = Signal()
 
@@ -46,24 +56,76 @@ class ThemeProvider(QObject):
     paddingChanged = Signal()
     textScrollSpeedChanged = Signal()
 
-    def __init__(self, theme_path: Path, parent=None):
+    def __init__(self, theme_path: Path, store=None, parent=None):
         super().__init__(parent)
         self._theme_path = theme_path
+        self._store = store
+        # Parsed values served by the property getters, filled on first read
+        self._colors: dict[str, QColor] = {}
+        self._ints: dict[str, int] = {}
+        # Open beginUpdate() calls and keys changed since the last commit
+        self._update_depth = 0
+        self._changed: set[str] = set()
+        # Save on the next flush even if no key changed (applied preview)
+        self._save_requested = False
+        # Saved theme while a preset is previewed; previews are never saved
+        self._preview_base = None
+        # time.monotonic() of the last save, so a file watcher can skip
+        # the change events caused by our own writes
+        self.last_saved = 0.0
         self._theme = self._load_theme()
 
     def _load_theme(self) -> dict:
-        if self._theme_path.exists():
+        data = None
+        if self._store:
+            data = self._store.load_theme()
+        elif self._theme_path.exists():
             try:
                 with open(self._theme_path) as f:
                     data = json.load(f)
-                result = DEFAULT_THEME.copy()
-                result.update(data)
-                return result
             except (json.JSONDecodeError, IOError):
                 pass
-        return DEFAULT_THEME.copy()
+        if not isinstance(data, dict):
+            return self._default_theme()
+        migrated = migrate("theme", data)
+        result = DEFAULT_THEME.copy()
+        result.update(data)
+        if migrated:
+            self._theme = result
+            self._save_theme()
+        return result
+
+    @staticmethod
+    def _default_theme() -> dict:
+        result = DEFAULT_THEME.copy()
+        result[VERSION_KEY] = SCHEMA_VERSION
+        return result
+
+    # ── Parsed value cache ─────────────────────────────────────────
+
+    def _color(self, name: str) -> QColor:
+        color = self._colors.get(name)
+        if color is None:
+            color = QColor(self._theme.get(name, DEFAULT_THEME[name]))
+            self._colors[name] = color
+        return color
+
+    def _int(self, name: str) -> int:
+        value = self._ints.get(name)
+        if value is None:
+            value = int(self._theme.get(name, DEFAULT_THEME[name]))
+            self._ints[name] = value
+        return value
+
+    def _invalidate(self, name: str):
+        self._colors.pop(name, None)
+        self._ints.pop(name, None)
 
     def _save_theme(self):
+        self.last_saved = time.monotonic()
+        if self._store:
+            self._store.save_theme(self._theme)
+            return
         try:
             self._theme_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self._theme_path, "w") as f:
@@ -71,226 +133,256 @@ class ThemeProvider(QObject):
         except IOError as e:
             print(f"Error saving theme: {e}")
 
-    def _emit_all_signals(self):
-        """Emit all property change signals."""
-        self.windowBackgroundChanged.emit()
-        self.surfaceColorChanged.emit()
-        self.titleBarBackgroundChanged.emit()
-        self.titleBarTextChanged.emit()
-        self.titleBarButtonHoverChanged.emit()
-        self.titleBarButtonPressedChanged.emit()
-        self.accentColorChanged.emit()
-        self.accentHoverChanged.emit()
-        self.accentInactiveChanged.emit()
-        self.textPrimaryChanged.emit()
-        self.textSecondaryChanged.emit()
-        self.textMutedChanged.emit()
-        self.textPrimaryInvertedChanged.emit()
-        self.textSecondaryInvertedChanged.emit()
-        self.borderColorChanged.emit()
-        self.colorRedChanged.emit()
-        self.colorOrangeChanged.emit()
-        self.colorYellowChanged.emit()
-        self.colorGreenChanged.emit()
-        self.colorBlueChanged.emit()
-        self.colorPurpleChanged.emit()
-        self.fontSizeSmallChanged.emit()
-        self.fontSizeNormalChanged.emit()
-        self.fontSizeLargeChanged.emit()
-        self.fontSizeTitleChanged.emit()
-        self.titleBarHeightChanged.emit()
-        self.borderRadiusChanged.emit()
-        self.windowRadiusChanged.emit()
-        self.spacingChanged.emit()
-        self.paddingChanged.emit()
-        self.textScrollSpeedChanged.emit()
-        self.themeChanged.emit()
-
     # Color properties
     @Property(QColor, notify=windowBackgroundChanged)
     def windowBackground(self):
-        return QColor(self._theme["windowBackground"])
+        return self._color("windowBackground")
 
     @Property(QColor, notify=surfaceColorChanged)
     def surfaceColor(self):
-        return QColor(self._theme["surfaceColor"])
+        return self._color("surfaceColor")
 
     @Property(QColor, notify=titleBarBackgroundChanged)
     def titleBarBackground(self):
-        return QColor(self._theme["titleBarBackground"])
+        return self._color("titleBarBackground")
 
     @Property(QColor, notify=titleBarTextChanged)
     def titleBarText(self):
-        return QColor(self._theme["titleBarText"])
+        return self._color("titleBarText")
 
     @Property(QColor, notify=titleBarButtonHoverChanged)
     def titleBarButtonHover(self):
-        return QColor(self._theme["titleBarButtonHover"])
+        return self._color("titleBarButtonHover")
 
     @Property(QColor, notify=titleBarButtonPressedChanged)
     def titleBarButtonPressed(self):
-        return QColor(self._theme["titleBarButtonPressed"])
+        return self._color("titleBarButtonPressed")
 
     @Property(QColor, notify=accentColorChanged)
     def accentColor(self):
-        return QColor(self._theme["accentColor"])
+        return self._color("accentColor")
 
     @Property(QColor, notify=accentHoverChanged)
     def accentHover(self):
-        return QColor(self._theme["accentHover"])
+        return self._color("accentHover")
 
     @Property(QColor, notify=accentInactiveChanged)
     def accentInactive(self):
-        return QColor(self._theme["accentInactive"])
+        return self._color("accentInactive")
 
     @Property(QColor, notify=textPrimaryChanged)
     def textPrimary(self):
-        return QColor(self._theme["textPrimary"])
+        return self._color("textPrimary")
 
     @Property(QColor, notify=textSecondaryChanged)
     def textSecondary(self):
-        return QColor(self._theme["textSecondary"])
+        return self._color("textSecondary")
 
     @Property(QColor, notify=textMutedChanged)
     def textMuted(self):
-        return QColor(self._theme["textMuted"])
+        return self._color("textMuted")
 
     @Property(QColor, notify=textPrimaryInvertedChanged)
     def textPrimaryInverted(self):
-        # Support legacy key name for backward compatibility
-        value = self._theme.get("textPrimaryInverted") or self._theme.get(
-            "textPrimaryDark", "#1e1e2e"
-        )
-        return QColor(value)
+        return self._color("textPrimaryInverted")
 
     @Property(QColor, notify=textSecondaryInvertedChanged)
     def textSecondaryInverted(self):
-        # Support legacy key name for backward compatibility
-        value = self._theme.get("textSecondaryInverted") or self._theme.get(
-            "textSecondaryDark", "#313244"
-        )
-        return QColor(value)
+        return self._color("textSecondaryInverted")
 
     @Property(QColor, notify=borderColorChanged)
     def borderColor(self):
-        return QColor(self._theme["borderColor"])
+        return self._color("borderColor")
 
     @Property(QColor, notify=symbolColorChanged)
     def symbolColor(self):
-        return QColor(self._theme.get("symbolColor", "#cdd6f4"))
+        return self._color("symbolColor")
 
     @symbolColor.setter
     def symbolColor(self, value):
         if self._theme.get("symbolColor") != value:
             self._theme["symbolColor"] = value
+            self._invalidate("symbolColor")
             self.symbolColorChanged.emit()
 
     @Property(QColor, notify=colorRedChanged)
     def colorRed(self):
-        return QColor(self._theme.get("colorRed", "#f38ba8"))
+        return self._color("colorRed")
 
     @Property(QColor, notify=colorOrangeChanged)
     def colorOrange(self):
-        return QColor(self._theme.get("colorOrange", "#fab387"))
+        return self._color("colorOrange")
 
     @Property(QColor, notify=colorYellowChanged)
     def colorYellow(self):
-        return QColor(self._theme.get("colorYellow", "#f9e2af"))
+        return self._color("colorYellow")
 
     @Property(QColor, notify=colorGreenChanged)
     def colorGreen(self):
-        return QColor(self._theme.get("colorGreen", "#a6e3a1"))
+        return self._color("colorGreen")
 
     @Property(QColor, notify=colorBlueChanged)
     def colorBlue(self):
-        return QColor(self._theme.get("colorBlue", "#89b4fa"))
+        return self._color("colorBlue")
 
     @Property(QColor, notify=colorPurpleChanged)
     def colorPurple(self):
-        return QColor(self._theme.get("colorPurple", "#cba6f7"))
+        return self._color("colorPurple")
 
     # Int properties
     @Property(int, notify=fontSizeSmallChanged)
     def fontSizeSmall(self):
-        return self._theme["fontSizeSmall"]
+        return self._int("fontSizeSmall")
 
     @Property(int, notify=fontSizeNormalChanged)
     def fontSizeNormal(self):
-        return self._theme["fontSizeNormal"]
+        return self._int("fontSizeNormal")
 
     @Property(int, notify=fontSizeLargeChanged)
     def fontSizeLarge(self):
-        return self._theme["fontSizeLarge"]
+        return self._int("fontSizeLarge")
 
     @Property(int, notify=fontSizeTitleChanged)
     def fontSizeTitle(self):
-        return self._theme["fontSizeTitle"]
+        return self._int("fontSizeTitle")
 
     @Property(int, notify=titleBarHeightChanged)
     def titleBarHeight(self):
-        return self._theme["titleBarHeight"]
+        return self._int("titleBarHeight")
 
     @Property(int, notify=borderRadiusChanged)
     def borderRadius(self):
-        return self._theme["borderRadius"]
+        return self._int("borderRadius")
 
     @Property(int, notify=windowRadiusChanged)
     def windowRadius(self):
-        return self._theme["windowRadius"]
+        return self._int("windowRadius")
 
     @Property(int, notify=spacingChanged)
     def spacing(self):
-        return self._theme["spacing"]
+        return self._int("spacing")
 
     @Property(int, notify=paddingChanged)
     def padding(self):
-        return self._theme["padding"]
+        return self._int("padding")
 
     @Property(int, notify=textScrollSpeedChanged)
     def textScrollSpeed(self):
-        return self._theme["textScrollSpeed"]
+        return self._int("textScrollSpeed")
 
-    # Setters
-    @Slot(str, str)
-    def setColor(self, name: str, value: str):
-        """Set a color value by name."""
-        if name in self._theme:
-            self._theme[name] = value
+    # ── Transactions ───────────────────────────────────────────────
+
+    @Slot()
+    def beginUpdate(self):
+        """Start a batch: changes are applied but signalled and saved on commit."""
+        self._update_depth += 1
+
+    @Slot()
+    def commit(self):
+        """End a batch; the outermost commit emits and saves once."""
+        self._update_depth = max(self._update_depth - 1, 0)
+        if self._update_depth == 0:
+            self._flush_changes()
+
+    def _apply(self, values: dict):
+        """Set values, recording only the keys whose value actually changed."""
+        self._leave_preview()
+        for name, value in values.items():
+            if self._theme.get(name) != value:
+                self._theme[name] = value
+                self._invalidate(name)
+                self._changed.add(name)
+        if self._update_depth == 0:
+            self._flush_changes()
+
+    def _replace(self, theme: dict):
+        """Swap in a whole theme, recording the keys that differ."""
+        old = self._theme
+        self._theme = theme
+        for name in old.keys() | theme.keys():
+            if old.get(name) != theme.get(name):
+                self._invalidate(name)
+                self._changed.add(name)
+        if self._update_depth == 0:
+            self._flush_changes()
+
+    def _flush_changes(self):
+        """Save once and emit the NOTIFY signal of each changed key."""
+        if not self._changed and not self._save_requested:
+            return
+        changed, self._changed = self._changed, set()
+        self._save_requested = False
+        if self._preview_base is None:
             self._save_theme()
-            # Emit specific signal
+        for name in changed:
             signal = getattr(self, f"{name}Changed", None)
             if signal:
                 signal.emit()
-            self.themeChanged.emit()
+        self.themeChanged.emit()
+
+    # ── Presets ────────────────────────────────────────────────────
+
+    def applyTheme(self, theme: dict):
+        """Replace the whole theme (e.g. with a preset), ending any preview."""
+        if self._preview_base is not None:
+            # A hovered preset is already shown, so nothing may differ
+            self._preview_base = None
+            self._save_requested = True
+        self._replace(dict(theme))
+
+    def previewTheme(self, theme: dict):
+        """Show a theme without saving it, until endPreview() or applyTheme()."""
+        if self._preview_base is None:
+            self._preview_base = self._theme
+        self._replace(dict(theme))
+
+    def reloadTheme(self, theme: dict):
+        """Take a theme edited outside the app, keeping any preview on top."""
+        if self._preview_base is not None:
+            self._preview_base = dict(theme)
+        else:
+            self._replace(dict(theme))
+
+    @Slot()
+    def endPreview(self):
+        """Restore the saved theme after previewTheme()."""
+        if self._preview_base is not None:
+            self._replace(self._preview_base)
+            self._preview_base = None
+
+    def _leave_preview(self):
+        """End a preview before an edit, so the edit lands on the saved theme."""
+        if self._preview_base is not None:
+            # Flushed together with the edit
+            self._update_depth += 1
+            self.endPreview()
+            self._update_depth -= 1
+
+    # ── Setters ────────────────────────────────────────────────────
+
+    @Slot(str, str)
+    def setColor(self, name: str, value: str):
+        """Set a color value by name."""
+        if name in self._theme:
+            self._apply({name: value})
 
     @Slot(str, int)
     def setInt(self, name: str, value: int):
         """Set an integer value by name."""
         if name in self._theme:
-            self._theme[name] = value
-            self._save_theme()
-            signal = getattr(self, f"{name}Changed", None)
-            if signal:
-                signal.emit()
-            self.themeChanged.emit()
+            self._apply({name: value})
 
     @Slot()
     def resetToDefaults(self):
         """Reset all theme values to defaults."""
-        self._theme = DEFAULT_THEME.copy()
-        self._save_theme()
-        self._emit_all_signals()
+        self._leave_preview()
+        self._replace(self._default_theme())
 
     @Slot(str)
     def resetValue(self, name: str):
         """Reset a single theme value to default."""
         if name in DEFAULT_THEME:
-            self._theme[name] = DEFAULT_THEME[name]
-            self._save_theme()
-            signal = getattr(self, f"{name}Changed", None)
-            if signal:
-                signal.emit()
-            self.themeChanged.emit()
+            self._apply({name: DEFAULT_THEME[name]})
 
     @Slot(str)
     def saveThemeToPath(self, path: str):
@@ -320,11 +412,7 @@ class ThemeProvider(QObject):
         if not isinstance(data, dict):
             return
 
-        updated = DEFAULT_THEME.copy()
-        updated.update(data)
-        self._theme = updated
-        self._save_theme()
-        self._emit_all_signals()
+        self.applyTheme(complete_theme(data))
 
     def _normalize_path(self, path: str) -> str:
         """Normalize file paths coming from QML."""
@@ -349,6 +437,6 @@ class ThemeProvider(QObject):
         """Get all integer property names and values."""
         ints = {}
         for key, value in self._theme.items():
-            if isinstance(value, int):
+            if isinstance(value, int) and key != VERSION_KEY:
                 ints[key] = value
         return ints
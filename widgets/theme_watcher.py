@@ -0,0 +1,112 @@
+import threading
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from .storage.json_store import read_json
+from .theme_catalog import parse_preset
+from .theme_provider import complete_theme
+
+DEFAULT_DEBOUNCE_MS = 300
+# Change events this soon after ThemeProvider saved are our own write
+SELF_WRITE_GRACE_S = 1.5
+
+
+class ThemeWatcher(QObject):
+    """Opt-in hot reload of data/theme.json and the preset files.
+
+    theme_path is None when the settings store does not keep the theme in a
+    file (sqlite); only the presets are watched then.
+
+    A background thread watches both directories with watchfiles, which
+    groups events over debounce_ms. Only the files that changed are parsed
+    (on the watcher thread); the UI thread then applies them as a diff
+    through ThemeProvider and ThemeCatalog.
+    """
+
+    _themeFileChanged = Signal(object)
+    _presetFileChanged = Signal(str, object)
+
+    def __init__(
+        self,
+        theme_provider,
+        theme_path: Path,
+        catalog=None,
+        presets_dir: Path = None,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._theme_provider = theme_provider
+        self._theme_path = theme_path
+        self._catalog = catalog
+        self._presets_dir = presets_dir
+        self._debounce_ms = debounce_ms
+        self._stop = threading.Event()
+        self._thread = None
+        self._themeFileChanged.connect(self._on_theme_file_changed)
+        self._presetFileChanged.connect(self._on_preset_file_changed)
+
+    def start(self):
+        try:
+            from watchfiles import Change, watch
+        except ImportError:
+            print("Theme hot reload needs the watchfiles package")
+            return
+        if self._thread is not None:
+            return
+
+        dirs = []
+        theme_path = None
+        if self._theme_path is not None:
+            dirs.append(self._theme_path.parent)
+            theme_path = self._theme_path.resolve()
+        else:
+            print("Theme hot reload: no theme.json with sqlite, watching presets only")
+        if self._catalog is not None and self._presets_dir is not None:
+            dirs.append(self._presets_dir)
+        dirs = [d for d in dirs if d.is_dir()]
+        if not dirs:
+            return
+        presets_dir = self._presets_dir.resolve() if self._presets_dir else None
+
+        def run():
+            for changes in watch(
+                *dirs,
+                watch_filter=lambda change, path: path.endswith(".json"),
+                debounce=self._debounce_ms,
+                stop_event=self._stop,
+                recursive=False,
+            ):
+                # Several events per file collapse to the last one
+                latest = {Path(path).resolve(): change for change, path in changes}
+                for path, change in latest.items():
+                    if path == theme_path:
+                        if change != Change.deleted:
+                            data = read_json(path)
+                            if isinstance(data, dict):
+                                self._themeFileChanged.emit(complete_theme(data))
+                    elif path.parent == presets_dir:
+                        preset = None
+                        if change != Change.deleted:
+                            preset = parse_preset(path)
+                            if preset is None:
+                                continue  # half-written; wait for the next event
+                        self._presetFileChanged.emit(path.name, preset)
+
+        self._thread = threading.Thread(target=run, name="theme-watcher", daemon=True)
+        self._thread.start()
+        print(f"Watching {', '.join(str(d) for d in dirs)} for theme changes")
+
+    @Slot()
+    def stop(self):
+        self._stop.set()
+
+    def _on_theme_file_changed(self, theme):
+        if time.monotonic() - self._theme_provider.last_saved < SELF_WRITE_GRACE_S:
+            return
+        self._theme_provider.reloadTheme(theme)
+
+    def _on_preset_file_changed(self, file_name, preset):
+        self._catalog.update_preset(file_name, preset)
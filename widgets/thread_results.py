@@ -0,0 +1,23 @@
+class ThreadResults:
+    """Hands a backend the results of its background threads until closed.
+
+    A backend can be cleaned up and unloaded while a fetch thread is still
+    running; once closed, that thread's results are dropped instead of
+    being emitted into the unloaded (possibly deleted) backend.
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.closed = False
+
+    def emit(self, signal_name: str, *args):
+        """Emit backend.<signal_name>(*args) unless closed."""
+        if self.closed:
+            return
+        try:
+            getattr(self._backend, signal_name).emit(*args)
+        except RuntimeError:
+            pass  # Deleted between the check and the emit
+
+    def close(self):
+        self.closed = True
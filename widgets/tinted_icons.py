@@ -0,0 +1,99 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtQuick import QQuickImageProvider
+from PySide6.QtSvg import QSvgRenderer
+
+DEFAULT_CACHE_SIZE = 512
+
+
+class TintedIconProvider(QQuickImageProvider):
+    """Serves icons/ SVGs rendered and tinted once, for image://tinted/ URLs.
+
+    URL form: image://tinted/<name>.svg?size=24&color=89b4fa&dpr=1.5, where
+    color is a hex RGB or ARGB value without "#". Rendered images are kept
+    in an LRU keyed by (name, size, color, dpr), so every ThemedIcon shares
+    one plain texture instead of a layer and a ColorOverlay pass each.
+    With an IconAtlas set, icons in it are cut from the atlas, not parsed.
+    """
+
+    def __init__(self, icons_dir: Path, cache_size: int = DEFAULT_CACHE_SIZE):
+        super().__init__(QQuickImageProvider.ImageType.Image)
+        self._icons_dir = icons_dir
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple, QImage] = OrderedDict()
+        self._atlas = None
+        # requestImage may run on QML loader threads
+        self._lock = threading.Lock()
+
+    def set_atlas(self, atlas):
+        """Use a prerendered IconAtlas (or None) for icons it contains."""
+        self._atlas = atlas
+
+    def clear(self):
+        """Drop all rendered icons (connected to themeChanged)."""
+        with self._lock:
+            self._cache.clear()
+
+    def requestImage(self, id, size, requested_size):
+        name, _, query = id.partition("?")
+        params = parse_qs(query)
+        try:
+            logical = int(params.get("size", ["24"])[0])
+            dpr = float(params.get("dpr", ["1"])[0])
+        except ValueError:
+            logical, dpr = 24, 1.0
+        color = params.get("color", ["ffffff"])[0].lower()
+        key = (name, logical, color, dpr)
+
+        with self._lock:
+            image = self._cache.get(key)
+            if image is not None:
+                self._cache.move_to_end(key)
+        if image is None:
+            image = self._render(name, round(logical * dpr), color, dpr)
+            with self._lock:
+                self._cache[key] = image
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        if size is not None:
+            size.setWidth(image.width())
+            size.setHeight(image.height())
+        return image
+
+    def _render(self, name: str, pixels: int, color: str, dpr: float) -> QImage:
+        atlas = self._atlas
+        image = atlas.icon(name, pixels) if atlas else None
+        if image is None:
+            image = self._render_svg(name, pixels)
+        if image is not None:
+            # Keep the icon's alpha, replace its color
+            painter = QPainter(image)
+            painter.setCompositionMode(
+                QPainter.CompositionMode.CompositionMode_SourceIn
+            )
+            painter.fillRect(image.rect(), QColor("#" + color))
+            painter.end()
+        else:
+            image = QImage(pixels, pixels, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
+        image.setDevicePixelRatio(dpr)
+        return image
+
+    def _render_svg(self, name: str, pixels: int):
+        renderer = QSvgRenderer(str(self._icons_dir / name))
+        if not renderer.isValid():
+            print(f"Error loading icon {name}")
+            return None
+        image = QImage(pixels, pixels, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        renderer.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+        painter = QPainter(image)
+        renderer.render(painter, QRectF(0, 0, pixels, pixels))
+        painter.end()
+        return image
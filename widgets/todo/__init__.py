@@ -1,3 +1,13 @@
-from .todo import TodoBackend
+from ..lazy import lazy_exports
 
-__all__ = ["TodoBackend"]
+MANIFEST = {
+    "name": "todo",
+    "qml": "Todo.qml",
+    "visible_property": "todoVisible",
+    "backend": "widgets.todo.todo:TodoBackend",
+    "context_name": "todoBackend",
+}
+
+__getattr__ = lazy_exports(__name__, {"TodoBackend": ".todo:TodoBackend"})
+
+__all__ = ["TodoBackend", "MANIFEST"]
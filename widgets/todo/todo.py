@@ -14,18 +14,17 @@ class TodoBackend(QObject):
     def _load_todos(self):
         """Load todos from settings."""
         if self._settings:
-            data = self._settings.getWidgetSetting("todo", "todos")
-            if data and isinstance(data, list):
-                self._todos = data
-            else:
-                self._todos = []
+            self._todos = self._settings.getCollection("todo", "todos")
         else:
             self._todos = []
 
-    def _save_todos(self):
-        """Save todos to settings."""
+    def _save_todos(self, changed=(), removed=()):
+        """Save changed todos and removed todo ids to settings."""
         if self._settings:
-            self._settings.setWidgetSetting("todo", "todos", self._todos)
+            for todo in changed:
+                self._settings.setCollectionItem("todo", "todos", todo)
+            for todo_id in removed:
+                self._settings.removeCollectionItem("todo", "todos", todo_id)
         self.todosChanged.emit()
 
     def _get_next_order(self, parent_id=None):
@@ -84,7 +83,7 @@ class TodoBackend(QObject):
             "order": self._get_next_order(None),
         }
         self._todos.append(todo)
-        self._save_todos()
+        self._save_todos(changed=[todo])
 
     @Slot(str, str)
     def addChildTodo(self, parent_id, text):
@@ -106,7 +105,7 @@ class TodoBackend(QObject):
             "order": self._get_next_order(parent_id),
         }
         self._todos.append(todo)
-        self._save_todos()
+        self._save_todos(changed=[todo])
 
     @Slot(str)
     def toggleTodo(self, todo_id):
@@ -117,14 +116,16 @@ class TodoBackend(QObject):
 
         new_completed = not todo.get("completed", False)
         todo["completed"] = new_completed
+        changed = [todo]
 
         # If this is a parent todo, also toggle all children
         if todo.get("parentId") is None:
             for child in self._todos:
                 if child.get("parentId") == todo_id:
                     child["completed"] = new_completed
+                    changed.append(child)
 
-        self._save_todos()
+        self._save_todos(changed=changed)
 
     @Slot(str)
     def deleteTodo(self, todo_id):
@@ -136,15 +137,16 @@ class TodoBackend(QObject):
 
         # If it's a parent, also delete children
         if todo.get("parentId") is None:
-            self._todos = [
-                t
+            removed = [
+                t.get("id")
                 for t in self._todos
-                if t.get("id") != todo_id and t.get("parentId") != todo_id
+                if t.get("id") == todo_id or t.get("parentId") == todo_id
             ]
         else:
-            self._todos = [t for t in self._todos if t.get("id") != todo_id]
+            removed = [todo_id]
+        self._todos = [t for t in self._todos if t.get("id") not in removed]
 
-        self._save_todos()
+        self._save_todos(removed=removed)
 
     @Slot(str, int)
     def reorderTodo(self, todo_id, new_index):
@@ -188,10 +190,13 @@ class TodoBackend(QObject):
         siblings.insert(new_index, todo)
 
         # Update order values
+        changed = []
         for i, sibling in enumerate(siblings):
-            sibling["order"] = i
+            if sibling.get("order") != i:
+                sibling["order"] = i
+                changed.append(sibling)
 
-        self._save_todos()
+        self._save_todos(changed=changed)
 
     @Slot(str, str)
     def updateTodoText(self, todo_id, new_text):
@@ -203,4 +208,4 @@ class TodoBackend(QObject):
         todo = next((t for t in self._todos if t.get("id") == todo_id), None)
         if todo:
             todo["text"] = new_text
-            self._save_todos()
+            self._save_todos(changed=[todo])
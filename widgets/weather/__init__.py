@@ -1,3 +1,16 @@
-from .weather import WeatherBackend
+from ..lazy import lazy_exports
 
-__all__ = ["WeatherBackend"]
+MANIFEST = {
+    "name": "weather",
+    "qml": "Weather.qml",
+    "visible_property": "weatherVisible",
+    "backend": "widgets.weather.weather:WeatherBackend",
+    "context_name": "weatherBackend",
+    "preload": "widgets.weather.weather:preload",
+    "cleanup": "cleanup",
+    "snapshot": "snapshot",
+}
+
+__getattr__ = lazy_exports(__name__, {"WeatherBackend": ".weather:WeatherBackend"})
+
+__all__ = ["WeatherBackend", "MANIFEST"]
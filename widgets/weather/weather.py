@@ -9,6 +9,14 @@ from threading import Thread
 from dotenv import load_dotenv
 from PySide6.QtCore import QObject, Property, Signal, Slot, QTimer
 
+from ..thread_results import ThreadResults
+
+
+def preload(config):
+    """Read .env off the UI thread (manifest preload hook)."""
+    load_dotenv()
+    return {"locationiq_key": os.getenv("LOCATIONIQ_KEY", "")}
+
 
 class WeatherBackend(QObject):
     """Backend for weather widget with location search and weather data."""
@@ -62,7 +70,9 @@ class WeatherBackend(QObject):
         99: "thunderstorm-with-hail.png",
     }
 
-    def __init__(self, settings_backend=None, parent=None):
+    def __init__(
+        self, settings_backend=None, preloaded=None, snapshot=None, parent=None
+    ):
         super().__init__(parent)
 
         self._settings_backend = settings_backend
@@ -78,15 +88,16 @@ class WeatherBackend(QObject):
         self._is_searching = False
         self._is_loading = False
         self._error_message = ""
+        # Closed by cleanup(); fetch threads still running drop their result
+        self._fetches = ThreadResults(self)
 
         # Get assets directory for icons
         self._assets_dir = Path(__file__).parent / "assets"
 
-        # Load environment variables from .env file
-        load_dotenv()
-
-        # Get LocationIQ API key from environment
-        self._locationiq_key = os.getenv("LOCATIONIQ_KEY", "")
+        # LocationIQ API key from the environment / .env file
+        if preloaded is None:
+            preloaded = preload(None)
+        self._locationiq_key = preloaded["locationiq_key"]
 
         # Connect background thread signals
         self._weatherDataReady.connect(self._on_weather_data_ready)
@@ -96,6 +107,10 @@ class WeatherBackend(QObject):
         # Load settings
         self._load_settings()
 
+        # Last shown forecast, until the refresh below replaces it
+        if snapshot:
+            self._restore_snapshot(snapshot)
+
         # Set up auto-refresh timer (30 minutes)
         self._refresh_timer = QTimer(self)
         self._refresh_timer.timeout.connect(self.refreshWeather)
@@ -150,11 +165,50 @@ class WeatherBackend(QObject):
             "weather", "forecast_hours", self._forecast_hours
         )
 
+    def snapshot(self):
+        """Displayable state for the next start (manifest snapshot hook)."""
+        if not self._hourly_data and not self._daily_data:
+            return None
+
+        def with_icon_names(rows):
+            return [dict(row, icon=Path(row["icon"]).name) for row in rows]
+
+        return {
+            "lat": getattr(self, "_lat", None),
+            "lon": getattr(self, "_lon", None),
+            "temp": self._current_temp,
+            "code": self._current_weather_code,
+            "precip": self._current_precip,
+            "hourly": with_icon_names(self._hourly_data),
+            "daily": with_icon_names(self._daily_data),
+        }
+
+    def _restore_snapshot(self, snapshot: dict):
+        """Show a snapshot taken for the current location."""
+        lat, lon = getattr(self, "_lat", None), getattr(self, "_lon", None)
+        if lat is None or snapshot.get("lat") != lat or snapshot.get("lon") != lon:
+            return
+
+        def with_icon_paths(rows):
+            return [
+                dict(row, icon=self._asset_path(row["icon"]) if row["icon"] else "")
+                for row in rows
+            ]
+
+        self._current_temp = snapshot.get("temp", 0.0)
+        self._current_weather_code = snapshot.get("code", 0)
+        self._current_precip = snapshot.get("precip", 0)
+        self._current_icon = self._get_icon_path(self._current_weather_code)
+        self._hourly_data = with_icon_paths(snapshot.get("hourly", []))
+        self._daily_data = with_icon_paths(snapshot.get("daily", []))
+
+    def _asset_path(self, icon_name: str) -> str:
+        return str((self._assets_dir / icon_name).absolute())
+
     def _get_icon_path(self, weather_code: int) -> str:
         """Get full path to weather icon based on weather code."""
         icon_name = self.WEATHER_CODE_TO_ICON.get(weather_code, "overcast.png")
-        icon_path = self._assets_dir / icon_name
-        return str(icon_path.absolute())
+        return self._asset_path(icon_name)
 
     @Property(float, notify=currentTempChanged)
     def currentTemp(self):
@@ -204,6 +258,11 @@ class WeatherBackend(QObject):
     def errorMessage(self):
         return self._error_message
 
+    def cleanup(self):
+        """Stop refreshing; called before the backend is unloaded."""
+        self._fetches.close()
+        self._refresh_timer.stop()
+
     def _set_error(self, message: str):
         self._error_message = message
         self.errorMessageChanged.emit()
@@ -227,16 +286,25 @@ class WeatherBackend(QObject):
         self.isSearchingChanged.emit()
 
     def _on_weather_data_ready(self, data: dict):
+        # Only emit what changed, so a refresh over a restored snapshot
+        # does not rebuild the forecast rows
         current = data.get("current", {})
-        self._current_temp = current.get("temperature_2m", 0.0)
-        self._current_weather_code = current.get("weather_code", 0)
-        self._current_precip = current.get("precipitation_probability", 0)
-        self._current_icon = self._get_icon_path(self._current_weather_code)
-
-        self.currentTempChanged.emit()
-        self.currentWeatherCodeChanged.emit()
-        self.currentPrecipChanged.emit()
-        self.currentIconChanged.emit()
+        temp = current.get("temperature_2m", 0.0)
+        if self._current_temp != temp:
+            self._current_temp = temp
+            self.currentTempChanged.emit()
+
+        code = current.get("weather_code", 0)
+        if self._current_weather_code != code or not self._current_icon:
+            self._current_weather_code = code
+            self._current_icon = self._get_icon_path(code)
+            self.currentWeatherCodeChanged.emit()
+            self.currentIconChanged.emit()
+
+        precip = current.get("precipitation_probability", 0)
+        if self._current_precip != precip:
+            self._current_precip = precip
+            self.currentPrecipChanged.emit()
 
         hourly = data.get("hourly", {})
         times = hourly.get("time", [])
@@ -244,9 +312,9 @@ class WeatherBackend(QObject):
         precips = hourly.get("precipitation_probability", [])
         codes = hourly.get("weather_code", [])
 
-        self._hourly_data = []
+        hourly_data = []
         for i in range(min(self._forecast_hours, len(times))):
-            self._hourly_data.append(
+            hourly_data.append(
                 {
                     "time": times[i],
                     "temp": temps[i] if i < len(temps) else 0,
@@ -254,7 +322,9 @@ class WeatherBackend(QObject):
                     "icon": self._get_icon_path(codes[i]) if i < len(codes) else "",
                 }
             )
-        self.hourlyDataChanged.emit()
+        if self._hourly_data != hourly_data:
+            self._hourly_data = hourly_data
+            self.hourlyDataChanged.emit()
 
         daily = data.get("daily", {})
         d_times = daily.get("time", [])
@@ -263,9 +333,9 @@ class WeatherBackend(QObject):
         d_precips = daily.get("precipitation_probability_max", [])
         d_codes = daily.get("weather_code", [])
 
-        self._daily_data = []
+        daily_data = []
         for i in range(min(self._forecast_hours, len(d_times))):
-            self._daily_data.append(
+            daily_data.append(
                 {
                     "date": d_times[i],
                     "maxTemp": d_max_temps[i] if i < len(d_max_temps) else 0,
@@ -274,7 +344,9 @@ class WeatherBackend(QObject):
                     "icon": self._get_icon_path(d_codes[i]) if i < len(d_codes) else "",
                 }
             )
-        self.dailyDataChanged.emit()
+        if self._daily_data != daily_data:
+            self._daily_data = daily_data
+            self.dailyDataChanged.emit()
 
         self._is_loading = False
         self.isLoadingChanged.emit()
@@ -312,14 +384,14 @@ class WeatherBackend(QObject):
                         }
                     )
 
-                self._searchDataReady.emit(results)
+                self._fetches.emit("_searchDataReady", results)
 
             except urllib.error.URLError as e:
-                self._fetchError.emit(f"Network error: {str(e)}")
+                self._fetches.emit("_fetchError", f"Network error: {str(e)}")
             except json.JSONDecodeError as e:
-                self._fetchError.emit(f"Failed to parse response: {str(e)}")
+                self._fetches.emit("_fetchError", f"Failed to parse response: {str(e)}")
             except Exception as e:
-                self._fetchError.emit(f"Search failed: {str(e)}")
+                self._fetches.emit("_fetchError", f"Search failed: {str(e)}")
 
         Thread(target=fetch, daemon=True).start()
 
@@ -393,13 +465,15 @@ class WeatherBackend(QObject):
                 with urllib.request.urlopen(url, timeout=10) as response:
                     data = json.loads(response.read().decode())
 
-                self._weatherDataReady.emit(data)
+                self._fetches.emit("_weatherDataReady", data)
 
             except urllib.error.URLError as e:
-                self._fetchError.emit(f"Network error: {str(e)}")
+                self._fetches.emit("_fetchError", f"Network error: {str(e)}")
             except json.JSONDecodeError as e:
-                self._fetchError.emit(f"Failed to parse weather data: {str(e)}")
+                self._fetches.emit(
+                    "_fetchError", f"Failed to parse weather data: {str(e)}"
+                )
             except Exception as e:
-                self._fetchError.emit(f"Weather fetch failed: {str(e)}")
+                self._fetches.emit("_fetchError", f"Weather fetch failed: {str(e)}")
 
         Thread(target=fetch, daemon=True).start()
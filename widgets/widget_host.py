@@ -0,0 +1,434 @@
+import copy
+import gc
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    QObject,
+    Property,
+    QTimer,
+    QUrl,
+    Qt,
+    Signal,
+    Slot,
+)
+
+from .registry import create_backend, loaded_config, prepare_backend
+from .snapshots import write_snapshot
+from .startup_trace import tracer
+
+
+# Threads for the file reads and imports of backends created at startup
+PREPARE_WORKERS = 4
+# How often backends' displayable state is written (see snapshots.py)
+SNAPSHOT_INTERVAL_MS = 5 * 60 * 1000
+
+
+def _rss() -> int:
+    """Resident memory of this process in bytes (0 if unavailable)."""
+    try:
+        import psutil
+
+        return psutil.Process(os.getpid()).memory_info().rss
+    except (ImportError, OSError):
+        return 0
+
+
+class WidgetWindowModel(QAbstractListModel):
+    """Rows of qml/Main.qml's Instantiator: one Loader per registered window.
+
+    A row's Loader loads its QML file asynchronously while active is true.
+    """
+
+    NameRole = Qt.UserRole + 1
+    SourceRole = Qt.UserRole + 2
+    ActiveRole = Qt.UserRole + 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[dict] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role in (self.NameRole, Qt.DisplayRole):
+            return row["name"]
+        if role == self.SourceRole:
+            return row["source"]
+        if role == self.ActiveRole:
+            return row["active"]
+        return None
+
+    def roleNames(self):
+        return {
+            self.NameRole: QByteArray(b"name"),
+            self.SourceRole: QByteArray(b"source"),
+            self.ActiveRole: QByteArray(b"active"),
+        }
+
+    def _find(self, name: str):
+        return next((i for i, r in enumerate(self._rows) if r["name"] == name), None)
+
+    def append(self, name: str, source: str):
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append({"name": name, "source": source, "active": False})
+        self.endInsertRows()
+
+    def remove(self, name: str):
+        row = self._find(name)
+        if row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+
+    def set_active(self, name: str, active: bool):
+        row = self._find(name)
+        if row is not None and self._rows[row]["active"] != active:
+            self._rows[row]["active"] = active
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [self.ActiveRole])
+
+
+class WidgetHost(QObject):
+    """Creates widget backends and windows on first show.
+
+    Widgets are registered from their manifests (see registry.py). start()
+    instantiates the ones the layout marks visible; the rest are only
+    created when the Hub first shows them, so hidden widgets cost no worker
+    threads, timers or QML objects. set_enabled() adds and removes widgets
+    at runtime when enabled_widgets.toml changes.
+
+    All windows live in one QML host, qml/Main.qml (context property
+    widgetHost). Instantiating a widget constructs its backend and then
+    activates its row in the model; the row's Loader compiles and creates
+    the window asynchronously and reports back through windowReady().
+    A manifest without visible_property (the Hub) is always loaded.
+
+    With an idle period set, a widget that stays hidden that long is
+    unloaded (window and backend destroyed, settings flushed) and rebuilt
+    on its next show; widgetUnloaded reports the resident memory freed.
+
+    Backends with a snapshot hook have their state written every
+    SNAPSHOT_INTERVAL_MS, before they are unloaded and on quit.
+    """
+
+    # name, bytes of resident memory freed (may be <= 0)
+    widgetUnloaded = Signal(str, int)
+    # name, window; emitted when a widget's window has been created
+    windowLoaded = Signal(str, QObject)
+
+    def __init__(
+        self, engine, hub, qml_dir: Path, settings_backend, services=None, parent=None
+    ):
+        super().__init__(parent)
+        self._engine = engine
+        self._hub = hub
+        self._qml_dir = qml_dir
+        self._settings = settings_backend
+        self._services = services or {}
+        self._widgets: dict[str, dict] = {}
+        self._idle_unload_ms = 0
+        self._model = WidgetWindowModel(self)
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setInterval(SNAPSHOT_INTERVAL_MS)
+        self._snapshot_timer.timeout.connect(self.save_snapshots)
+        self._snapshot_timer.start()
+
+    @Property(QObject, constant=True)
+    def model(self):
+        return self._model
+
+    def register(self, manifest: dict):
+        """Register a widget; it is created by start() or when first shown."""
+        name = manifest["name"]
+        if name in self._widgets:
+            return
+
+        idle_timer = QTimer(self)
+        idle_timer.setSingleShot(True)
+        idle_timer.timeout.connect(lambda: self.unload(name))
+
+        def on_visible_changed(visible):
+            if visible:
+                idle_timer.stop()
+                self.instantiate(name)
+            elif self._idle_unload_ms > 0 and self.is_instantiated(name):
+                idle_timer.start(self._idle_unload_ms)
+
+        if manifest.get("visible_property"):
+            signal = getattr(self._hub, f"{manifest['visible_property']}Changed")
+            signal.connect(on_visible_changed)
+        self._widgets[name] = {
+            "manifest": manifest,
+            "on_visible_changed": on_visible_changed,
+            "idle_timer": idle_timer,
+            "backend": None,
+            "active": False,
+            "root": None,
+            "snapshot": None,
+        }
+        source = QUrl.fromLocalFile(str(self._qml_dir / manifest["qml"]))
+        self._model.append(name, source.toString())
+
+    def unregister(self, name: str):
+        """Destroy the widget's window and backend and forget it."""
+        widget = self._widgets.pop(name, None)
+        if widget is None:
+            return
+        manifest = widget["manifest"]
+        if manifest.get("visible_property"):
+            signal = getattr(self._hub, f"{manifest['visible_property']}Changed")
+            signal.disconnect(widget["on_visible_changed"])
+        widget["idle_timer"].stop()
+        widget["idle_timer"].deleteLater()
+        self._destroy(name, widget)
+        self._model.remove(name)
+        tracer.mark(f"{name} unloaded")
+
+    def set_idle_unload(self, seconds: float):
+        """Unload widgets hidden for this long; 0 keeps them loaded."""
+        self._idle_unload_ms = int(seconds * 1000)
+        for name, widget in self._widgets.items():
+            if self._idle_unload_ms <= 0:
+                widget["idle_timer"].stop()
+            elif self.is_instantiated(name) and not self._is_visible(name):
+                widget["idle_timer"].start(self._idle_unload_ms)
+
+    def unload(self, name: str):
+        """Destroy a hidden widget's window and backend, keeping it registered.
+
+        It is rebuilt by instantiate() the next time the Hub shows it.
+        """
+        widget = self._widgets.get(name)
+        if widget is None or not widget["active"] or self._is_visible(name):
+            return
+        before = _rss()
+
+        def report():
+            gc.collect()
+            reclaimed = before - _rss() if before else 0
+            tracer.mark(f"{name} unloaded after idle ({reclaimed / 1e6:.1f} MB freed)")
+            self.widgetUnloaded.emit(name, reclaimed)
+
+        self._destroy(name, widget, done=report)
+        if self._settings:
+            self._settings.flush()
+
+    def start(self) -> int:
+        """Create every registered widget that is visible now.
+
+        The backends' imports, read-only config reads and preload hooks run
+        together on a thread pool; each widget waits only for its own before its
+        backend is constructed and its QML loaded, in registration order.
+        Returns the number of widgets left for later.
+        """
+        visible = [name for name in self._widgets if self._is_visible(name)]
+        pending = [n for n in visible if self._widgets[n]["manifest"].get("backend")]
+        futures = {}
+        if pending:
+            pool = ThreadPoolExecutor(
+                max_workers=min(PREPARE_WORKERS, len(pending)),
+                thread_name_prefix="backend-prepare",
+            )
+            # Configs loaded already are copied here, on the UI thread
+            futures = {
+                name: pool.submit(self._prepare, name, self._loaded_config(name))
+                for name in pending
+            }
+            pool.shutdown(wait=False)
+
+        for name in visible:
+            prepared = None
+            if name in futures:
+                with tracer.span(f"{name} join", "backend"):
+                    try:
+                        prepared = futures[name].result()
+                    except Exception as e:
+                        print(f"Error preparing {name}: {e}")
+                        continue
+            self.instantiate(name, prepared)
+        return len(self._widgets) - len(visible)
+
+    def set_enabled(self, manifests: list[dict], enabled: dict):
+        """Register newly enabled widgets and unload disabled ones."""
+        for manifest in manifests:
+            name = manifest["name"]
+            if enabled.get(name, True):
+                if name not in self._widgets:
+                    self.register(manifest)
+                    if self._is_visible(name):
+                        self.instantiate(name)
+            elif name in self._widgets:
+                self.unregister(name)
+
+    def is_instantiated(self, name: str) -> bool:
+        widget = self._widgets.get(name)
+        return widget is not None and widget["active"]
+
+    def backend(self, name: str):
+        widget = self._widgets.get(name)
+        return widget["backend"] if widget else None
+
+    def instantiate(self, name: str, prepared=None):
+        """Construct the widget's backend, then start loading its QML (once).
+
+        prepared is the widget's prepare_backend() result if it already ran.
+        """
+        widget = self._widgets[name]
+        if widget["active"]:
+            return
+        manifest = widget["manifest"]
+        if widget["backend"] is None and manifest.get("backend"):
+            with tracer.span(f"{name} backend", "backend"):
+                backend = create_backend(
+                    manifest, self._settings, self._services, prepared
+                )
+            widget["backend"] = backend
+            self._engine.rootContext().setContextProperty(
+                manifest["context_name"], backend
+            )
+            tracer.mark(f"{type(backend).__name__} initialized")
+
+        widget["active"] = True
+        tracer.begin(f"{manifest['qml']} compile", "qml")
+        self._model.set_active(name, True)
+
+    @Slot(str)
+    def windowCompiled(self, name: str):
+        """Called by Main.qml when a widget's component is ready to create."""
+        widget = self._widgets.get(name)
+        if widget is None or not widget["active"]:
+            return
+        qml = widget["manifest"]["qml"]
+        tracer.end(f"{qml} compile", "qml")
+        tracer.begin(f"{qml} create", "qml")
+
+    @Slot(str, QObject)
+    def windowReady(self, name: str, window):
+        """Called by Main.qml when a Loader has created a widget's window."""
+        widget = self._widgets.get(name)
+        if widget is None or not widget["active"]:
+            return
+        qml = widget["manifest"]["qml"]
+        widget["root"] = window
+        tracer.end(f"{qml} create", "qml")
+        tracer.watch_first_frame(window, qml)
+        tracer.mark(f"{qml} loaded")
+        self.windowLoaded.emit(name, window)
+
+    @Slot(str, str)
+    def windowFailed(self, name: str, error: str):
+        widget = self._widgets.get(name)
+        if widget is not None:
+            print(f"Error loading {widget['manifest']['qml']}: {error}")
+
+    def save_snapshots(self, wait: bool = False):
+        """Write the snapshot of every backend whose state changed.
+
+        The states are taken here; the files are written on a thread unless
+        wait is set.
+        """
+        changed = []
+        for name, widget in self._widgets.items():
+            state = self._take_snapshot(widget)
+            if state is not None:
+                changed.append((name, state))
+        if not changed:
+            return
+
+        def write():
+            for name, state in changed:
+                write_snapshot(name, state)
+
+        if wait:
+            write()
+        else:
+            threading.Thread(target=write, name="snapshot-writer", daemon=True).start()
+
+    @Slot()
+    def cleanup(self):
+        """Save snapshots, then run the cleanup hook of every backend created."""
+        self._snapshot_timer.stop()
+        self.save_snapshots(wait=True)
+        for widget in self._widgets.values():
+            self._cleanup_backend(widget["manifest"], widget["backend"])
+
+    def _loaded_config(self, name: str):
+        return loaded_config(self._widgets[name]["manifest"], self._settings)
+
+    def _prepare(self, name: str, config=None):
+        with tracer.span(f"{name} prepare", "backend"):
+            return prepare_backend(
+                self._widgets[name]["manifest"], self._settings, config
+            )
+
+    def _is_visible(self, name: str) -> bool:
+        manifest = self._widgets[name]["manifest"]
+        if not manifest.get("visible_property"):
+            return True
+        return bool(getattr(self._hub, manifest["visible_property"]))
+
+    def _take_snapshot(self, widget):
+        """The backend's state if it differs from the last one written."""
+        hook = widget["manifest"].get("snapshot")
+        if widget["backend"] is None or not hook:
+            return None
+        try:
+            # Copied: hooks may return lists the backend keeps appending to
+            state = copy.deepcopy(getattr(widget["backend"], hook)())
+        except Exception as e:
+            print(f"Error taking {widget['manifest']['name']} snapshot: {e}")
+            return None
+        if state is None or state == widget["snapshot"]:
+            return None
+        widget["snapshot"] = state
+        return state
+
+    def _cleanup_backend(self, manifest, backend):
+        hook = manifest.get("cleanup")
+        if backend is not None and hook:
+            getattr(backend, hook)()
+
+    def _destroy(self, name, widget, done=None):
+        manifest = widget["manifest"]
+        state = self._take_snapshot(widget)
+        if state is not None:
+            write_snapshot(name, state)
+        backend, root = widget["backend"], widget["root"]
+        widget["backend"] = widget["root"] = None
+        widget["active"] = False
+        self._cleanup_backend(manifest, backend)
+
+        def release():
+            # The window's bindings are gone; drop the backend last
+            if backend is not None:
+                self._engine.rootContext().setContextProperty(
+                    manifest["context_name"], None
+                )
+                backend.deleteLater()
+            self._engine.collectGarbage()
+            self._engine.trimComponentCache()
+            if done is not None:
+                # After the deferred deletes have run
+                QTimer.singleShot(0, done)
+
+        if root is not None:
+            # Deactivating the row makes its Loader destroy the window
+            root.destroyed.connect(release)
+            root.setProperty("visible", False)
+            self._model.set_active(name, False)
+        else:
+            self._model.set_active(name, False)
+            release()